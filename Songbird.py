@@ -5,6 +5,23 @@ import sys
 import string  # Added for punctuation stripping
 import re  # Moved from inside function
 import random  # For random sound selection in bindings
+import threading  # Guards shared caches against concurrent action calls
+import bisect  # Maps match offsets in the sound index back to entries
+import time  # Sounds folder change detection
+import concurrent.futures  # Parallel Freesound page fetches
+import queue  # Command queue for the audio thread
+import io  # In-memory file objects for music playback
+import hashlib  # Content IDs for deduplicating sound files
+import sqlite3  # Sound metadata catalog
+import heapq  # Top-k selection in the fuzzy matcher, trigger voice expiry
+import math  # Mixer buffer sizes are powers of two
+import wave  # Silent sound for audio calibration
+import contextlib  # Phase timers
+import importlib  # Deferred imports of pygame, requests and numpy
+from array import array  # Compact trigram postings
+from collections import Counter
+from collections import OrderedDict  # LRU ordering for the search cache
+from collections import deque  # Breadth-first relinking of the phrase automaton
 
 # Set up deps path BEFORE importing pygame and requests
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -12,39 +29,583 @@ deps_path = os.path.join(current_dir, 'deps')
 if deps_path not in sys.path:
     sys.path.insert(0, deps_path)
 
-# NOW import pygame and requests (they'll be found in deps/)
-import pygame
-import requests
+from urllib.parse import urlsplit
+
+# pygame and requests (found in deps/) and numpy take a few hundred ms to import, so they are
+# imported on first use or by the warm-up thread rather than while COVAS loads the plugin.
+# numpy is optional: vectorized scoring for the fuzzy sound matcher (pure Python is used without it)
+pygame = None
+requests = None
+np = None
+multiprocessing = None      # For the ingest worker processes
+songbird_ingest = None      # Transcoding worker (songbird_ingest.py next to this file)
+_lazy_modules = {}          # Module name -> module, or None for a missing optional one
+_lazy_import_lock = threading.Lock()
+
+
+def _lazy_import(name: str, alias: str | None = None, optional: bool = False):
+    """Import a module the first time any thread needs it and bind it to its module-level name"""
+    if name in _lazy_modules:
+        return _lazy_modules[name]
+    with _lazy_import_lock:
+        if name not in _lazy_modules:
+            started = time.perf_counter()
+            try:
+                module = importlib.import_module(name)
+            except ImportError:
+                if not optional:
+                    raise
+                module = None
+            globals()[alias or name] = module
+            _lazy_modules[name] = module
+            log('info', f"SONGBIRD: Imported {name} in {(time.perf_counter() - started) * 1000:.0f} ms"
+                        if module is not None else f"SONGBIRD: {name} not available")
+    return _lazy_modules[name]
 
 from lib.PluginHelper import PluginHelper, PluginManifest
-from lib.PluginSettingDefinitions import PluginSettings, SettingsGrid, TextSetting, ToggleSetting
+from lib.PluginSettingDefinitions import PluginSettings, SettingsGrid, TextSetting, ToggleSetting, NumericalSetting
 from lib.Logger import log
 from lib.EventManager import Projection
 from lib.PluginBase import PluginBase
-from lib.Event import Event
+from lib.Event import Event, ConversationEvent, GameEvent
+
+class ProgressiveSoundBuffer:
+    """Read-only file object over a preview that is still downloading.
+
+    pygame can start decoding from it while the download thread keeps feeding chunks.
+    While the music is being loaded on the audio command thread, reads return only what
+    has arrived - the caller prebuffers the start and the tail first, so that command never
+    waits on the network. Once playback is under way (start_streaming), reads past the
+    data received block until it arrives, the download ends, or the buffer is aborted.
+    The file's tail can be supplied separately, since MP3 decoders look for tags at the
+    end before they start playing.
+    """
+
+    def __init__(self, total_size: int):
+        self.total_size = total_size
+        self._data = bytearray()
+        self._position = 0
+        self._finished = False
+        self._failed = False
+        self._aborted = False
+        self._streaming = False
+        self._tail = b''
+        self._tail_start = total_size
+        self._condition = threading.Condition()
+
+    def feed(self, chunk: bytes):
+        with self._condition:
+            if self._aborted:
+                return
+            self._data.extend(chunk)
+            self._condition.notify_all()
+
+    def feed_tail(self, tail: bytes):
+        """Provide the last bytes of the file ahead of the sequential download"""
+        with self._condition:
+            self._tail = tail
+            self._tail_start = self.total_size - len(tail)
+            self._condition.notify_all()
+
+    def _is_available(self, start: int, end: int) -> bool:
+        return end <= len(self._data) or (self._tail and start >= self._tail_start) or self._finished
+
+    def finish(self):
+        with self._condition:
+            self._finished = True
+            self._condition.notify_all()
+
+    def fail(self):
+        with self._condition:
+            self._failed = True
+            self._finished = True
+            self._condition.notify_all()
+
+    def start_streaming(self):
+        """Playback has started: from now on reads wait for data that hasn't arrived yet"""
+        with self._condition:
+            self._streaming = True
+
+    def abort(self):
+        """Playback was stopped or replaced: wake any waiting read and report EOF from now on"""
+        with self._condition:
+            self._aborted = True
+            self._finished = True
+            self._data = bytearray()
+            self._condition.notify_all()
+
+    @property
+    def failed(self) -> bool:
+        return self._failed
+
+    def wait_for(self, size: int, timeout: float) -> bool:
+        """Wait until size bytes are buffered or the download ends. False if it failed or timed out"""
+        with self._condition:
+            self._condition.wait_for(lambda: len(self._data) >= size or self._finished, timeout)
+            return not self._failed and (len(self._data) >= size or self._finished)
+
+    def read(self, size: int = -1) -> bytes:
+        with self._condition:
+            start = self._position
+            if start >= self.total_size or self._aborted:
+                return b''
+            if size is None or size < 0:
+                end = self.total_size
+            else:
+                end = min(start + size, self.total_size)
+            
+            if self._streaming:
+                # The download thread ends every download with finish() or fail(), so this can't hang
+                self._condition.wait_for(lambda: self._is_available(start, end))
+            if end > len(self._data) and self._tail and start >= self._tail_start:
+                chunk = self._tail[start - self._tail_start:end - self._tail_start]
+            else:
+                # Whatever has arrived - everything asked for, unless the download ended early
+                chunk = bytes(self._data[start:end])
+            self._position += len(chunk)
+            return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        with self._condition:
+            if whence == os.SEEK_CUR:
+                offset += self._position
+            elif whence == os.SEEK_END:
+                # The declared size is known up front, so seeking to the end doesn't wait for the download
+                offset += self.total_size
+            self._position = max(0, min(offset, self.total_size))
+            return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def close(self):
+        pass
+
+
+class PhraseAutomaton:
+    """Word-level Aho-Corasick automaton over the bound phrases.
+
+    Finds every bound phrase in a transcript in one pass, linear in the number of words
+    however many phrases are bound. Adding or removing a phrase only touches that phrase's
+    path through the trie; failure links are relinked lazily before the next match, so a
+    burst of binding changes costs one relink.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._children = [{}]       # Node -> {word: child node}; node 0 is the root
+        self._parent = [None]       # Node -> (parent node, word) for pruning
+        self._phrase = [None]       # Node -> phrase ending here
+        self._depth = [0]           # Node -> words from the root
+        self._fail = [0]            # Node -> longest proper suffix that is also a trie path
+        self._output = [None]       # Node -> nearest node on its failure chain (itself included) ending a phrase
+        self._free = []             # Pruned nodes available for reuse
+        self._dirty = False
+        self.phrases = set()
+
+    def add(self, phrase: str):
+        """Add a normalized phrase"""
+        words = phrase.split()
+        with self._lock:
+            if not words or phrase in self.phrases:
+                return
+            node = 0
+            for word in words:
+                child = self._children[node].get(word)
+                if child is None:
+                    child = self._new_node(node, word)
+                node = child
+            self._phrase[node] = phrase
+            self.phrases.add(phrase)
+            self._dirty = True
+
+    def remove(self, phrase: str):
+        """Remove a phrase, pruning the part of its path no other phrase uses"""
+        with self._lock:
+            if phrase not in self.phrases:
+                return
+            node = 0
+            for word in phrase.split():
+                node = self._children[node][word]
+            self._phrase[node] = None
+            self.phrases.discard(phrase)
+            while node and self._phrase[node] is None and not self._children[node]:
+                parent, word = self._parent[node]
+                del self._children[parent][word]
+                self._free.append(node)
+                node = parent
+            self._dirty = True
+
+    def sync(self, phrases):
+        """Make the automaton hold exactly these phrases, touching only the ones that differ"""
+        phrases = set(phrases)
+        for phrase in self.phrases - phrases:
+            self.remove(phrase)
+        for phrase in phrases - self.phrases:
+            self.add(phrase)
+
+    def find(self, words: list) -> list:
+        """Every occurrence of a phrase in a list of normalized words, as (first word, end word, phrase)"""
+        with self._lock:
+            if self._dirty:
+                self._relink()
+            children, fail, output = self._children, self._fail, self._output
+            matches = []
+            node = 0
+            for index, word in enumerate(words):
+                while node and word not in children[node]:
+                    node = fail[node]
+                node = children[node].get(word, 0)
+                hit = output[node]
+                while hit is not None:
+                    matches.append((index + 1 - self._depth[hit], index + 1, self._phrase[hit]))
+                    hit = output[fail[hit]]
+            return matches
+
+    def _new_node(self, parent: int, word: str) -> int:
+        if self._free:
+            node = self._free.pop()
+            self._children[node] = {}
+            self._parent[node] = (parent, word)
+            self._phrase[node] = None
+            self._depth[node] = self._depth[parent] + 1
+        else:
+            node = len(self._children)
+            self._children.append({})
+            self._parent.append((parent, word))
+            self._phrase.append(None)
+            self._depth.append(self._depth[parent] + 1)
+            self._fail.append(0)
+            self._output.append(None)
+        self._children[parent][word] = node
+        return node
+
+    def _relink(self):
+        """Recompute failure and output links breadth-first (caller holds the lock)"""
+        children, fail, output = self._children, self._fail, self._output
+        output[0] = None
+        pending = deque()
+        for child in children[0].values():
+            fail[child] = 0
+            pending.append(child)
+        while pending:
+            node = pending.popleft()
+            output[node] = node if self._phrase[node] is not None else output[fail[node]]
+            for word, child in children[node].items():
+                suffix = fail[node]
+                while suffix and word not in children[suffix]:
+                    suffix = fail[suffix]
+                fail[child] = children[suffix].get(word, 0)
+                pending.append(child)
+        self._dirty = False
+
+
+class TriggerScheduler:
+    """Admission control for sounds fired automatically (bound phrases, game events, replays).
+
+    Per trigger key, a repeat inside the coalescing window is folded into the play already
+    started and a repeat inside the (per-key) debounce window is dropped. Across all keys a
+    token bucket bounds the trigger rate and a cap bounds how many triggered sounds overlap,
+    so a burst costs a dictionary lookup per trigger instead of a decode and a mixer restart.
+    """
+
+    PLAY = 'play'
+    COALESCED = 'coalesced'
+    DEBOUNCED = 'debounced'
+    RATE_LIMITED = 'rate_limited'
+    VOICE_LIMITED = 'voice_limited'
+
+    def __init__(self, coalesce_seconds: float, debounce_seconds: float, rate_per_second: float,
+                 burst: int, max_voices: int):
+        self.coalesce_seconds = coalesce_seconds
+        self.debounce_seconds = debounce_seconds
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_voices = max_voices
+        self._lock = threading.Lock()
+        self._last_played = {}              # Key -> monotonic time it last played
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._voices = []                   # Heap of monotonic end times of triggered sounds still playing
+
+    def admit(self, key: str, seconds: float, debounce: float | None = None) -> str:
+        """Decide whether a trigger plays; if it does, count it as a voice lasting the given seconds"""
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_played.get(key)
+            if last is not None:
+                elapsed = now - last
+                if elapsed < self.coalesce_seconds:
+                    return self.COALESCED
+                if elapsed < (self.debounce_seconds if debounce is None else debounce):
+                    return self.DEBOUNCED
+            
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate_per_second)
+            self._refilled = now
+            if self._tokens < 1:
+                return self.RATE_LIMITED
+            
+            while self._voices and self._voices[0] <= now:
+                heapq.heappop(self._voices)
+            if len(self._voices) >= self.max_voices:
+                return self.VOICE_LIMITED
+            
+            self._tokens -= 1
+            self._last_played[key] = now
+            heapq.heappush(self._voices, now + seconds)
+            return self.PLAY
+
+    def clear_voices(self):
+        """Forget triggered voices after everything was stopped"""
+        with self._lock:
+            self._voices.clear()
+
 
 # Main plugin class
 class SONGBIRD(PluginBase):
     def __init__(self, plugin_manifest: PluginManifest):
         super().__init__(plugin_manifest)
         
-        # Initialize pygame mixer for audio playback
-        try:
-            pygame.mixer.init()
-            log('info', 'SONGBIRD: pygame mixer initialized')
-        except Exception as e:
-            log('error', f'SONGBIRD: Failed to initialize pygame mixer: {str(e)}')
+        # pygame mixer for audio playback, initialized by the warm-up thread or the first sound (see ensure_mixer)
+        self._mixer_lock = threading.Lock()
+        self._mixer_ready = threading.Event()
+        self._mixer_config = None           # (sample rate, channels, buffer frames) the mixer was started with
+        self._mixer_output = None           # (sample rate, channels) it actually runs at
+        self._warm_up_done = threading.Event()
 
         # Track currently playing sound for binding system
         self.current_playing = None
         self.last_played_description = None
 
-        # Minimal empty settings configuration (required for COVAS NEXT)
+        # Shared keep-alive HTTP session for all Freesound traffic (created on first request)
+        self._http_lock = threading.Lock()
+        self._http_session = None
+        self._http_api_key = None
+        self._http_requests = 0             # Requests sent through the session
+        self._http_new_connections = 0      # TCP+TLS connections opened for them
+
+        # In-memory latency histograms by phase and event counters (see songbird_stats)
+        self._metrics_lock = threading.Lock()
+        self._metrics_timings = {}          # Phase -> histogram dict
+        self._metrics_counters = {}         # Counter name -> value
+        self._metrics_since = time.time()
+        self._metrics_cache_baseline = {}   # Decoded cache counters at the last reset
+
+        # Bounded pool for concurrent Freesound page requests
+        self._search_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.FREESOUND_PAGES, thread_name_prefix='songbird-search'
+        )
+
+        # Freesound result pools by normalized query (LRU order, oldest first)
+        self._search_cache_lock = threading.Lock()
+        self._search_cache = None           # Loaded from search_cache.json on first use
+        self._search_cache_write_lock = threading.Lock()  # Orders snapshots written to disk
+
+        # Background prefetch of further candidates for the current Freesound topic
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='songbird-prefetch')
+        self._prefetch_topic = None         # Normalized query being prefetched for
+        self._prefetch_generation = 0       # Bumped on every new topic; older jobs stop when they see it change
+        self._prefetch_bytes_used = 0       # Bytes prefetched this session (counts against the budget)
+        self._prefetched = None             # Filename -> info for prefetched sounds not yet played (prefetched.json)
+
+        # Disk budget for downloaded sounds: play history in the catalog drives eviction, which runs in the background
+        self.helper = None
+        self._maintenance_lock = threading.Lock()
+        self._maintenance_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='songbird-evict')
+        self._maintenance_pending = False
+        self._evicted_count = 0
+        self._sounds_folder_bytes = None    # Size of the sounds folder at the last maintenance pass
+
+        # SQLite catalog of everything known about each sound file (sound_catalog.db), opened on first use
+        self._catalog_lock = threading.RLock()
+        self._catalog_conn = None
+        self._catalog_text_search = False   # Whether this SQLite has FTS5 for the full-text index
+        self._catalog_depth = 0             # Nesting of catalog_transaction blocks on the thread holding the lock
+
+        # Content index: each distinct sound is stored once; other names for it are aliases
+        self._content_lock = threading.RLock()
+        self._content_index = None          # {'files': filename -> content info, 'aliases': alias -> filename} (loaded from the catalog)
+        self._content_by_id = {}            # Content ID -> canonical filename
+        self._content_indexed_mtime = None  # Sounds folder mtime at the last completed indexing pass
+
+        # Freesound play requests run as background jobs so the action returns immediately
+        self._play_jobs_lock = threading.Lock()
+        self._play_jobs_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='songbird-play')
+        self._play_jobs = OrderedDict()     # Job id -> job dict, oldest first
+        self._next_play_job_id = 1
+
+        # Playback engine: one audio thread owns the mixer and runs commands from a queue.
+        # Voices are only touched on that thread (channel voices layer; there is one music stream)
+        self._voices = OrderedDict()        # Handle -> voice dict, oldest first
+        self._next_voice_handle = 1
+        self._master_volume = 1.0
+        self._audio_commands = queue.SimpleQueue()
+        self._audio_epoch = 0               # Bumped by "stop all" so plays still loading don't start afterwards
+        self._audio_thread = threading.Thread(target=self._audio_loop, name='songbird-audio', daemon=True)
+        self._audio_thread.start()
+        # Decoder thread: decodes and reads sound files for the audio thread, so triggers, prewarming and
+        # mixer restarts never run pygame decoding on several threads at once
+        self._decode_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='songbird-decode')
+        self._decode_lock = threading.Lock()    # Held around every decode and mixer restart
+
+        # Decoded sounds kept in RAM for instant replay (LRU order, oldest first)
+        self._sound_cache_lock = threading.Lock()
+        self._sound_cache = OrderedDict()   # Filepath -> (pygame Sound, decoded bytes, file mtime_ns)
+        self._sound_cache_bytes = 0
+        self._sound_cache_streamed = set()  # Filepaths too long to keep decoded; these use the music stream
+        self._sound_cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+        # Ingest pipeline: MP3/OGG sounds are validated and transcoded to WAV in playback/ by worker processes
+        self._ingest_lock = threading.Lock()
+        self._ingest_executor = None        # Created on first use
+        self._ingest_in_process = False     # True when workers can't be spawned and transcoding runs on a thread
+        self._ingest_pending = set()        # Playback copy names being written
+        self._ingest_failed = set()         # Content IDs that failed validation this session
+        self._playback_copies = None        # Names of the files in playback/ (scanned on first use)
+
+        # Cached catalog of the sounds folder, rescanned only when the folder changes
+        self._sound_catalog_lock = threading.Lock()
+        self._sound_catalog = {}             # Filename -> sound dict (built from catalog rows)
+        self._sound_catalog_list = []        # Sound dicts in discovery order
+        self._sound_catalog_mtime = None     # Folder mtime (ns) at the last scan
+        self._sound_catalog_scanned_at = 0   # Wall-clock time of the last scan
+        self._sound_catalog_version = 0      # Bumped whenever the catalog changes
+        self._sound_catalog_stale = set()    # Filenames whose catalog rows changed since their entries were built
+
+        # In-memory token index over the catalog, updated incrementally as files come and go
+        self._sound_index_lock = threading.Lock()
+        self._sound_index_version = -1      # Catalog version the index reflects
+        self._sound_index_ordinals = {}     # Filename -> ordinal
+        self._sound_index_entries = []      # Ordinal -> sound dict (None once removed)
+        self._sound_index_texts = []        # Ordinal -> searchable name text ('' once removed)
+        self._sound_index_exact = {}        # Normalized name (and digit form) -> ordinals
+        self._sound_index_tokens = {}       # Word (and digit form) -> set of ordinals
+        self._sound_index_names_text = ""   # All normalized names joined by newlines, for substring search
+        self._sound_index_names_offsets = []
+        self._sound_index_files_text = ""   # All lowercase filenames joined by newlines
+        self._sound_index_files_offsets = []
+        self._sound_index_trigrams = {}     # Word-boundary trigram -> array of ordinals (append-only)
+        self._sound_index_trigram_counts = array('H')  # Ordinal -> number of distinct trigrams
+        self._sound_index_dead = array('I') # Removed ordinals (their postings are left in place)
+
+        # Resident copy of bound_sounds.json; changes go to an append-only journal
+        self._bound_lock = threading.RLock()
+        self._bound_sounds = None           # Phrase -> list of sound entries (loaded on first use)
+        self._bound_file_stat = None        # (mtime_ns, size) of bound_sounds.json as last read/written
+        self._bound_journal_records = 0     # Journal records since the last compaction
+        self._phrase_automaton = PhraseAutomaton()  # Bound phrases, kept in step with _bound_sounds
+
+        # Instant phrase triggers
+        self._phrase_trigger_lock = threading.Lock()
+        self._phrase_trigger_events = OrderedDict()  # id(event) -> (event, match); holding the event keeps its id unique
+        self._recent_triggers = {}          # Phrase -> perf_counter when an utterance last fired it
+        self._trigger_scheduler = TriggerScheduler(self.TRIGGER_COALESCE_SECONDS, self.TRIGGER_DEBOUNCE_SECONDS,
+                                                   self.TRIGGER_RATE_PER_SECOND, self.TRIGGER_BURST, self.TRIGGER_MAX_VOICES)
+
+        # Game event bindings (event_bindings.json) and the dispatch table compiled from them
+        self._event_bindings_lock = threading.RLock()
+        self._event_bindings = None         # List of {'event', 'where', 'sounds'} (loaded on first use)
+        self._event_dispatch = {}           # Lowercase event name -> (unconditional binding, {field: {value: [bindings]}})
+
         self.settings_config: PluginSettings | None = PluginSettings(
             key="SONGBIRDPlugin",
             label="SONGBIRD Sound Integration",
             icon="volume_up",
-            grids=[]
+            grids=[
+                SettingsGrid(
+                    key="cache",
+                    label="Sound Cache",
+                    fields=[
+                        NumericalSetting(
+                            key="sounds_budget_mb",
+                            label="Disk space for downloaded sounds (MB, 0 = unlimited)",
+                            type="number",
+                            readonly=False,
+                            placeholder=None,
+                            default_value=self.SOUNDS_BUDGET_MB,
+                            min_value=0,
+                            max_value=100000,
+                            step=50
+                        ),
+                        ToggleSetting(
+                            key="keep_original_downloads",
+                            label="Keep the original MP3/OGG of downloaded sounds next to their fast-playing WAV copy",
+                            type="toggle",
+                            readonly=False,
+                            placeholder=None,
+                            default_value=True
+                        )
+                    ]
+                ),
+                SettingsGrid(
+                    key="audio",
+                    label="Audio Output",
+                    fields=[
+                        NumericalSetting(
+                            key="buffer_size",
+                            label="Mixer buffer (sample frames, power of two) - smaller starts sounds sooner but may crackle",
+                            type="number",
+                            readonly=False,
+                            placeholder=None,
+                            default_value=self.MIXER_BUFFER_FRAMES,
+                            min_value=64,
+                            max_value=8192,
+                            step=64
+                        ),
+                        NumericalSetting(
+                            key="sample_rate",
+                            label="Sample rate (Hz)",
+                            type="number",
+                            readonly=False,
+                            placeholder=None,
+                            default_value=self.MIXER_SAMPLE_RATE,
+                            min_value=22050,
+                            max_value=48000,
+                            step=50
+                        ),
+                        NumericalSetting(
+                            key="channels",
+                            label="Output channels (1 = mono, 2 = stereo)",
+                            type="number",
+                            readonly=False,
+                            placeholder=None,
+                            default_value=self.MIXER_CHANNELS,
+                            min_value=1,
+                            max_value=2,
+                            step=1
+                        )
+                    ]
+                ),
+                SettingsGrid(
+                    key="triggers",
+                    label="Phrase Triggers",
+                    fields=[
+                        ToggleSetting(
+                            key="instant_phrase_triggers",
+                            label="Play bound sounds as soon as you say their phrase",
+                            type="toggle",
+                            readonly=False,
+                            placeholder=None,
+                            default_value=True
+                        ),
+                        ToggleSetting(
+                            key="suppress_reply_on_trigger",
+                            label="Stay silent when a message is only a bound phrase",
+                            type="toggle",
+                            readonly=False,
+                            placeholder=None,
+                            default_value=False
+                        )
+                    ]
+                )
+            ]
         )
     
     def normalize_phrase(self, phrase: str) -> str:
@@ -75,7 +636,292 @@ class SONGBIRD(PluginBase):
                 converted.append(word)
         
         return ' '.join(converted)
+
+    def normalize_sound_name(self, name: str) -> str:
+        """Normalize a sound name for matching: lowercase, hyphens/underscores to spaces, collapse whitespace"""
+        return ' '.join(name.lower().replace('-', ' ').replace('_', ' ').split())
+
+    def update_sound_index(self):
+        """Bring the local sound index in line with the sounds catalog, adding and removing only what changed"""
+        with self._sound_index_lock:
+            with self._sound_catalog_lock:
+                version = self._sound_catalog_version
+                if version == self._sound_index_version:
+                    return
+                catalog = dict(self._sound_catalog)
+
+            # Gone, or rebuilt from an updated catalog row
+            removed = [filename for filename, ordinal in self._sound_index_ordinals.items()
+                       if catalog.get(filename) is not self._sound_index_entries[ordinal]]
+
+            # Start over once most ordinals are dead, otherwise patch in place
+            live = len(self._sound_index_ordinals) - len(removed)
+            if len(removed) > live:
+                self._sound_index_ordinals = {}
+                self._sound_index_entries = []
+                self._sound_index_texts = []
+                self._sound_index_exact = {}
+                self._sound_index_tokens = {}
+                self._sound_index_trigrams = {}
+                self._sound_index_trigram_counts = array('H')
+                self._sound_index_dead = array('I')
+                added = list(catalog.values())
+            else:
+                for filename in removed:
+                    self._index_remove_sound(filename)
+                added = [sound for filename, sound in catalog.items() if filename not in self._sound_index_ordinals]
+
+            for sound in added:
+                self._index_add_sound(sound)
+
+            self._sound_index_names_text, self._sound_index_names_offsets = self._join_index_text(self._sound_index_texts)
+            self._sound_index_files_text, self._sound_index_files_offsets = self._join_index_text(
+                [sound['filename'].lower() if sound else '' for sound in self._sound_index_entries]
+            )
+            self._sound_index_version = version
+            log('info', f"SONGBIRD: Sound index updated (+{len(added)} / -{len(removed)}, {len(self._sound_index_ordinals)} sounds, {len(self._sound_index_tokens)} distinct words)")
+
+    def _index_sound_names(self, sound: dict) -> tuple:
+        """Normalized name of a sound plus its word-number digit form"""
+        normalized = self.normalize_sound_name(sound['readable_name'])
+        # Index the digit form too, so "wrong one.mp3" is found by "wrong 1"
+        return normalized, self.convert_word_numbers_to_digits(normalized)
+
+    def _index_add_sound(self, sound: dict):
+        """Add one sound to the index (caller holds the index lock)"""
+        ordinal = len(self._sound_index_entries)
+        self._sound_index_ordinals[sound['filename']] = ordinal
+        self._sound_index_entries.append(sound)
+
+        normalized, with_digits = self._index_sound_names(sound)
+
+        for name in {normalized, with_digits}:
+            self._sound_index_exact.setdefault(name, []).append(ordinal)
+
+        for word in set(normalized.split()) | set(with_digits.split()):
+            self._sound_index_tokens.setdefault(word, set()).add(ordinal)
+
+        self._sound_index_texts.append(normalized if with_digits == normalized else f"{normalized}\t{with_digits}")
+
+        trigrams = self._name_trigrams(normalized) | self._name_trigrams(with_digits)
+        for trigram in trigrams:
+            postings = self._sound_index_trigrams.get(trigram)
+            if postings is None:
+                postings = self._sound_index_trigrams[trigram] = array('I')
+            postings.append(ordinal)
+        self._sound_index_trigram_counts.append(min(len(trigrams), 0xFFFF))
+
+    def _index_remove_sound(self, filename: str):
+        """Remove one sound from the index (caller holds the index lock)"""
+        ordinal = self._sound_index_ordinals.pop(filename)
+        sound = self._sound_index_entries[ordinal]
+        self._sound_index_entries[ordinal] = None
+        self._sound_index_texts[ordinal] = ''
+        self._sound_index_dead.append(ordinal)
+
+        normalized, with_digits = self._index_sound_names(sound)
+
+        for name in {normalized, with_digits}:
+            ordinals = self._sound_index_exact.get(name, [])
+            if ordinal in ordinals:
+                ordinals.remove(ordinal)
+            if not ordinals:
+                self._sound_index_exact.pop(name, None)
+
+        for word in set(normalized.split()) | set(with_digits.split()):
+            ordinals = self._sound_index_tokens.get(word)
+            if ordinals is not None:
+                ordinals.discard(ordinal)
+                if not ordinals:
+                    del self._sound_index_tokens[word]
+
+    def _join_index_text(self, texts: list) -> tuple:
+        """Join per-sound texts with newlines and record where each one starts"""
+        offsets = []
+        position = 0
+        for text in texts:
+            offsets.append(position)
+            position += len(text) + 1
+        return '\n'.join(texts), offsets
+
+    def _find_in_index_text(self, text: str, offsets: list, words: set):
+        """Return the lowest ordinal whose text contains any of the words, or None.
+
+        Search words never contain whitespace, so a hit can't span two sounds and the
+        first hit in the joined text is always the earliest sound in listing order.
+        """
+        best = None
+        for word in words:
+            position = text.find(word)
+            if position != -1:
+                ordinal = bisect.bisect_right(offsets, position) - 1
+                if best is None or ordinal < best:
+                    best = ordinal
+        return best
+
+    def match_indexed_sound(self, search_normalized: str, passes: tuple = ('exact', 'words', 'partial', 'filename')):
+        """Look up a normalized search term in the sound index.
+
+        Passes run in priority order (exact -> all words -> partial -> filename) and,
+        like the original linear scans, each returns the earliest sound in listing order.
+        Returns a (sound, pass_name) tuple or (None, None).
+        """
+        search_words = set(search_normalized.split())
+
+        with self._sound_index_lock:
+            entries = self._sound_index_entries
+
+            # Exact match on the whole normalized name
+            if 'exact' in passes:
+                ordinals = self._sound_index_exact.get(search_normalized)
+                if ordinals:
+                    return entries[ordinals[0]], 'exact'
+
+            # Word-based matching (all search words present)
+            if 'words' in passes and search_words:
+                postings = [self._sound_index_tokens.get(word) for word in search_words]
+                if all(postings):
+                    postings.sort(key=len)
+                    matches = postings[0].intersection(*postings[1:])
+                    if matches:
+                        return entries[min(matches)], 'words'
+
+            # Partial matching (any search word appears in the sound name)
+            if 'partial' in passes and search_words:
+                ordinal = self._find_in_index_text(self._sound_index_names_text, self._sound_index_names_offsets, search_words)
+                if ordinal is not None:
+                    return entries[ordinal], 'partial'
+
+            # Try matching against original filename too
+            # (a full-term hit implies a single-word hit, so checking the words is enough)
+            if 'filename' in passes and search_words:
+                ordinal = self._find_in_index_text(self._sound_index_files_text, self._sound_index_files_offsets, search_words)
+                if ordinal is not None:
+                    return entries[ordinal], 'filename'
+
+        return None, None
     
+    # Ranked matching: candidates kept after trigram scoring, and the score a local match needs
+    # before it is preferred over searching Freesound
+    MATCH_CANDIDATES = 50
+    MATCH_CONFIDENCE = 0.65
+    # Words that say nothing about which sound is meant
+    MATCH_STOP_WORDS = {'a', 'an', 'the', 'sound', 'sounds', 'effect', 'of', 'some', 'play', 'please'}
+
+    def _name_trigrams(self, text: str) -> set:
+        """Trigrams of each word padded with spaces, so matches respect word boundaries"""
+        trigrams = set()
+        for word in text.split():
+            padded = f" {word} "
+            trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+        return trigrams
+
+    def rank_local_sounds(self, search_normalized: str, k: int = 5) -> list:
+        """Top-k local sounds for a normalized search term as (sound, score) pairs, best first.
+
+        Candidates come from the trigram index (coverage of the search's trigrams plus Jaccard
+        similarity), then are re-scored with the edit distance of the search term against the
+        best-matching part of each name. Scores run from 0 to 1; an exact name match scores 1.
+        """
+        words = [word for word in search_normalized.split() if word not in self.MATCH_STOP_WORDS]
+        query = ' '.join(words) or search_normalized
+        query_trigrams = self._name_trigrams(query)
+        if not query_trigrams:
+            return []
+        # Resolve numpy before taking the index lock - a first import takes tens of milliseconds
+        use_numpy = _lazy_import('numpy', 'np', optional=True) is not None
+        
+        with self._sound_index_lock:
+            exact = self._sound_index_exact.get(search_normalized) or self._sound_index_exact.get(query)
+            if exact:
+                return [(self._sound_index_entries[exact[0]], 1.0)]
+            
+            postings = [self._sound_index_trigrams[trigram] for trigram in query_trigrams if trigram in self._sound_index_trigrams]
+            if not postings:
+                return []
+            
+            if use_numpy:
+                candidates = self._trigram_candidates_numpy(postings, len(query_trigrams))
+            else:
+                candidates = self._trigram_candidates_python(postings, len(query_trigrams))
+            
+            texts = [self._sound_index_texts[ordinal] for ordinal, _ in candidates]
+            entries = [self._sound_index_entries[ordinal] for ordinal, _ in candidates]
+        
+        if use_numpy:
+            distances = self._partial_edit_distances_numpy(query, texts)
+        else:
+            distances = [self._partial_edit_distance(query, text) for text in texts]
+        
+        ranked = []
+        for (ordinal, trigram_score), distance, sound in zip(candidates, distances, entries):
+            edit_score = max(0.0, 1.0 - distance / len(query))
+            ranked.append((sound, round(0.5 * edit_score + 0.5 * trigram_score, 4), -ordinal))
+        
+        # Ties go to the earlier sound in listing order
+        return [(sound, score) for sound, score, _ in heapq.nlargest(k, ranked, key=lambda item: (item[1], item[2]))]
+
+    def _trigram_score(self, shared, query_count, name_count):
+        """Blend of how much of the search is covered and Jaccard similarity (works on arrays too)"""
+        return 0.6 * shared / query_count + 0.4 * shared / (query_count + name_count - shared)
+
+    def _trigram_candidates_numpy(self, postings: list, query_count: int) -> list:
+        """Best MATCH_CANDIDATES (ordinal, trigram score) pairs, scored over every sound at once (caller holds the index lock)"""
+        name_counts = np.frombuffer(self._sound_index_trigram_counts, dtype=np.uint16).astype(np.float32)
+        hits = np.concatenate([np.frombuffer(ordinals, dtype=np.uint32) for ordinals in postings])
+        shared = np.bincount(hits, minlength=len(name_counts)).astype(np.float32)
+        scores = self._trigram_score(shared, query_count, name_counts)
+        if len(self._sound_index_dead):
+            scores[np.frombuffer(self._sound_index_dead, dtype=np.uint32)] = 0
+        
+        count = min(self.MATCH_CANDIDATES, len(scores))
+        top = np.argpartition(-scores, count - 1)[:count]
+        return [(int(ordinal), float(scores[ordinal])) for ordinal in top if scores[ordinal] > 0]
+
+    def _trigram_candidates_python(self, postings: list, query_count: int) -> list:
+        """Best MATCH_CANDIDATES (ordinal, trigram score) pairs, from sounds sharing any trigram (caller holds the index lock)"""
+        shared = Counter()
+        for ordinals in postings:
+            shared.update(ordinals)
+        name_counts = self._sound_index_trigram_counts
+        entries = self._sound_index_entries
+        scored = (
+            (ordinal, self._trigram_score(count, query_count, name_counts[ordinal]))
+            for ordinal, count in shared.items() if entries[ordinal] is not None
+        )
+        return heapq.nlargest(self.MATCH_CANDIDATES, scored, key=lambda item: item[1])
+
+    def _partial_edit_distance(self, query: str, text: str) -> int:
+        """Fewest edits turning query into some substring of text"""
+        previous = [0] * (len(text) + 1)
+        for i, query_char in enumerate(query, 1):
+            current = [i]
+            for j, text_char in enumerate(text, 1):
+                current.append(min(previous[j - 1] + (query_char != text_char), previous[j] + 1, current[j - 1] + 1))
+            previous = current
+        return min(previous)
+
+    def _partial_edit_distances_numpy(self, query: str, texts: list) -> list:
+        """_partial_edit_distance for many texts at once, one vectorized DP row per query character"""
+        if not texts:
+            return []
+        width = max(len(text) for text in texts)
+        # Pad with a code point that never matches
+        grid = np.full((len(texts), width), 0xFFFFFFFF, dtype=np.uint32)
+        for row, text in enumerate(texts):
+            grid[row, :len(text)] = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        
+        columns = np.arange(width + 1, dtype=np.int32)
+        previous = np.zeros((len(texts), width + 1), dtype=np.int32)
+        for i, query_char in enumerate(query, 1):
+            step = np.empty_like(previous)
+            step[:, 0] = i
+            mismatch = (grid != ord(query_char)).astype(np.int32)
+            np.minimum(previous[:, :-1] + mismatch, previous[:, 1:] + 1, out=step[:, 1:])
+            # Insertions chain left to right: current[j] = min over k <= j of step[k] + (j - k)
+            previous = np.minimum.accumulate(step - columns, axis=1) + columns
+        return previous.min(axis=1).tolist()
+
     @override
     def register_actions(self, helper: PluginHelper):
         helper.register_action(
@@ -106,13 +952,17 @@ class SONGBIRD(PluginBase):
 
         helper.register_action(
             'songbird_control', 
-            "Control audio playback with voice commands like stop, pause, resume, volume up/down, or set specific volume levels.", 
+            "Control audio playback with voice commands like stop, pause, resume, volume up/down, or set specific volume levels, or cancel sound requests that are still loading. Applies to all playing sounds, or to one sound when its handle is given.", 
             {
                 "type": "object",
                 "properties": {
                     "voice_command": {
                         "type": "string",
                         "description": "The complete voice command as spoken by the user"
+                    },
+                    "handle": {
+                        "type": "integer",
+                        "description": "Optional handle of a single playing sound (reported when it started). Omit to control all sounds."
                     }
                 },
                 "required": ["voice_command"]
@@ -121,6 +971,66 @@ class SONGBIRD(PluginBase):
             'global'
         )
 
+        helper.register_action(
+            'songbird_job_status', 
+            "Report the progress of Freesound sound requests that are still searching/downloading, and how recent ones finished (played, failed, cancelled or superseded).", 
+            {
+                "type": "object",
+                "properties": {
+                    "job_id": {
+                        "type": "integer",
+                        "description": "Optional request number to report on. Omit to list all recent requests."
+                    }
+                }
+            }, 
+            self.songbird_job_status, 
+            'global'
+        )
+
+        helper.register_action(
+            'songbird_stats', 
+            "Report Songbird's latency per phase (search, download, decode, mixer start...) and its cache/network counters. Use when sounds seem slow.", 
+            {
+                "type": "object",
+                "properties": {
+                    "reset": {
+                        "type": "boolean",
+                        "description": "Clear the statistics after reporting them"
+                    }
+                }
+            }, 
+            self.songbird_stats, 
+            'global'
+        )
+
+        helper.register_action(
+            'songbird_calibrate_audio', 
+            "Estimate how quickly Songbird's sounds start (dispatch time + nominal buffer: the measured time from a play request until the mixer has started it, plus the mixer buffer length) with the current audio output settings, or try other settings for comparison. Use when the user wants to tune sound latency or says sounds lag.", 
+            {
+                "type": "object",
+                "properties": {
+                    "buffer_size": {
+                        "type": "integer",
+                        "description": "Mixer buffer to try, in sample frames (power of two, e.g. 256, 512, 1024)"
+                    },
+                    "sample_rate": {
+                        "type": "integer",
+                        "description": "Sample rate to try (22050, 32000, 44100 or 48000)"
+                    },
+                    "channels": {
+                        "type": "integer",
+                        "description": "Output channels to try (1 or 2)"
+                    },
+                    "rounds": {
+                        "type": "integer",
+                        "description": "Number of timed plays (default 20)"
+                    }
+                }
+            }, 
+            self.songbird_calibrate_audio, 
+            'global'
+        )
+
         helper.register_action(
             'songbird_test', 
             "Test the SONGBIRD plugin functionality.", 
@@ -190,7 +1100,7 @@ class SONGBIRD(PluginBase):
 
         helper.register_action(
             'songbird_list_bound', 
-            "List all sounds that have been bound to command phrases.", 
+            "List all sounds that have been bound to command phrases and game events.", 
             {
                 "type": "object",
                 "properties": {}
@@ -216,6 +1126,58 @@ class SONGBIRD(PluginBase):
             'global'
         )
 
+        helper.register_action(
+            'songbird_bind_event', 
+            "Bind a sound to an Elite Dangerous game event so it plays automatically whenever the event happens, e.g. 'play this when I dock', 'play the klaxon when I'm interdicted'. Use the journal event name (Docked, Undocked, FSDJump, SupercruiseEntry, SupercruiseExit, Interdicted, HullDamage, ShieldState, Died, Touchdown, Liftoff). Binds the last played sound unless a cached sound name is given. Several sounds on the same event play at random.", 
+            {
+                "type": "object",
+                "properties": {
+                    "event": {
+                        "type": "string",
+                        "description": "Journal event name, e.g. 'Docked' or 'FSDJump'"
+                    },
+                    "sound_name": {
+                        "type": "string",
+                        "description": "Cached sound to bind (default: the last played sound)"
+                    },
+                    "where": {
+                        "type": "object",
+                        "description": "Only play when these event fields have these values, e.g. {\"StationType\": \"Coriolis\"} or {\"StarSystem\": \"Sol\"}",
+                        "additionalProperties": {"type": "string"}
+                    },
+                    "cooldown_seconds": {
+                        "type": "number",
+                        "description": "Minimum seconds between plays for frequent events such as HullDamage (default 1.5)"
+                    }
+                },
+                "required": ["event"]
+            }, 
+            self.songbird_bind_event, 
+            'global'
+        )
+
+        helper.register_action(
+            'songbird_unbind_event', 
+            "Stop playing sounds for a game event. Without 'where', removes every binding for the event.", 
+            {
+                "type": "object",
+                "properties": {
+                    "event": {
+                        "type": "string",
+                        "description": "Journal event name, e.g. 'Docked'"
+                    },
+                    "where": {
+                        "type": "object",
+                        "description": "Only remove the binding with exactly these field conditions",
+                        "additionalProperties": {"type": "string"}
+                    }
+                },
+                "required": ["event"]
+            }, 
+            self.songbird_unbind_event, 
+            'global'
+        )
+
         helper.register_action(
             'songbird_unbind_all', 
             "Remove all sound bindings at once.", 
@@ -247,19 +1209,19 @@ class SONGBIRD(PluginBase):
 
     @override
     def register_sideeffects(self, helper: PluginHelper):
-        pass
+        helper.register_sideeffect(self.dispatch_game_event)
         
     @override
     def register_prompt_event_handlers(self, helper: PluginHelper):
-        pass
+        helper.register_prompt_event_handler(self.phrase_trigger_prompt_handler)
         
     @override
     def register_status_generators(self, helper: PluginHelper):
-        pass
+        helper.register_status_generator(self.generate_status)
 
     @override
     def register_should_reply_handlers(self, helper: PluginHelper):
-        pass
+        helper.register_should_reply_handler(self.phrase_trigger_should_reply)
     
     @override
     def on_plugin_helper_ready(self, helper: PluginHelper):
@@ -272,9 +1234,22 @@ class SONGBIRD(PluginBase):
             log('info', f'SONGBIRD: Plugin folder should be: {self.get_plugin_folder_path()}')
         else:
             log('info', f'SONGBIRD: API key loaded from file (length: {len(api_key)} characters)')
+        
+        self.helper = helper
+        
+        # Imports, mixer start-up and bound sound decoding happen off the COVAS start-up path
+        threading.Thread(target=self.warm_up, name='songbird-warmup', daemon=True).start()
+        
+        # Trim the sounds folder if it grew past the budget last session
+        self.schedule_cache_maintenance()
     
     @override
     def on_chat_stop(self, helper: PluginHelper):
+        # Don't leave idle transcoding workers around; queued files are picked up again next chat
+        with self._ingest_lock:
+            executor, self._ingest_executor = self._ingest_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
         log('info', 'SONGBIRD: Chat stopped')
 
     def get_plugin_folder_path(self) -> str:
@@ -293,6 +1268,20 @@ class SONGBIRD(PluginBase):
                 pass
         return ""
 
+    def _write_json_atomic(self, path: str, data, indent: int | None = None) -> bool:
+        """Write JSON to a temp file and rename it into place, so readers never see a half-written file"""
+        temp_file = path + '.tmp'
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=indent, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, path)
+            return True
+        except Exception as e:
+            log('error', f"SONGBIRD: Error writing {os.path.basename(path)}: {str(e)}")
+            return False
+
     def get_api_key_from_file(self) -> str:
         """Read API key from api_key.txt file"""
         try:
@@ -320,22 +1309,160 @@ class SONGBIRD(PluginBase):
             log('error', f'SONGBIRD: Error reading API key file: {str(e)}')
             return ""
 
+    # Upper bounds (ms) of the latency histogram buckets; one more bucket catches anything slower
+    METRICS_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+
+    def record_timing(self, phase: str, seconds: float):
+        """Add one duration to a phase's histogram"""
+        elapsed_ms = seconds * 1000
+        with self._metrics_lock:
+            histogram = self._metrics_timings.get(phase)
+            if histogram is None:
+                histogram = self._metrics_timings[phase] = {
+                    'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'buckets': [0] * (len(self.METRICS_BUCKETS_MS) + 1)
+                }
+            histogram['count'] += 1
+            histogram['total_ms'] += elapsed_ms
+            histogram['max_ms'] = max(histogram['max_ms'], elapsed_ms)
+            histogram['buckets'][bisect.bisect_left(self.METRICS_BUCKETS_MS, elapsed_ms)] += 1
+
+    @contextlib.contextmanager
+    def time_phase(self, phase: str):
+        """Time the enclosed block into a phase's histogram"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_timing(phase, time.perf_counter() - started)
+
+    def count_metric(self, name: str, amount: int = 1):
+        with self._metrics_lock:
+            self._metrics_counters[name] = self._metrics_counters.get(name, 0) + amount
+
+    def _histogram_percentile(self, histogram: dict, percent: float) -> float:
+        """Upper bound of the bucket holding the given percentile (capped at the slowest sample)"""
+        target = histogram['count'] * percent / 100
+        seen = 0
+        for bound, bucket_count in zip(self.METRICS_BUCKETS_MS + (histogram['max_ms'],), histogram['buckets']):
+            seen += bucket_count
+            if seen >= target:
+                return min(bound, histogram['max_ms'])
+        return histogram['max_ms']
+
+    def get_metrics_snapshot(self) -> dict:
+        """Phase latency summaries (ms) and counters, including the decoded sound cache's"""
+        with self._metrics_lock:
+            timings = {
+                phase: {
+                    'count': histogram['count'],
+                    'mean_ms': histogram['total_ms'] / histogram['count'],
+                    'p50_ms': self._histogram_percentile(histogram, 50),
+                    'p95_ms': self._histogram_percentile(histogram, 95),
+                    'p99_ms': self._histogram_percentile(histogram, 99),
+                    'max_ms': histogram['max_ms']
+                }
+                for phase, histogram in self._metrics_timings.items()
+            }
+            counters = dict(self._metrics_counters)
+            since = self._metrics_since
+            baseline = self._metrics_cache_baseline
+        
+        cache_stats = self.get_sound_cache_stats()
+        for name in ('hits', 'misses', 'evictions'):
+            counters[f'decoded_cache.{name}'] = cache_stats[name] - baseline.get(name, 0)
+        return {'since': since, 'timings': timings, 'counters': counters}
+
+    def reset_metrics(self):
+        cache_stats = self.get_sound_cache_stats()
+        with self._metrics_lock:
+            self._metrics_timings = {}
+            self._metrics_counters = {}
+            self._metrics_since = time.time()
+            self._metrics_cache_baseline = cache_stats
+
+    FREESOUND_SEARCH_URL = "https://freesound.org/apiv2/search/text/"
+    # Hosts that get the Freesound API token (previews on the CDN don't need it)
+    FREESOUND_API_HOSTS = ('freesound.org', 'www.freesound.org')
+
+    def _get_http_session(self):
+        """Return the shared HTTP session, creating it with per-host keep-alive pools on first use"""
+        with self._http_lock:
+            if self._http_session is None:
+                _lazy_import('requests')
+                session = requests.Session()
+                # One pool per host (API + preview CDN); enough connections for every concurrent page fetch
+                adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=self.FREESOUND_PAGES + 2)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers.update({
+                    'Accept-Encoding': 'gzip, deflate',
+                    'User-Agent': f"Songbird/{self.plugin_manifest.version}"
+                })
+                session.auth = self._freesound_auth
+                self._http_session = session
+                log('info', 'SONGBIRD: HTTP session created')
+            return self._http_session
+
+    def _freesound_auth(self, request):
+        """Attach the Freesound token to API requests (used as the session's auth hook)"""
+        if self._http_api_key and urlsplit(request.url).hostname in self.FREESOUND_API_HOSTS:
+            request.headers['Authorization'] = f"Token {self._http_api_key}"
+        return request
+
+    def _count_open_connections(self, session) -> int:
+        """Total connections the session's pools have opened so far"""
+        total = 0
+        for adapter in set(session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    total += pool.num_connections
+        return total
+
+    def http_get(self, url: str, api_key: str | None = None, **kwargs):
+        """GET through the shared session, logging whether the request reused a pooled connection"""
+        session = self._get_http_session()
+        if api_key:
+            self._http_api_key = api_key
+        
+        opened_before = self._count_open_connections(session)
+        started = time.perf_counter()
+        response = session.get(url, **kwargs)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        # Approximate under concurrency: connections opened by overlapping requests count here too
+        opened = max(0, self._count_open_connections(session) - opened_before)
+        
+        with self._http_lock:
+            self._http_requests += 1
+            self._http_new_connections += opened
+            requests_sent = self._http_requests
+            reused_total = self._http_requests - self._http_new_connections
+        
+        self.record_timing('http.request', elapsed_ms / 1000)
+        self.count_metric('http.requests')
+        self.count_metric('http.new_connections', opened)
+        if urlsplit(url).hostname in self.FREESOUND_API_HOSTS:
+            self.count_metric('freesound.api_calls')
+        
+        connection_note = 'reused connection' if opened == 0 else f"{opened} new connection(s)"
+        log('info', f"SONGBIRD: GET {urlsplit(url).hostname} -> {response.status_code} in {elapsed_ms:.0f} ms ({connection_note}; {max(0, reused_total)}/{requests_sent} requests reused a connection)")
+        return response
+
     def search_freesound(self, query: str, api_key: str, page: int = 1) -> dict:
         """Search Freesound API for sounds matching the query"""
         try:
-            url = "https://freesound.org/apiv2/search/text/"
-            headers = {
-                "Authorization": f"Token {api_key}"
-            }
+            url = self.FREESOUND_SEARCH_URL
             params = {
                 "query": query,
                 "page": page,
                 "page_size": 15,
-                "fields": "id,name,previews,download,url,username"
+                "fields": "id,name,previews,download,url,username,tags,description,duration,license"
             }
             
             log('info', f"SONGBIRD: Searching Freesound for '{query}' (page {page})")
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            with self.time_phase('freesound.search_page'):
+                response = self.http_get(url, api_key=api_key, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -343,95 +1470,362 @@ class SONGBIRD(PluginBase):
                 log('info', f"SONGBIRD: Found {count} total sounds for '{query}' (page {page})")
                 return data
             elif response.status_code == 401:
+                self.count_metric('freesound.api_errors')
                 log('error', f"SONGBIRD: Invalid API key (401 Unauthorized)")
                 return {"error": "Invalid API key"}
             else:
+                self.count_metric('freesound.api_errors')
                 log('error', f"SONGBIRD: API request failed with status {response.status_code}: {response.text}")
                 return {"error": f"API request failed: {response.status_code}"}
                 
         except Exception as e:
+            self.count_metric('freesound.api_errors')
             log('error', f"SONGBIRD: Search error - {str(e)}")
             return {"error": str(e)}
 
-    def get_varied_freesound_results(self, query: str, api_key: str) -> list:
-        """Get varied results from multiple pages of Freesound"""
+    # Freesound pages fetched per query (15 results each)
+    FREESOUND_PAGES = 5
+    FREESOUND_MAX_RESULTS = 75
+
+    def get_varied_freesound_results(self, query: str, api_key: str, on_complete=None) -> list:
+        """Get varied results from multiple pages of Freesound.
+
+        All pages are requested at once. Without on_complete this waits for every page;
+        with it, it returns as soon as page 1 is in (plus any later pages that already
+        arrived) and calls on_complete(all_results) from a worker thread once the rest land.
+        """
         try:
-            all_results = []
+            futures = [
+                self._search_executor.submit(self.search_freesound, query, api_key, page)
+                for page in range(1, self.FREESOUND_PAGES + 1)
+            ]
             
-            # Search first 5 pages to get more variety
-            for page in range(1, 6):
-                search_results = self.search_freesound(query, api_key, page)
-                
-                if "error" in search_results:
-                    if page == 1:  # If first page fails, return error
-                        return [{"error": search_results["error"]}]
-                    else:  # If later pages fail, just use what we have
-                        break
-                
-                results = search_results.get('results', [])
-                if not results:
-                    break  # No more results
-                
-                all_results.extend(results)
-                
-                # If we have enough results, stop searching
-                if len(all_results) >= 75:
-                    break
+            first_page = futures[0].result()
+            if "error" in first_page:  # If first page fails, return error
+                for future in futures[1:]:
+                    future.cancel()
+                return [{"error": first_page["error"]}]
+            
+            if on_complete is None:
+                concurrent.futures.wait(futures)
+                all_results = self._merge_freesound_pages(futures)
+                log('info', f"SONGBIRD: Collected {len(all_results)} total results from multiple pages")
+                return all_results
+            
+            all_results = self._merge_freesound_pages(futures, ready_only=True)
+            log('info', f"SONGBIRD: Collected {len(all_results)} results from the first page(s), fetching the rest in the background")
+            
+            pending = [future for future in futures if not future.done()]
+            if not pending:
+                on_complete(all_results)
+                return all_results
+            
+            remaining = [len(pending)]
+            remaining_lock = threading.Lock()
+            
+            def page_done(_future):
+                with remaining_lock:
+                    remaining[0] -= 1
+                    if remaining[0]:
+                        return
+                try:
+                    merged = self._merge_freesound_pages(futures)
+                    log('info', f"SONGBIRD: Collected {len(merged)} total results from multiple pages")
+                    on_complete(merged)
+                except Exception as e:
+                    log('error', f"SONGBIRD: Error merging background results: {str(e)}")
+            
+            for future in pending:
+                future.add_done_callback(page_done)
             
-            log('info', f"SONGBIRD: Collected {len(all_results)} total results from multiple pages")
             return all_results
             
         except Exception as e:
             log('error', f"SONGBIRD: Error getting varied results: {str(e)}")
             return [{"error": str(e)}]
 
-    def select_random_sound(self, results: list) -> dict:
-        """Select a random sound from results"""
+    def _merge_freesound_pages(self, futures: list, ready_only: bool = False) -> list:
+        """Concatenate page results in page order, stopping where the serial fetch would have stopped"""
+        all_results = []
+        for future in futures:
+            if ready_only and not future.done():
+                break
+            if future.cancelled():
+                break
+            
+            search_results = future.result()
+            if "error" in search_results:  # If later pages fail, just use what we have
+                break
+            
+            results = search_results.get('results', [])
+            if not results:
+                break  # No more results
+            
+            all_results.extend(results)
+            
+            # If we have enough results, stop
+            if len(all_results) >= self.FREESOUND_MAX_RESULTS:
+                break
+        return all_results
+
+    # Words that ask for a different sound rather than describe one
+    VARIETY_KEYWORDS = ['another', 'different', 'new', 'fresh', 'other']
+
+    # Search result cache: how long a pool stays fresh, how many queries to keep, and whether to keep them across restarts
+    SEARCH_CACHE_TTL = 30 * 60
+    SEARCH_CACHE_MAX_QUERIES = 50
+    SEARCH_CACHE_PERSIST = True
+
+    def normalize_search_query(self, sound_description: str) -> str:
+        """Normalize a sound description into a Freesound query / cache key ("Another explosion!" -> "explosion")"""
+        normalized = self.normalize_phrase(sound_description)
+        words = [word for word in normalized.split() if word not in self.VARIETY_KEYWORDS]
+        return ' '.join(words) if words else normalized
+
+    def get_search_cache_file(self) -> str:
+        """Get path to the persisted Freesound search cache"""
+        plugin_folder = self.get_plugin_folder_path()
+        return os.path.join(plugin_folder, 'search_cache.json')
+
+    def _ensure_search_cache(self) -> OrderedDict:
+        """Return the search cache, loading unexpired entries from disk on first use (caller holds the lock)"""
+        if self._search_cache is not None:
+            return self._search_cache
+        
+        self._search_cache = OrderedDict()
+        cache_file = self.get_search_cache_file()
+        if self.SEARCH_CACHE_PERSIST and os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+                now = time.time()
+                for query, entry in entries.items():
+                    if now - entry.get('fetched_at', 0) < self.SEARCH_CACHE_TTL:
+                        self._search_cache[query] = entry
+                log('info', f"SONGBIRD: Loaded {len(self._search_cache)} cached Freesound searches")
+            except Exception as e:
+                log('error', f"SONGBIRD: Error loading search cache: {str(e)}")
+        return self._search_cache
+
+    def get_cached_search_results(self, query: str):
+        """Cached result pool for a normalized query, or None if missing or expired"""
+        with self._search_cache_lock:
+            cache = self._ensure_search_cache()
+            entry = cache.get(query)
+            if entry is None:
+                return None
+            if time.time() - entry['fetched_at'] >= self.SEARCH_CACHE_TTL:
+                del cache[query]
+                return None
+            cache.move_to_end(query)
+            return entry['results']
+
+    def store_search_results(self, query: str, results: list):
+        """Cache a result pool for a normalized query, evicting the least recently used queries"""
+        if not results:
+            return
+        with self._search_cache_lock:
+            cache = self._ensure_search_cache()
+            cache[query] = {'results': results, 'fetched_at': time.time()}
+            cache.move_to_end(query)
+            while len(cache) > self.SEARCH_CACHE_MAX_QUERIES:
+                cache.popitem(last=False)
+        
+        log('info', f"SONGBIRD: Cached {len(results)} Freesound results for '{query}'")
+        if self.SEARCH_CACHE_PERSIST:
+            with self._search_cache_write_lock:
+                with self._search_cache_lock:
+                    snapshot = dict(self._search_cache)
+                self._write_json_atomic(self.get_search_cache_file(), snapshot)
+
+    def get_freesound_pool(self, sound_description: str, api_key: str) -> list:
+        """Candidate sounds for a description, from the search cache when fresh, otherwise from Freesound"""
+        query = self.normalize_search_query(sound_description)
+        
+        cached = self.get_cached_search_results(query)
+        if cached is not None:
+            self.count_metric('search_cache.hits')
+            log('info', f"SONGBIRD: Using {len(cached)} cached Freesound results for '{query}'")
+            return cached
+        
+        # Select from the first page(s) right away; the full pool is cached once it arrives
+        self.count_metric('search_cache.misses')
+        with self.time_phase('freesound.search'):
+            return self.get_varied_freesound_results(
+                query, api_key, on_complete=lambda results: self.store_search_results(query, results)
+            )
+
+    def get_cached_freesound_ids(self) -> set:
+        """Freesound IDs of sounds already downloaded to the sounds folder"""
+        return {sound['freesound_id'] for sound in self.get_local_sounds() if sound.get('freesound_id')}
+
+    def select_random_sound(self, results: list, exclude_ids: set | None = None) -> dict:
+        """Select a random sound from results, preferring ones whose IDs aren't in exclude_ids"""
         try:
             if not results:
                 return {"error": "No results to select from"}
             
+            # Skip sounds we already have so "another" gives something new
+            candidates = results
+            if exclude_ids:
+                candidates = [result for result in results if str(result.get('id')) not in exclude_ids] or results
+            
             # Randomly select from available results
-            selected = random.choice(results)
+            selected = random.choice(candidates)
             
-            log('info', f"SONGBIRD: Randomly selected '{selected.get('name', 'Unknown')}' from {len(results)} options")
+            log('info', f"SONGBIRD: Randomly selected '{selected.get('name', 'Unknown')}' from {len(candidates)} options ({len(results) - len(candidates)} already cached)")
             return selected
             
         except Exception as e:
             log('error', f"SONGBIRD: Error selecting random sound: {str(e)}")
             return results[0] if results else {"error": "No results available"}
 
-    def download_and_play_sound(self, sound_data: dict) -> str:
-        """Download and play a sound file using pygame"""
+    # Priority list: best quality first
+    PREVIEW_PRIORITY = [
+        ('preview-hq-mp3', '.mp3'),
+        ('preview-lq-mp3', '.mp3'),
+        ('preview-hq-ogg', '.ogg'),
+        ('preview-lq-ogg', '.ogg')
+    ]
+
+    # Previews at least this big start playing once PROGRESSIVE_PREBUFFER_BYTES have arrived
+    PROGRESSIVE_MIN_BYTES = 1024 * 1024
+    PROGRESSIVE_PREBUFFER_BYTES = 256 * 1024
+    PROGRESSIVE_TAIL_BYTES = 16 * 1024
+    PROGRESSIVE_PREBUFFER_TIMEOUT = 30
+    DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+    def get_preview_info(self, sound_data: dict) -> tuple:
+        """Best available preview URL and its file extension (URL is None if there is no preview)"""
+        previews = sound_data.get('previews', {})
+        for preview_key, ext in self.PREVIEW_PRIORITY:
+            if preview_key in previews and previews[preview_key]:
+                return previews[preview_key], ext
+        return None, '.mp3'
+
+    def get_sound_filepath(self, sound_data: dict) -> str:
+        """Path in the sounds folder where a Freesound result is cached"""
+        plugin_folder = self.get_plugin_folder_path()
+        sounds_folder = os.path.join(plugin_folder, 'sounds')
+        
+        # Create filename based on sound info
+        sound_name = sound_data.get('name', 'unknown_sound')
+        sound_id = sound_data.get('id', 'unknown')
+        _, file_extension = self.get_preview_info(sound_data)
+        # Clean filename (remove invalid characters)
+        safe_name = "".join(c for c in sound_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        return self.resolve_sound_path(os.path.join(sounds_folder, f"{safe_name}_{sound_id}{file_extension}"))
+
+    def get_download_folder(self) -> str:
+        """Folder for in-progress downloads, kept outside sounds/ so partial files are never picked up"""
+        plugin_folder = self.get_plugin_folder_path()
+        download_folder = os.path.join(plugin_folder, 'downloads')
+        os.makedirs(download_folder, exist_ok=True)
+        return download_folder
+
+    def _stream_download(self, response, filepath: str, buffer: ProgressiveSoundBuffer | None = None,
+                         should_cancel=None, sound_data: dict | None = None, charge=None):
+        """Stream a response to a temp file, then atomically move it to filepath and catalogue it
+        with what Freesound said about it (sound_data).
+
+        Feeds buffer as chunks arrive. should_cancel is checked between chunks and abandons
+        the download (removing the temp file) when it returns True; so does charge(chunk_bytes)
+        returning False, which lets callers enforce a byte budget. Returns the path the sound
+        ended up at (an existing file if the content was already cached), or None on failure.
+        """
+        temp_path = os.path.join(self.get_download_folder(), os.path.basename(filepath) + '.part')
         try:
-            # Get preview URL - simplified with priority list
-            previews = sound_data.get('previews', {})
-            preview_url = None
-            file_extension = '.mp3'
-            
-            # Priority list: best quality first
-            PREVIEW_PRIORITY = [
-                ('preview-hq-mp3', '.mp3'),
-                ('preview-lq-mp3', '.mp3'),
-                ('preview-hq-ogg', '.ogg'),
-                ('preview-lq-ogg', '.ogg')
-            ]
+            expected = int(response.headers.get('Content-Length') or 0)
+            written = 0
+            hasher = hashlib.sha256()
+            with open(temp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_BYTES):
+                    if should_cancel is not None and should_cancel():
+                        raise IOError("cancelled")
+                    if not chunk:
+                        continue
+                    if charge is not None and not charge(len(chunk)):
+                        raise IOError(f"over the download budget after {written} bytes")
+                    f.write(chunk)
+                    hasher.update(chunk)
+                    written += len(chunk)
+                    if buffer is not None:
+                        buffer.feed(chunk)
+                finalize_started = time.perf_counter()
+                f.flush()
+                os.fsync(f.fileno())
+            
+            if expected and written < expected:
+                raise IOError(f"download truncated ({written} of {expected} bytes)")
+            
+            os.replace(temp_path, filepath)
+            log('info', f"SONGBIRD: Sound saved to {filepath} ({written} bytes)")
+            metadata = self.get_freesound_metadata(sound_data or {})
+            metadata['downloaded'] = time.time()
+            saved_path = self.ingest_sound_file(filepath, hasher.hexdigest(), metadata)
+            # Trim the folder if this took it over budget
+            self.schedule_cache_maintenance()
+            self.record_timing('download.disk_write', time.perf_counter() - finalize_started)
+            self.count_metric('downloads')
+            self.count_metric('download.bytes', written)
+            if buffer is not None:
+                buffer.finish()
+            return saved_path
             
-            for preview_key, ext in PREVIEW_PRIORITY:
-                if preview_key in previews and previews[preview_key]:
-                    preview_url = previews[preview_key]
-                    file_extension = ext
-                    break
+        except Exception as e:
+            self.count_metric('download.failures')
+            log('error', f"SONGBIRD: Download failed for {os.path.basename(filepath)}: {str(e)}")
+            if buffer is not None:
+                buffer.fail()
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return None
+        finally:
+            response.close()
+
+    def _fetch_preview_tail(self, preview_url: str, buffer: ProgressiveSoundBuffer):
+        """Range-request the last bytes of a preview into the buffer (best effort)"""
+        try:
+            tail_size = min(self.PROGRESSIVE_TAIL_BYTES, buffer.total_size)
+            response = self.http_get(preview_url, headers={'Range': f"bytes=-{tail_size}"}, timeout=10, stream=True)
+            try:
+                # Don't read the body unless it really is just the tail
+                if response.status_code == 206:
+                    tail = response.content
+                    if len(tail) == tail_size:
+                        buffer.feed_tail(tail)
+                else:
+                    log('info', f"SONGBIRD: Preview host ignored range request (HTTP {response.status_code})")
+            finally:
+                response.close()
+        except Exception as e:
+            log('warning', f"SONGBIRD: Could not prefetch preview tail: {str(e)}")
+
+    def download_and_play_sound(self, sound_data: dict, should_cancel=None, on_saved=None) -> tuple:
+        """Download and play a sound file using pygame.
+
+        Large previews start playing from memory once the first part has arrived while the
+        rest streams to disk; smaller ones are downloaded fully first. should_cancel is checked
+        until playback starts. on_saved(path) is called once the download has been moved into
+        the sounds folder (path None if it failed), which for large previews can be after this
+        returns. Returns (play job status - 'done', 'failed' or 'cancelled', message).
+        """
+        try:
+            preview_url, file_extension = self.get_preview_info(sound_data)
             
             if not preview_url:
-                return "No preview available for this sound"
+                return 'failed', "No preview available for this sound"
             
             log('info', f"SONGBIRD: Downloading from {preview_url}")
             
             # Download the sound file
-            response = requests.get(preview_url, timeout=30)
+            with self.time_phase('download.request'):
+                response = self.http_get(preview_url, timeout=30, stream=True)
             if response.status_code != 200:
-                return f"Failed to download sound (HTTP {response.status_code})"
+                response.close()
+                return 'failed', f"Failed to download sound (HTTP {response.status_code})"
             
             # Create sounds folder in plugin directory
             plugin_folder = self.get_plugin_folder_path()
@@ -442,67 +1836,116 @@ class SONGBIRD(PluginBase):
                 os.makedirs(sounds_folder)
                 log('info', f"SONGBIRD: Created sounds folder at {sounds_folder}")
             
-            # Create filename based on sound info
             sound_name = sound_data.get('name', 'unknown_sound')
-            sound_id = sound_data.get('id', 'unknown')
-            # Clean filename (remove invalid characters)
-            safe_name = "".join(c for c in sound_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            filename = f"{safe_name}_{sound_id}{file_extension}"
-            filepath = os.path.join(sounds_folder, filename)
+            filepath = self.get_sound_filepath(sound_data)
+            total_size = int(response.headers.get('Content-Length') or 0)
             
-            # Save the file
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
-            
-            log('info', f"SONGBIRD: Sound saved to {filepath}")
+            if total_size >= self.PROGRESSIVE_MIN_BYTES:
+                # Keep downloading in the background and start playback from the buffer
+                buffer = ProgressiveSoundBuffer(total_size)
+                
+                def download():
+                    saved_path = self._stream_download(response, filepath, buffer, should_cancel, sound_data)
+                    if on_saved is not None:
+                        on_saved(saved_path)
+                
+                threading.Thread(target=download, name='songbird-download', daemon=True).start()
+                
+                # Fetch the tail separately so tag lookups at the end of the file don't wait for the whole download
+                self._fetch_preview_tail(preview_url, buffer)
+                
+                # Wait in short slices so a cancelled job frees the worker straight away
+                deadline = time.monotonic() + self.PROGRESSIVE_PREBUFFER_TIMEOUT
+                with self.time_phase('download.prebuffer'):
+                    while not buffer.wait_for(self.PROGRESSIVE_PREBUFFER_BYTES, timeout=0.1):
+                        if should_cancel is not None and should_cancel():
+                            return 'cancelled', f"Cancelled '{sound_name}'"
+                        if buffer.failed or time.monotonic() > deadline:
+                            buffer.abort()
+                            return 'failed', f"Failed to download '{sound_name}'"
+                
+                playback_source = buffer
+                log('info', f"SONGBIRD: Starting playback of {total_size} byte preview after buffering {self.PROGRESSIVE_PREBUFFER_BYTES} bytes")
+            else:
+                with self.time_phase('download.transfer'):
+                    saved_path = self._stream_download(response, filepath, should_cancel=should_cancel, sound_data=sound_data)
+                if not saved_path:
+                    if should_cancel is not None and should_cancel():
+                        return 'cancelled', f"Cancelled '{sound_name}'"
+                    return 'failed', f"Failed to download '{sound_name}'"
+                if on_saved is not None:
+                    on_saved(saved_path)
+                filepath = playback_source = saved_path
+            
+            if should_cancel is not None and should_cancel():
+                return 'cancelled', f"Cancelled '{sound_name}'"
             
             # Play the sound using pygame (invisible playback)
             try:
-                pygame.mixer.music.load(filepath)
-                pygame.mixer.music.play()
+                with self.time_phase('playback.start'):
+                    if playback_source is filepath:
+                        handle = self.play_sound_file(filepath, sound_name).result(self.AUDIO_COMMAND_TIMEOUT)
+                    else:
+                        handle = self.play_music(playback_source, file_extension.lstrip('.'), sound_name).result(self.AUDIO_COMMAND_TIMEOUT)
+                if handle is None:
+                    return 'done', f"Stopped before '{sound_name}' started"
                 
-                log('info', f"SONGBIRD: Playing sound invisibly: {sound_name}")
-                return f"Playing '{sound_name}'"
+                log('info', f"SONGBIRD: Playing sound invisibly: {sound_name} (handle {handle})")
+                return 'done', f"Playing '{sound_name}' (handle {handle})"
                 
             except Exception as play_error:
                 log('error', f"SONGBIRD: Error playing sound with pygame: {str(play_error)}")
-                return f"Downloaded '{sound_name}' to sounds folder but failed to play: {str(play_error)}"
+                return 'failed', f"Downloaded '{sound_name}' to sounds folder but failed to play: {str(play_error)}"
                     
         except Exception as e:
             log('error', f"SONGBIRD: Error in download_and_play_sound: {str(e)}")
-            return f"Error downloading/playing sound: {str(e)}"
+            return 'failed', f"Error downloading/playing sound: {str(e)}"
 
     def songbird_control(self, args, projected_states) -> str:
         """Handle voice commands for audio playback control"""
         try:
             voice_command = args.get('voice_command', '').lower().strip()
+            handle = args.get('handle')
+            target = f"sound {handle}" if handle is not None else "Audio"
+            
+            log('info', f"SONGBIRD: Voice command received: '{voice_command}'" + (f" (handle {handle})" if handle is not None else ""))
             
-            log('info', f"SONGBIRD: Voice command received: '{voice_command}'")
+            # Cancel sound requests that haven't started playing yet
+            if 'cancel' in voice_command:
+                cancelled = self.cancel_play_jobs()
+                return f"SONGBIRD: Cancelled {cancelled} pending sound request(s)"
+            
+            timeout = self.AUDIO_COMMAND_TIMEOUT
+            if handle is not None and self.get_playback_volume(handle).result(timeout) is None:
+                return f"SONGBIRD: No sound is playing with handle {handle}"
             
             # Stop commands
             if any(word in voice_command for word in ['stop', 'halt', 'end']):
-                pygame.mixer.music.stop()
-                return "SONGBIRD: Audio stopped"
+                if handle is None:
+                    # Don't let a search that's still running start playing after "stop"
+                    self.cancel_play_jobs()
+                self.stop_voices(handle).result(timeout)
+                return f"SONGBIRD: {target} stopped"
                 
             # Pause commands  
             elif any(word in voice_command for word in ['pause', 'hold']):
-                pygame.mixer.music.pause()
-                return "SONGBIRD: Audio paused"
+                self.pause_voices(True, handle).result(timeout)
+                return f"SONGBIRD: {target} paused"
                 
             # Resume commands
             elif any(word in voice_command for word in ['resume', 'continue', 'unpause', 'play']):
-                pygame.mixer.music.unpause()
-                return "SONGBIRD: Audio resumed"
+                self.pause_voices(False, handle).result(timeout)
+                return f"SONGBIRD: {target} resumed"
+                
+            # Unmute commands (checked before mute, which it contains)
+            elif 'unmute' in voice_command:
+                self.set_playback_volume(0.7, handle).result(timeout)
+                return f"SONGBIRD: {target} unmuted"
                 
             # Mute commands
             elif 'mute' in voice_command:
-                pygame.mixer.music.set_volume(0.0)
-                return "SONGBIRD: Audio muted"
-                
-            # Unmute commands
-            elif 'unmute' in voice_command:
-                pygame.mixer.music.set_volume(0.7)
-                return "SONGBIRD: Audio unmuted"
+                self.set_playback_volume(0.0, handle).result(timeout)
+                return f"SONGBIRD: {target} muted"
                 
             # Volume commands
             elif 'volume' in voice_command:
@@ -510,15 +1953,15 @@ class SONGBIRD(PluginBase):
                 numbers = re.findall(r'\d+', voice_command)
                 
                 if 'up' in voice_command or 'increase' in voice_command or 'higher' in voice_command:
-                    current_volume = pygame.mixer.music.get_volume()
+                    current_volume = self.get_playback_volume(handle).result(timeout)
                     new_volume = min(1.0, current_volume + 0.1)
-                    pygame.mixer.music.set_volume(new_volume)
+                    self.set_playback_volume(new_volume, handle).result(timeout)
                     return f"SONGBIRD: Volume increased to {int(new_volume * 100)}%"
                     
                 elif 'down' in voice_command or 'decrease' in voice_command or 'lower' in voice_command:
-                    current_volume = pygame.mixer.music.get_volume()
+                    current_volume = self.get_playback_volume(handle).result(timeout)
                     new_volume = max(0.0, current_volume - 0.1)
-                    pygame.mixer.music.set_volume(new_volume)
+                    self.set_playback_volume(new_volume, handle).result(timeout)
                     return f"SONGBIRD: Volume decreased to {int(new_volume * 100)}%"
                     
                 elif numbers:
@@ -526,7 +1969,7 @@ class SONGBIRD(PluginBase):
                     try:
                         target_volume = int(numbers[0])
                         pygame_volume = max(0.0, min(1.0, target_volume / 100.0))
-                        pygame.mixer.music.set_volume(pygame_volume)
+                        self.set_playback_volume(pygame_volume, handle).result(timeout)
                         return f"SONGBIRD: Volume set to {int(pygame_volume * 100)}%"
                     except (ValueError, IndexError):
                         pass
@@ -535,7 +1978,7 @@ class SONGBIRD(PluginBase):
                 return "SONGBIRD: Volume command unclear. Try 'volume up', 'volume down', or 'volume to 50%'"
                 
             else:
-                return f"SONGBIRD: Command '{voice_command}' not recognized. Available: stop, pause, resume, volume up/down/to X%, mute, unmute"
+                return f"SONGBIRD: Command '{voice_command}' not recognized. Available: stop, pause, resume, volume up/down/to X%, mute, unmute, cancel"
                 
         except Exception as e:
             log('error', f"SONGBIRD control error: {str(e)}")
@@ -552,18 +1995,13 @@ class SONGBIRD(PluginBase):
         # Auto-detect from description
         description_lower = sound_description.lower()
         
-        # Words that indicate wanting a new/different sound
-        freesound_keywords = [
-            'another', 'different', 'new', 'fresh', 'other'
-        ]
-        
         # Words that indicate replay request
         replay_keywords = [
             'again', 'same', 'repeat', 'replay', 'once more', 'it'
         ]
         
         # Check for explicit indicators
-        for keyword in freesound_keywords:
+        for keyword in self.VARIETY_KEYWORDS:
             if keyword in description_lower:
                 log('info', f"SONGBIRD: Detected Freesound keyword '{keyword}'")
                 return True
@@ -577,44 +2015,119 @@ class SONGBIRD(PluginBase):
         return False
 
     def get_local_sounds(self) -> list:
-        """Get list of locally cached sound files"""
+        """Get list of locally cached sound files, described by their catalog rows.
+
+        The folder is only relisted when its modification time changes, so files
+        dropped in while COVAS is running are picked up on the next call.
+        """
         try:
             plugin_folder = self.get_plugin_folder_path()
             sounds_folder = os.path.join(plugin_folder, 'sounds')
             
-            if not os.path.exists(sounds_folder):
+            try:
+                folder_mtime = os.stat(sounds_folder).st_mtime_ns
+            except FileNotFoundError:
+                folder_mtime = None
+            
+            with self._sound_catalog_lock:
+                # Trust the cached listing unless the folder changed, or changed so close
+                # to the last scan that a same-tick write could have been missed
+                settled = self._sound_catalog_scanned_at - (folder_mtime or 0) / 1e9 > 2.0
+                if folder_mtime == self._sound_catalog_mtime and settled:
+                    return self._sound_catalog_list
+                stale = self._sound_catalog_stale
+                self._sound_catalog_stale = set()
+            
+            if folder_mtime is None:
+                self._replace_sound_catalog({}, None)
                 return []
             
-            sound_files = []
-            supported_extensions = ['.mp3', '.ogg', '.wav']
-            
-            for filename in os.listdir(sounds_folder):
-                if any(filename.lower().endswith(ext) for ext in supported_extensions):
-                    filepath = os.path.join(sounds_folder, filename)
-                    # Remove extension first
-                    name_without_ext = os.path.splitext(filename)[0]
+            scanned_at = time.time()
+            supported_extensions = ('.mp3', '.ogg', '.wav')
+            previous = self._sound_catalog
+            catalog = {}
+            new = []
+            
+            with os.scandir(sounds_folder) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if not filename.lower().endswith(supported_extensions) or not entry.is_file():
+                        continue
                     
-                    # Check if this is a Freesound file (ends with underscore + numbers)
-                    name_parts = name_without_ext.rsplit('_', 1)
-                    if len(name_parts) == 2 and name_parts[1].isdigit():
-                        # Freesound format: soundname_12345
-                        readable_name = name_parts[0].replace('_', ' ')
+                    # Reuse entries for files we already know about
+                    known = previous.get(filename)
+                    if known is not None and filename not in stale and known['filepath'] == entry.path:
+                        catalog[filename] = known
                     else:
-                        # User file: use full filename without extension
-                        readable_name = name_without_ext.replace('_', ' ')
-                    
-                    sound_files.append({
-                        'filename': filename,
-                        'filepath': filepath,
-                        'readable_name': readable_name
-                    })
-            
-            return sound_files
+                        new.append(filename)
+            
+            if new:
+                rows = self.get_catalog_rows(new)
+                uncatalogued = [filename for filename in new if filename not in rows]
+                if uncatalogued:
+                    # Dropped in by hand: named after the file for now, hashed and probed by the background scan
+                    rows.update(self._catalog_new_files(uncatalogued))
+                for filename in new:
+                    catalog[filename] = self._make_sound_entry(sounds_folder, rows[filename])
+            
+            # Other names of deduplicated sounds match just like files
+            for alias, target in self.get_sound_aliases().items():
+                if target not in catalog or alias in catalog:
+                    continue
+                entry = previous.get(alias)
+                if entry is None or entry['filepath'] != catalog[target]['filepath']:
+                    entry = self._make_alias_entry(catalog[target], alias)
+                catalog[alias] = entry
+            
+            self._replace_sound_catalog(catalog, folder_mtime, scanned_at)
+            return self._sound_catalog_list
             
         except Exception as e:
             log('error', f"SONGBIRD: Error getting local sounds: {str(e)}")
             return []
 
+    def _make_sound_entry(self, sounds_folder: str, row) -> dict:
+        """Build the in-memory entry for one sound file from its catalog row"""
+        return {
+            'filename': row['filename'],
+            'filepath': os.path.join(sounds_folder, row['filename']),
+            'readable_name': row['readable_name'],
+            'freesound_id': row['freesound_id'],
+            'username': row['username']
+        }
+
+    def _make_alias_entry(self, sound: dict, alias: str) -> dict:
+        """Entry for another name of a stored sound - matched by that name, played from the stored file"""
+        readable_name, freesound_id = self._readable_name_from_filename(alias)
+        return dict(sound, filename=alias, readable_name=readable_name, freesound_id=freesound_id)
+
+    def _replace_sound_catalog(self, catalog: dict, folder_mtime, scanned_at: float = 0):
+        """Swap in a freshly scanned catalog, keeping the known order and bumping the version on change"""
+        with self._sound_catalog_lock:
+            previous = self._sound_catalog
+            changed = catalog.keys() != previous.keys() or any(sound is not previous[filename] for filename, sound in catalog.items())
+            if changed:
+                # Entries rebuilt from updated rows keep their place
+                kept = [catalog[sound['filename']] for sound in self._sound_catalog_list if sound['filename'] in catalog]
+                new = [sound for filename, sound in catalog.items() if filename not in previous]
+                removed_count = len(previous) - len(kept)
+                self._sound_catalog = catalog
+                self._sound_catalog_list = kept + new
+                self._sound_catalog_version += 1
+                log('info', f"SONGBIRD: Sounds folder changed (+{len(new)} / -{removed_count}), {len(catalog)} sounds cached")
+            self._sound_catalog_mtime = folder_mtime
+            self._sound_catalog_scanned_at = scanned_at
+        if changed:
+            # Hash any new files in the background
+            self.schedule_cache_maintenance()
+
+    def invalidate_sound_catalog(self, filenames=()):
+        """Force the next get_local_sounds to rescan (for changes that don't touch the folder, like aliases),
+        rebuilding the entries of any filenames given from their catalog rows"""
+        with self._sound_catalog_lock:
+            self._sound_catalog_mtime = None
+            self._sound_catalog_stale.update(filenames)
+
     def find_local_sound(self, search_term: str):
         """Find a local sound file that matches the search term - IMPROVED VERSION with number conversion"""
         try:
@@ -634,47 +2147,1591 @@ class SONGBIRD(PluginBase):
             search_with_digits = self.convert_word_numbers_to_digits(search_lower)
             
             # Normalize search term: remove hyphens, underscores, extra spaces
-            search_normalized = search_with_digits.replace('-', ' ').replace('_', ' ')
-            search_words = set(search_normalized.split())
+            search_normalized = self.normalize_sound_name(search_with_digits)
             
             log('info', f"SONGBIRD: Searching for '{search_lower}' (normalized: '{search_normalized}') among {len(sound_files)} local sounds")
             
-            # Try exact match first (with normalization)
-            for sound in sound_files:
-                sound_normalized = sound['readable_name'].lower().replace('-', ' ').replace('_', ' ')
-                if search_normalized == sound_normalized:
-                    log('info', f"SONGBIRD: Exact match found: {sound['readable_name']}")
-                    return sound
-            
-            # Try word-based matching (all search words present)
-            for sound in sound_files:
-                sound_normalized = sound['readable_name'].lower().replace('-', ' ').replace('_', ' ')
-                sound_words = set(sound_normalized.split())
-                if search_words.issubset(sound_words):
-                    log('info', f"SONGBIRD: Word match found: {sound['readable_name']}")
-                    return sound
+            self.update_sound_index()
+            ranked = self.rank_local_sounds(search_normalized)
             
-            # Try partial matching (any search word matches)
-            for sound in sound_files:
-                sound_normalized = sound['readable_name'].lower().replace('-', ' ').replace('_', ' ')
-                if any(word in sound_normalized for word in search_words):
-                    log('info', f"SONGBIRD: Partial match found: {sound['readable_name']}")
+            if ranked:
+                summary = ', '.join(f"{sound['readable_name']} ({score:.2f})" for sound, score in ranked[:3])
+                log('info', f"SONGBIRD: Best local matches: {summary}")
+                sound, score = ranked[0]
+                if score >= self.MATCH_CONFIDENCE:
+                    log('info', f"SONGBIRD: Match found: {sound['readable_name']} ({sound['filename']}, score {score:.2f})")
                     return sound
             
-            # Try matching against original filename too
-            for sound in sound_files:
-                filename_lower = sound['filename'].lower()
-                if search_normalized in filename_lower or any(word in filename_lower for word in search_words):
-                    log('info', f"SONGBIRD: Filename match found: {sound['filename']}")
-                    return sound
+            # Names don't match - what Freesound said about the sounds might ("laser" finds a file tagged laser)
+            sound = self.search_sound_text(search_normalized)
+            if sound is not None:
+                self.count_metric('local_lookup.text_hits')
+                log('info', f"SONGBIRD: Match found by tags/description: {sound['readable_name']} ({sound['filename']})")
+                return sound
             
-            log('info', f"SONGBIRD: No local sound found matching '{search_lower}'")
+            log('info', f"SONGBIRD: No local sound found matching '{search_lower}' with enough confidence")
             return None
                 
         except Exception as e:
             log('error', f"SONGBIRD: Error finding local sound: {str(e)}")
             return None
 
+    def search_sound_text(self, search_normalized: str):
+        """Best cached sound whose name, Freesound tags or description hold every search word (stemmed,
+        so "lasers" finds "laser"), from the catalog's full-text index. Returns its entry or None."""
+        words = [word for word in re.findall(r'\w+', search_normalized) if word not in self.MATCH_STOP_WORDS]
+        if not words:
+            return None
+        # Quoted, so words like "or" and "near" aren't read as query syntax
+        query = ' AND '.join(f'"{word}"' for word in words)
+        
+        with self._catalog_lock:
+            db = self._catalog_db()
+            if not self._catalog_text_search:
+                return None
+            rows = db.execute(
+                "SELECT sounds.filename FROM sounds_text JOIN sounds ON sounds.rowid = sounds_text.rowid "
+                f"WHERE sounds_text MATCH ? ORDER BY bm25(sounds_text, {', '.join(map(str, self.TEXT_SEARCH_WEIGHTS))}) LIMIT ?",
+                (query, self.TEXT_SEARCH_CANDIDATES)
+            ).fetchall()
+        
+        with self._sound_catalog_lock:
+            catalog = self._sound_catalog
+        for row in rows:
+            # Skips rows for files that have gone but aren't forgotten yet
+            sound = catalog.get(row['filename'])
+            if sound is not None:
+                return sound
+        return None
+
+    # Prefetch: candidates kept ready per topic, and limits on what a session may download ahead
+    PREFETCH_COUNT = 2
+    PREFETCH_MAX_FILE_BYTES = 5 * 1024 * 1024
+    PREFETCH_BUDGET_BYTES = 50 * 1024 * 1024
+
+    def get_prefetch_file(self) -> str:
+        """Get path to the list of prefetched sounds that haven't been played yet"""
+        plugin_folder = self.get_plugin_folder_path()
+        return os.path.join(plugin_folder, 'prefetched.json')
+
+    def _ensure_prefetched(self) -> dict:
+        """Prefetched-but-unplayed sounds, loaded on first use and pruned of deleted files (caller holds the lock)"""
+        if self._prefetched is None:
+            self._prefetched = {}
+            prefetch_file = self.get_prefetch_file()
+            if os.path.exists(prefetch_file):
+                try:
+                    with open(prefetch_file, 'r', encoding='utf-8') as f:
+                        self._prefetched = json.load(f)
+                except Exception as e:
+                    log('error', f"SONGBIRD: Error loading prefetched sounds: {str(e)}")
+            self._prefetched = {name: info for name, info in self._prefetched.items() if os.path.exists(info['filepath'])}
+        return self._prefetched
+
+    def get_prefetched_filenames(self) -> set:
+        """Filenames of prefetched sounds the user hasn't heard yet"""
+        with self._prefetch_lock:
+            return set(self._ensure_prefetched())
+
+    def mark_sound_played(self, filepath: str):
+        """Record that a sound was played, so a prefetched file becomes an ordinary cached sound"""
+        filename = os.path.basename(filepath)
+        self.record_sound_play(filename)
+        with self._prefetch_lock:
+            prefetched = self._ensure_prefetched()
+            if filename not in prefetched:
+                return
+            del prefetched[filename]
+            snapshot = dict(prefetched)
+        self._write_json_atomic(self.get_prefetch_file(), snapshot)
+
+    def take_prefetched_sound(self, query: str):
+        """A prefetched, still unplayed sound for this query, or None"""
+        with self._prefetch_lock:
+            for info in self._ensure_prefetched().values():
+                if info['query'] == query and os.path.exists(info['filepath']):
+                    return dict(info)
+        return None
+
+    def schedule_prefetch(self, query: str, pool: list):
+        """Download more candidates for query in the background, cancelling prefetch for any previous topic"""
+        with self._prefetch_lock:
+            if query != self._prefetch_topic:
+                self._prefetch_topic = query
+                self._prefetch_generation += 1
+            generation = self._prefetch_generation
+        self._prefetch_executor.submit(self._prefetch_worker, query, pool, generation)
+
+    def _prefetch_worker(self, query: str, pool: list, generation: int):
+        """Fill the prefetch slots for query until they're full, the budget runs out, or the topic changes"""
+        def cancelled():
+            return self._prefetch_generation != generation
+        
+        try:
+            with self._prefetch_lock:
+                ready = sum(1 for info in self._ensure_prefetched().values() if info['query'] == query)
+            
+            attempts = 0
+            while ready < self.PREFETCH_COUNT and attempts < self.PREFETCH_COUNT * 2 and not cancelled():
+                attempts += 1
+                
+                # The full pool usually lands in the search cache shortly after the first play
+                candidates = self.get_cached_search_results(query) or pool
+                exclude_ids = self.get_cached_freesound_ids()
+                fresh = [result for result in candidates if str(result.get('id')) not in exclude_ids]
+                if not fresh:
+                    return
+                
+                sound_data = random.choice(fresh)
+                filepath = self.download_sound(sound_data, should_cancel=cancelled)
+                if filepath is None:
+                    continue
+                
+                with self._prefetch_lock:
+                    prefetched = self._ensure_prefetched()
+                    prefetched[os.path.basename(filepath)] = {
+                        'query': query,
+                        'filepath': filepath,
+                        'sound_name': sound_data.get('name', 'Unknown'),
+                        'username': sound_data.get('username', 'Unknown'),
+                        'sound_data': sound_data
+                    }
+                    snapshot = dict(prefetched)
+                self._write_json_atomic(self.get_prefetch_file(), snapshot)
+                ready += 1
+                log('info', f"SONGBIRD: Prefetched '{sound_data.get('name', 'Unknown')}' for '{query}' ({ready}/{self.PREFETCH_COUNT})")
+                
+        except Exception as e:
+            log('error', f"SONGBIRD: Prefetch error: {str(e)}")
+
+    def download_sound(self, sound_data: dict, should_cancel=None):
+        """Download a preview into the sounds folder without playing it, within the prefetch budget.
+        Returns the file path, or None if skipped, cancelled or failed."""
+        preview_url, _ = self.get_preview_info(sound_data)
+        if not preview_url:
+            return None
+        
+        filepath = self.get_sound_filepath(sound_data)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        
+        response = self.http_get(preview_url, timeout=30, stream=True)
+        if response.status_code != 200:
+            response.close()
+            return None
+        
+        # Skip what is known to be too big up front; the bytes themselves are charged as they stream,
+        # so previews without a Content-Length are held to the same limits
+        size = int(response.headers.get('Content-Length') or 0)
+        with self._prefetch_lock:
+            over_budget = self._prefetch_bytes_used + size > self.PREFETCH_BUDGET_BYTES
+        if size > self.PREFETCH_MAX_FILE_BYTES or over_budget:
+            response.close()
+            log('info', f"SONGBIRD: Skipping prefetch of {size} byte preview (budget {self._prefetch_bytes_used}/{self.PREFETCH_BUDGET_BYTES} bytes used)")
+            return None
+        
+        streamed = [0]
+        
+        def charge(chunk_bytes: int) -> bool:
+            with self._prefetch_lock:
+                if (streamed[0] + chunk_bytes > self.PREFETCH_MAX_FILE_BYTES
+                        or self._prefetch_bytes_used + chunk_bytes > self.PREFETCH_BUDGET_BYTES):
+                    return False
+                streamed[0] += chunk_bytes
+                self._prefetch_bytes_used += chunk_bytes
+                return True
+        
+        saved_path = self._stream_download(response, filepath, should_cancel=should_cancel, sound_data=sound_data, charge=charge)
+        if saved_path != filepath:
+            # Failed, or turned out to be a sound we already had
+            return None
+        return filepath
+
+    # Sound metadata catalog (sound_catalog.db). One row per stored file; aliases name the same content.
+    # Bump CATALOG_SCHEMA_VERSION and extend _upgrade_catalog when the schema changes.
+    CATALOG_SCHEMA_VERSION = 2
+    CATALOG_SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS sounds (
+            filename TEXT PRIMARY KEY,
+            readable_name TEXT NOT NULL,
+            source TEXT NOT NULL DEFAULT 'user',    -- 'freesound' for downloads, 'user' for files dropped in by hand
+            freesound_id TEXT,
+            username TEXT,
+            tags TEXT,                              -- Freesound tags, space separated
+            license TEXT,
+            duration REAL,                          -- Seconds
+            format TEXT,                            -- File extension without the dot
+            size INTEGER,
+            mtime_ns INTEGER,
+            content_id TEXT,                        -- SHA-256 of the file, NULL until it has been hashed
+            added REAL NOT NULL,
+            downloaded REAL,                        -- Set for Songbird's own downloads, the only evictable files
+            plays INTEGER NOT NULL DEFAULT 0,
+            last_played REAL
+        )""",
+        "CREATE INDEX IF NOT EXISTS sounds_content_id ON sounds (content_id)",
+        "CREATE INDEX IF NOT EXISTS sounds_freesound_id ON sounds (freesound_id)",
+        "CREATE INDEX IF NOT EXISTS sounds_downloaded ON sounds (downloaded) WHERE downloaded IS NOT NULL",
+        """CREATE TABLE IF NOT EXISTS aliases (
+            alias TEXT PRIMARY KEY,
+            filename TEXT NOT NULL
+        )""",
+        "CREATE INDEX IF NOT EXISTS aliases_filename ON aliases (filename)"
+    )
+    # Schema 2: Freesound descriptions
+    CATALOG_TEXT_SCHEMA = (
+        "ALTER TABLE sounds ADD COLUMN description TEXT",
+    )
+    # Full-text index over names, tags and descriptions kept in step with the sounds table by triggers
+    # (external content, keyed by the sounds rowid). Only built where SQLite has FTS5; see _sync_catalog_text_index.
+    CATALOG_TEXT_INDEX = (
+        """CREATE VIRTUAL TABLE IF NOT EXISTS sounds_text USING fts5 (
+            readable_name, tags, description,
+            content = 'sounds', content_rowid = 'rowid', tokenize = 'porter unicode61'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS sounds_text_insert AFTER INSERT ON sounds BEGIN
+            INSERT INTO sounds_text (rowid, readable_name, tags, description)
+            VALUES (new.rowid, new.readable_name, new.tags, new.description);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS sounds_text_delete AFTER DELETE ON sounds BEGIN
+            INSERT INTO sounds_text (sounds_text, rowid, readable_name, tags, description)
+            VALUES ('delete', old.rowid, old.readable_name, old.tags, old.description);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS sounds_text_update AFTER UPDATE OF readable_name, tags, description ON sounds BEGIN
+            INSERT INTO sounds_text (sounds_text, rowid, readable_name, tags, description)
+            VALUES ('delete', old.rowid, old.readable_name, old.tags, old.description);
+            INSERT INTO sounds_text (rowid, readable_name, tags, description)
+            VALUES (new.rowid, new.readable_name, new.tags, new.description);
+        END""",
+        "INSERT INTO sounds_text (sounds_text) VALUES ('rebuild')"
+    )
+    # Full-text ranking weights for name, tags and description matches (bm25)
+    TEXT_SEARCH_WEIGHTS = (10.0, 5.0, 1.0)
+    # Best full-text hits checked against the sounds actually present
+    TEXT_SEARCH_CANDIDATES = 20
+    # Freesound descriptions are cut to this length in the catalog
+    DESCRIPTION_MAX_CHARS = 2000
+    # Descriptive columns a duplicate or renamed copy passes on to the file that is kept
+    CATALOG_MERGED_COLUMNS = ('freesound_id', 'username', 'tags', 'description', 'license', 'duration')
+    # Extensions Freesound names often end in (stripped from readable names)
+    AUDIO_NAME_EXTENSIONS = ('.wav', '.mp3', '.ogg', '.flac', '.aif', '.aiff', '.m4a')
+    # Filenames looked up per query when fetching catalog rows
+    CATALOG_QUERY_BATCH = 500
+
+    def get_catalog_file(self) -> str:
+        """Get path to the sound metadata catalog database"""
+        plugin_folder = self.get_plugin_folder_path()
+        return os.path.join(plugin_folder, 'sound_catalog.db')
+
+    def _catalog_db(self):
+        """The catalog connection, opened (and created or upgraded) on first use (caller holds the catalog lock)"""
+        if self._catalog_conn is None:
+            db = sqlite3.connect(self.get_catalog_file(), timeout=10, check_same_thread=False)
+            db.row_factory = sqlite3.Row
+            # WAL lets the background scan write without blocking lookups; NORMAL sync is still crash-safe with WAL
+            db.execute("PRAGMA journal_mode = WAL")
+            db.execute("PRAGMA synchronous = NORMAL")
+            version = db.execute("PRAGMA user_version").fetchone()[0]
+            if version < self.CATALOG_SCHEMA_VERSION:
+                with db:
+                    self._upgrade_catalog(db, version)
+                    db.execute(f"PRAGMA user_version = {self.CATALOG_SCHEMA_VERSION}")
+                log('info', f"SONGBIRD: Sound catalog upgraded from schema {version} to {self.CATALOG_SCHEMA_VERSION}")
+            with db:
+                self._catalog_text_search = self._sync_catalog_text_index(db)
+            self._catalog_conn = db
+        return self._catalog_conn
+
+    def _sync_catalog_text_index(self, db) -> bool:
+        """Build the full-text index if this SQLite has FTS5 and the catalog lacks it, or drop its triggers
+        if FTS5 is missing (every write to sounds would fail otherwise). Returns whether text search works."""
+        has_triggers = db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'sounds_text_insert'").fetchone() is not None
+        if not db.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')").fetchone()[0]:
+            if has_triggers:
+                for trigger in ('sounds_text_insert', 'sounds_text_delete', 'sounds_text_update'):
+                    db.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            log('warning', "SONGBIRD: This SQLite has no FTS5 - sounds will only be found by name, not by tags or description")
+            return False
+        if not has_triggers:
+            # New catalog, or one whose index went stale while opened without FTS5: (re)build it
+            for statement in self.CATALOG_TEXT_INDEX:
+                db.execute(statement)
+        return True
+
+    def _upgrade_catalog(self, db, version: int):
+        """Create the catalog schema, or bring an older one up to date"""
+        if version < 1:
+            for statement in self.CATALOG_SCHEMA:
+                db.execute(statement)
+        if version < 2:
+            for statement in self.CATALOG_TEXT_SCHEMA:
+                db.execute(statement)
+
+    @contextlib.contextmanager
+    def catalog_transaction(self):
+        """Catalog connection inside a transaction - committed when the outermost block ends, rolled back
+        if it raises. Nested blocks join the enclosing transaction, so callers can batch writes."""
+        with self._catalog_lock:
+            db = self._catalog_db()
+            self._catalog_depth += 1
+            try:
+                if self._catalog_depth > 1:
+                    yield db
+                else:
+                    with db:
+                        yield db
+            finally:
+                self._catalog_depth -= 1
+
+    def _upsert_sound_row(self, db, filename: str, values: dict):
+        """Insert a file's catalog row, or update just the given columns if it already has one.
+        New rows get a readable name from the filename until something better is known."""
+        readable_name, freesound_id = self._readable_name_from_filename(filename)
+        row = {
+            'readable_name': readable_name,
+            'freesound_id': freesound_id,
+            'format': os.path.splitext(filename)[1].lstrip('.').lower(),
+            'added': time.time()
+        }
+        row.update(values)
+        columns = ['filename'] + list(row)
+        conflict = (f"DO UPDATE SET {', '.join(f'{column} = excluded.{column}' for column in values)}"
+                    if values else "DO NOTHING")
+        db.execute(
+            f"INSERT INTO sounds ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT (filename) {conflict}",
+            [filename] + list(row.values())
+        )
+
+    def _catalog_new_files(self, filenames: list) -> dict:
+        """Add rows for files nothing is known about yet, named after the file. Returns filename -> row"""
+        added = time.time()
+        rows = {}
+        for filename in filenames:
+            readable_name, freesound_id = self._readable_name_from_filename(filename)
+            rows[filename] = {
+                'filename': filename,
+                'readable_name': readable_name,
+                'freesound_id': freesound_id,
+                'username': None,
+                'format': os.path.splitext(filename)[1].lstrip('.').lower(),
+                'added': added
+            }
+        with self.catalog_transaction() as db:
+            db.executemany(
+                "INSERT OR IGNORE INTO sounds (filename, readable_name, freesound_id, format, added) "
+                "VALUES (:filename, :readable_name, :freesound_id, :format, :added)",
+                list(rows.values())
+            )
+        return rows
+
+    def _merge_sound_metadata(self, db, target: str, source: str, metadata: dict | None = None):
+        """Fill gaps in target's row from source's row (and any extra metadata), adding up play history"""
+        row = db.execute("SELECT * FROM sounds WHERE filename = ?", (source,)).fetchone()
+        values = {column: row[column] for column in self.CATALOG_MERGED_COLUMNS} if row else {}
+        for column, value in (metadata or {}).items():
+            if column in self.CATALOG_MERGED_COLUMNS and value is not None:
+                values[column] = value
+        assignments = [f"{column} = COALESCE({column}, ?)" for column in values]
+        parameters = list(values.values())
+        if row is not None:
+            assignments += ["plays = plays + ?", "last_played = MAX(COALESCE(last_played, 0), COALESCE(?, 0))"]
+            parameters += [row['plays'], row['last_played']]
+        if assignments:
+            db.execute(f"UPDATE sounds SET {', '.join(assignments)} WHERE filename = ?", parameters + [target])
+
+    def _readable_name_from_filename(self, filename: str) -> tuple:
+        """Readable name and Freesound ID (or None) guessed from a filename, for files without better metadata"""
+        # Remove extension first
+        name_without_ext = os.path.splitext(filename)[0]
+        
+        # Check if this is a Freesound file (ends with underscore + numbers)
+        name_parts = name_without_ext.rsplit('_', 1)
+        if len(name_parts) == 2 and name_parts[1].isdigit():
+            # Freesound format: soundname_12345
+            return name_parts[0].replace('_', ' '), name_parts[1]
+        # User file: use full filename without extension
+        return name_without_ext.replace('_', ' '), None
+
+    def get_freesound_metadata(self, sound_data: dict) -> dict:
+        """Catalog columns for a Freesound search result"""
+        name = sound_data.get('name') or ''
+        base, extension = os.path.splitext(name)
+        if extension.lower() in self.AUDIO_NAME_EXTENSIONS:
+            name = base
+        tags = sound_data.get('tags')
+        description = ' '.join((sound_data.get('description') or '').split())[:self.DESCRIPTION_MAX_CHARS]
+        metadata = {
+            'source': 'freesound',
+            'readable_name': ' '.join(name.replace('_', ' ').split()) or None,
+            'freesound_id': str(sound_data['id']) if sound_data.get('id') is not None else None,
+            'username': sound_data.get('username'),
+            'tags': ' '.join(tags) if isinstance(tags, list) else tags,
+            'description': description or None,
+            'license': sound_data.get('license'),
+            'duration': sound_data.get('duration')
+        }
+        return {column: value for column, value in metadata.items() if value is not None}
+
+    def get_catalog_rows(self, filenames: list) -> dict:
+        """Catalog rows for the given filenames (filename -> row; files without a row are left out)"""
+        rows = {}
+        with self._catalog_lock:
+            db = self._catalog_db()
+            if len(filenames) > self.CATALOG_QUERY_BATCH * 10:
+                # Most of the catalog anyway - one pass is quicker than thousands of lookups
+                wanted = set(filenames)
+                return {row['filename']: row for row in db.execute("SELECT * FROM sounds") if row['filename'] in wanted}
+            for start in range(0, len(filenames), self.CATALOG_QUERY_BATCH):
+                batch = filenames[start:start + self.CATALOG_QUERY_BATCH]
+                query = f"SELECT * FROM sounds WHERE filename IN ({', '.join('?' * len(batch))})"
+                rows.update((row['filename'], row) for row in db.execute(query, batch))
+        return rows
+
+    def get_sound_metadata(self, filepath: str):
+        """Catalog row of a stored file or alias, or None if it isn't catalogued"""
+        filename = os.path.basename(self.resolve_sound_path(filepath))
+        return self.get_catalog_rows([filename]).get(filename)
+
+    # MPEG audio Layer III header tables (previews are always Layer III)
+    MP3_BITRATES_KBPS = {
+        1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+        2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+    }
+    MP3_SAMPLE_RATES = {1: (44100, 48000, 32000), 2: (22050, 24000, 16000), 2.5: (11025, 12000, 8000)}
+
+    def probe_sound_duration(self, filepath: str):
+        """Duration in seconds read from the file's headers without decoding it, or None if unknown"""
+        try:
+            extension = os.path.splitext(filepath)[1].lower()
+            if extension == '.wav':
+                return self._probe_wav_duration(filepath)
+            if extension == '.ogg':
+                return self._probe_ogg_duration(filepath)
+            if extension == '.mp3':
+                return self._probe_mp3_duration(filepath)
+        except Exception as e:
+            log('warning', f"SONGBIRD: Could not read the duration of {os.path.basename(filepath)}: {str(e)}")
+        return None
+
+    def _probe_wav_duration(self, filepath: str):
+        """Data chunk size over the fmt chunk's byte rate"""
+        with open(filepath, 'rb') as f:
+            header = f.read(12)
+            if header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+                return None
+            byte_rate = None
+            while True:
+                chunk = f.read(8)
+                if len(chunk) < 8:
+                    return None
+                chunk_id, size = chunk[:4], int.from_bytes(chunk[4:8], 'little')
+                if chunk_id == b'fmt ':
+                    byte_rate = int.from_bytes(f.read(size)[8:12], 'little')
+                    f.seek(size & 1, os.SEEK_CUR)
+                elif chunk_id == b'data':
+                    # Streamed WAVs may leave the size unset - count what is actually there
+                    available = os.fstat(f.fileno()).st_size - f.tell()
+                    return min(size, available) / byte_rate if byte_rate else None
+                else:
+                    # Chunks are padded to an even length
+                    f.seek(size + (size & 1), os.SEEK_CUR)
+
+    def _probe_ogg_duration(self, filepath: str):
+        """Last page's granule position over the stream's sample rate (Vorbis or Opus)"""
+        with open(filepath, 'rb') as f:
+            head = f.read(4096)
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 65536))
+            tail = f.read()
+        
+        vorbis = head.find(b'\x01vorbis')
+        opus = head.find(b'OpusHead')
+        if vorbis != -1:
+            rate, skip = int.from_bytes(head[vorbis + 12:vorbis + 16], 'little'), 0
+        elif opus != -1:
+            # Opus granules always count 48 kHz samples, after the encoder's pre-skip
+            rate, skip = 48000, int.from_bytes(head[opus + 10:opus + 12], 'little')
+        else:
+            return None
+        
+        last_page = tail.rfind(b'OggS')
+        if last_page == -1 or not rate:
+            return None
+        granule = int.from_bytes(tail[last_page + 6:last_page + 14], 'little')
+        return max(0, granule - skip) / rate
+
+    def _probe_mp3_duration(self, filepath: str):
+        """Frame count from a Xing/Info header when there is one, else the size at the first frame's bitrate"""
+        file_size = os.path.getsize(filepath)
+        with open(filepath, 'rb') as f:
+            data = f.read(64 * 1024)
+        
+        position = 0
+        if data[:3] == b'ID3' and len(data) >= 10:
+            # ID3v2 tag size is stored as a 28-bit syncsafe integer
+            position = 10 + ((data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14 | (data[8] & 0x7F) << 7 | (data[9] & 0x7F))
+            if position + 4 > len(data):
+                with open(filepath, 'rb') as f:
+                    f.seek(position)
+                    data = data[:position] + f.read(64 * 1024)
+        
+        while position + 4 <= len(data):
+            if data[position] == 0xFF and data[position + 1] & 0xE0 == 0xE0:
+                version = {3: 1, 2: 2, 0: 2.5}.get((data[position + 1] >> 3) & 3)
+                layer = (data[position + 1] >> 1) & 3
+                bitrate_index = data[position + 2] >> 4
+                rate_index = (data[position + 2] >> 2) & 3
+                if version and layer == 1 and 0 < bitrate_index < 15 and rate_index < 3:
+                    break
+            position += 1
+        else:
+            return None
+        
+        table = 1 if version == 1 else 2
+        sample_rate = self.MP3_SAMPLE_RATES[version][rate_index]
+        samples_per_frame = 1152 if version == 1 else 576
+        mono = data[position + 3] >> 6 == 3
+        xing = position + 4 + (17 if mono else 32) if version == 1 else position + 4 + (9 if mono else 17)
+        if data[xing:xing + 4] in (b'Xing', b'Info') and int.from_bytes(data[xing + 4:xing + 8], 'big') & 1:
+            frames = int.from_bytes(data[xing + 8:xing + 12], 'big')
+            return frames * samples_per_frame / sample_rate
+        bitrate = self.MP3_BITRATES_KBPS[table][bitrate_index] * 1000
+        return (file_size - position) * 8 / bitrate
+
+    # Disk budget for downloaded sounds (the settings grid overrides it; 0 means unlimited)
+    SOUNDS_BUDGET_MB = 500
+    # Each doubling of a sound's play count makes it rank as if played this much more recently
+    EVICTION_PLAY_WEIGHT_SECONDS = 24 * 3600
+    # Files removed per eviction step before yielding to other work
+    EVICTION_BATCH = 20
+
+    def record_sound_play(self, filename: str):
+        """Count a play and remember when it happened"""
+        filename = os.path.basename(self.resolve_sound_path(filename))
+        with self.catalog_transaction() as db:
+            db.execute("UPDATE sounds SET plays = plays + 1, last_played = ? WHERE filename = ?", (time.time(), filename))
+
+    def get_setting(self, grid: str, key: str, default):
+        """A value from the plugin settings, or the default before the helper is ready or when unset"""
+        value = None
+        if self.helper is not None:
+            try:
+                value = self.helper.get_plugin_setting('SONGBIRDPlugin', grid, key)
+            except Exception as e:
+                log('warning', f"SONGBIRD: Could not read setting {grid}.{key}: {str(e)}")
+        return default if value is None else value
+
+    def get_sounds_budget_bytes(self) -> int:
+        """Disk budget for downloaded sounds in bytes, 0 for unlimited"""
+        budget_mb = self.get_setting('cache', 'sounds_budget_mb', self.SOUNDS_BUDGET_MB)
+        return max(0, int(float(budget_mb) * 1024 * 1024))
+
+    def get_pinned_filenames(self) -> set:
+        """Files eviction must keep: anything bound to a phrase or game event and the sound that just played"""
+        pinned = {os.path.basename(self.resolve_bound_filepath(sound)) for sounds in self.load_bound_sounds().values() for sound in sounds}
+        pinned.update(os.path.basename(self.resolve_bound_filepath(sound)) for binding in self.load_event_bindings() for sound in binding['sounds'])
+        if self.current_playing and self.current_playing.get('filepath'):
+            pinned.add(os.path.basename(self.current_playing['filepath']))
+        return pinned
+
+    def schedule_cache_maintenance(self):
+        """Index new files and trim the sounds folder in the background (coalesces repeated calls)"""
+        with self._maintenance_lock:
+            if self._maintenance_pending:
+                return
+            self._maintenance_pending = True
+        self._maintenance_executor.submit(self._cache_maintenance_worker)
+
+    def _cache_maintenance_worker(self):
+        try:
+            with self._maintenance_lock:
+                self._maintenance_pending = False
+            
+            more_work = self.index_sound_folder(self.CONTENT_INDEX_BATCH)
+            self.backfill_playback_copies(self.INGEST_QUEUE_LIMIT)
+            if self.evict_over_budget(self.EVICTION_BATCH) or more_work:
+                # Carry on in a later step so playback work can interleave
+                time.sleep(0.05)
+                self.schedule_cache_maintenance()
+                
+        except Exception as e:
+            log('error', f"SONGBIRD: Cache maintenance error: {str(e)}")
+
+    def evict_over_budget(self, max_files: int) -> bool:
+        """Delete up to max_files of the least valuable downloaded sounds while the folder is over budget.
+        Returns True if it stopped early and more eviction is needed."""
+        budget = self.get_sounds_budget_bytes()
+        sounds_folder = os.path.join(self.get_plugin_folder_path(), 'sounds')
+        if not os.path.isdir(sounds_folder):
+            return False
+        
+        sizes = {}
+        with os.scandir(sounds_folder) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    sizes[entry.name] = entry.stat().st_size
+        # Playback copies come out of the same budget and go with their sound
+        copy_sizes = {}
+        if os.path.isdir(self.get_playback_folder()):
+            with os.scandir(self.get_playback_folder()) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        copy_sizes[entry.name] = entry.stat().st_size
+        total = sum(sizes.values()) + sum(copy_sizes.values())
+        self._sounds_folder_bytes = total
+        if not budget or total <= budget:
+            return False
+        
+        pinned = self.get_pinned_filenames()
+        # Only Songbird's own downloads are evictable - user files never are
+        with self._catalog_lock:
+            rows = self._catalog_db().execute(
+                "SELECT filename, content_id, downloaded, plays, last_played FROM sounds WHERE downloaded IS NOT NULL"
+            ).fetchall()
+        candidates = []
+        for row in rows:
+            if row['filename'] not in sizes or row['filename'] in pinned:
+                continue
+            last_used = row['last_played'] or row['downloaded']
+            score = last_used + self.EVICTION_PLAY_WEIGHT_SECONDS * (row['plays'] + 1).bit_length()
+            if row['content_id'] and self._mixer_output is not None:
+                sizes[row['filename']] += copy_sizes.get(self._playback_copy_name(row['content_id']), 0)
+            candidates.append((score, row['filename']))
+        
+        candidates.sort()
+        removed = 0
+        for _, filename in candidates:
+            if total <= budget:
+                return False
+            if removed >= max_files:
+                return True
+            filepath = os.path.join(sounds_folder, filename)
+            try:
+                os.remove(filepath)
+            except OSError as e:
+                log('warning', f"SONGBIRD: Could not evict {filename}: {str(e)}")
+                continue
+            total -= sizes[filename]
+            removed += 1
+            self._evicted_count += 1
+            self._forget_sound_file(filepath)
+            log('info', f"SONGBIRD: Evicted {filename} ({sizes[filename]} bytes, {total}/{budget} bytes used)")
+        
+        self._sounds_folder_bytes = total
+        if total > budget:
+            log('warning', f"SONGBIRD: Sounds folder is {total} bytes, over its {budget} byte budget, but the rest is bound or user files")
+        return False
+
+    def _forget_sound_file(self, filepath: str):
+        """Drop every record of an evicted file"""
+        filename = os.path.basename(filepath)
+        content_id = self.get_content_id(filepath)
+        self.forget_content(filename)
+        with self._sound_cache_lock:
+            if filepath in self._sound_cache:
+                self._drop_decoded_sound(filepath)
+        if content_id:
+            with self._content_lock:
+                still_stored = content_id in self._content_by_id
+            if not still_stored:
+                self._drop_playback_copy(content_id)
+        with self._prefetch_lock:
+            prefetched = self._ensure_prefetched()
+            if prefetched.pop(filename, None) is None:
+                return
+            snapshot = dict(prefetched)
+        self._write_json_atomic(self.get_prefetch_file(), snapshot)
+
+    # Files hashed per indexing step before yielding to other work
+    CONTENT_INDEX_BATCH = 200
+
+    def _ensure_content_index(self) -> dict:
+        """Content index, loaded from the catalog on first use (caller holds the lock)"""
+        if self._content_index is None:
+            with self._catalog_lock:
+                db = self._catalog_db()
+                files = {
+                    row['filename']: {'content_id': row['content_id'], 'size': row['size'], 'mtime_ns': row['mtime_ns']}
+                    for row in db.execute("SELECT filename, content_id, size, mtime_ns FROM sounds WHERE content_id IS NOT NULL")
+                }
+                aliases = {row['alias']: row['filename'] for row in db.execute("SELECT alias, filename FROM aliases")}
+            self._content_index = {'files': files, 'aliases': aliases}
+            self._content_by_id = {info['content_id']: filename for filename, info in files.items()}
+        return self._content_index
+
+    def hash_sound_file(self, filepath: str) -> str:
+        """Content ID of a file (SHA-256 of its bytes)"""
+        hasher = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def ingest_sound_file(self, filepath: str, content_id: str | None = None, metadata: dict | None = None) -> str:
+        """Register a file in the sounds folder by content, cataloguing any metadata known about it
+        (column -> value). If the same sound is already stored under another name, the new copy is
+        removed, its name becomes an alias and its metadata fills gaps in the kept copy's.
+        Returns the stored path."""
+        filename = os.path.basename(filepath)
+        sounds_folder = os.path.dirname(filepath)
+        file_stat = os.stat(filepath)
+        content_id = content_id or self.hash_sound_file(filepath)
+        metadata = dict(metadata or {})
+        if metadata.get('duration') is None:
+            metadata['duration'] = self.probe_sound_duration(filepath)
+        
+        with self._content_lock:
+            index = self._ensure_content_index()
+            existing = self._content_by_id.get(content_id)
+            if existing and existing != filename and os.path.exists(os.path.join(sounds_folder, existing)):
+                os.remove(filepath)
+                self._fold_into(index, filename, existing, metadata)
+                stored_path = os.path.join(sounds_folder, existing)
+                log('info', f"SONGBIRD: {filename} duplicates {existing}, kept one copy and made the name an alias")
+            else:
+                index['files'][filename] = {'content_id': content_id, 'size': file_stat.st_size, 'mtime_ns': file_stat.st_mtime_ns}
+                index['aliases'].pop(filename, None)
+                self._content_by_id[content_id] = filename
+                metadata.update(content_id=content_id, size=file_stat.st_size, mtime_ns=file_stat.st_mtime_ns)
+                with self.catalog_transaction() as db:
+                    self._upsert_sound_row(db, filename, {column: value for column, value in metadata.items() if value is not None})
+                    db.execute("DELETE FROM aliases WHERE alias = ?", (filename,))
+                stored_path = filepath
+        
+        if stored_path != filepath:
+            self.invalidate_sound_catalog()
+        else:
+            if 'readable_name' in metadata:
+                # The entry may have been built from the filename before this metadata arrived
+                self.invalidate_sound_catalog([filename])
+            self.schedule_transcode(filepath, content_id, metadata['duration'])
+        return stored_path
+
+    def _fold_into(self, index: dict, filename: str, existing: str, metadata: dict | None = None):
+        """Make the name of a removed file an alias of existing, moving its aliases, metadata and play
+        history there. If the removed copy was the user's own file rather than a download, the kept copy
+        becomes a user file, so eviction never deletes it (caller holds the content lock)"""
+        info = index['files'].pop(filename, None)
+        if info and self._content_by_id.get(info['content_id']) == filename:
+            del self._content_by_id[info['content_id']]
+        index['aliases'][filename] = existing
+        # Aliases of the removed copy follow it to the one we keep
+        for alias, target in index['aliases'].items():
+            if target == filename:
+                index['aliases'][alias] = existing
+        with self.catalog_transaction() as db:
+            row = db.execute("SELECT downloaded FROM sounds WHERE filename = ?", (filename,)).fetchone()
+            if (row['downloaded'] if row is not None else None) is None and (metadata or {}).get('downloaded') is None:
+                db.execute("UPDATE sounds SET source = 'user', downloaded = NULL WHERE filename = ?", (existing,))
+            self._merge_sound_metadata(db, existing, filename, metadata)
+            db.execute("DELETE FROM sounds WHERE filename = ?", (filename,))
+            db.execute("UPDATE aliases SET filename = ? WHERE filename = ?", (existing, filename))
+            db.execute("INSERT OR REPLACE INTO aliases (alias, filename) VALUES (?, ?)", (filename, existing))
+
+    def forget_content(self, filename: str):
+        """Drop a file from the content index and the catalog. Its aliases, metadata and play history move
+        to another file with the same content (it was renamed), otherwise they go too"""
+        with self._content_lock:
+            index = self._ensure_content_index()
+            info = index['files'].pop(filename, None)
+            successor = self._content_by_id.get(info['content_id']) if info else None
+            if successor == filename:
+                del self._content_by_id[info['content_id']]
+                successor = None
+            for alias in [alias for alias, target in index['aliases'].items() if target == filename]:
+                if successor:
+                    index['aliases'][alias] = successor
+                else:
+                    del index['aliases'][alias]
+            with self.catalog_transaction() as db:
+                if successor:
+                    self._merge_sound_metadata(db, successor, filename)
+                    db.execute("UPDATE aliases SET filename = ? WHERE filename = ?", (successor, filename))
+                else:
+                    db.execute("DELETE FROM aliases WHERE filename = ?", (filename,))
+                db.execute("DELETE FROM sounds WHERE filename = ?", (filename,))
+        self.invalidate_sound_catalog()
+
+    def get_sound_aliases(self) -> dict:
+        """Alias filename -> filename of the stored copy"""
+        with self._content_lock:
+            return dict(self._ensure_content_index()['aliases'])
+
+    def resolve_sound_path(self, filepath: str) -> str:
+        """Path of the stored copy when filepath names an alias, otherwise filepath unchanged"""
+        with self._content_lock:
+            target = self._ensure_content_index()['aliases'].get(os.path.basename(filepath))
+        return os.path.join(os.path.dirname(filepath), target) if target else filepath
+
+    def get_content_id(self, filepath: str):
+        """Content ID of a stored file or alias, or None if it hasn't been indexed yet"""
+        filename = os.path.basename(self.resolve_sound_path(filepath))
+        with self._content_lock:
+            info = self._ensure_content_index()['files'].get(filename)
+        return info['content_id'] if info else None
+
+    def resolve_bound_filepath(self, sound: dict) -> str:
+        """Where a bound sound is now: by content ID when known (survives renames and dedup), else by path"""
+        content_id = sound.get('content_id')
+        if content_id:
+            with self._content_lock:
+                self._ensure_content_index()
+                filename = self._content_by_id.get(content_id)
+            if filename:
+                return os.path.join(self.get_plugin_folder_path(), 'sounds', filename)
+        return self.resolve_sound_path(sound['filepath'])
+
+    def is_same_bound_sound(self, sound: dict, other: dict) -> bool:
+        """Whether two bound sound entries play the same content - by content ID when both have one,
+        else by where each resolves to (an alias and its stored copy match)"""
+        if sound.get('content_id') and other.get('content_id'):
+            return sound['content_id'] == other['content_id']
+        return self.resolve_bound_filepath(sound) == self.resolve_bound_filepath(other)
+
+    def index_sound_folder(self, max_files: int) -> bool:
+        """Hash and catalogue up to max_files new or changed files in the sounds folder, folding duplicates
+        into aliases. The first run over an existing folder is the migration. Returns True if more work remains."""
+        sounds_folder = os.path.join(self.get_plugin_folder_path(), 'sounds')
+        try:
+            folder_mtime = os.stat(sounds_folder).st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if folder_mtime == self._content_indexed_mtime:
+            return False
+        
+        supported_extensions = ('.mp3', '.ogg', '.wav')
+        on_disk = {}
+        with os.scandir(sounds_folder) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(supported_extensions) and entry.is_file():
+                    on_disk[entry.name] = entry.stat()
+        
+        with self._catalog_lock:
+            catalogued = [row['filename'] for row in self._catalog_db().execute("SELECT filename FROM sounds")]
+        # Forget files that were deleted or renamed away
+        gone = [filename for filename in catalogued if filename not in on_disk]
+        
+        with self._content_lock:
+            index = self._ensure_content_index()
+            stale = [
+                filename for filename, file_stat in sorted(on_disk.items())
+                if filename not in index['files']
+                or index['files'][filename]['size'] != file_stat.st_size
+                or index['files'][filename]['mtime_ns'] != file_stat.st_mtime_ns
+            ]
+        # Read files before taking any locks, then write the whole batch in one transaction
+        prepared = []
+        for filename in stale[:max_files]:
+            filepath = os.path.join(sounds_folder, filename)
+            try:
+                prepared.append((filepath, self.hash_sound_file(filepath), {'duration': self.probe_sound_duration(filepath)}))
+            except OSError as e:
+                log('warning', f"SONGBIRD: Could not index {filename}: {str(e)}")
+        with self._content_lock, self.catalog_transaction():
+            for filepath, content_id, metadata in prepared:
+                try:
+                    self.ingest_sound_file(filepath, content_id, metadata)
+                except OSError as e:
+                    log('warning', f"SONGBIRD: Could not index {os.path.basename(filepath)}: {str(e)}")
+        if stale:
+            log('info', f"SONGBIRD: Indexed {min(len(stale), max_files)} of {len(stale)} new or changed sounds")
+        
+        if len(stale) > max_files:
+            return True
+        
+        # Only once everything new is indexed, so renamed files are recognised by content first
+        for filename in gone:
+            self.forget_content(filename)
+        
+        self._content_indexed_mtime = folder_mtime
+        self._migrate_bound_content_ids()
+        return False
+
+    def _migrate_bound_content_ids(self):
+        """Point bindings at content IDs (and at the kept copy of folded duplicates)"""
+        with self._bound_lock:
+            bound_sounds = self.load_bound_sounds()
+            changed = 0
+            for phrase, sounds in bound_sounds.items():
+                updated = []
+                for sound in sounds:
+                    filepath = self.resolve_bound_filepath(sound)
+                    content_id = sound.get('content_id') or self.get_content_id(filepath)
+                    if content_id != sound.get('content_id') or filepath != sound['filepath']:
+                        sound = dict(sound, filepath=filepath, content_id=content_id)
+                        changed += 1
+                    updated.append(sound)
+                bound_sounds[phrase] = updated
+            
+            # One snapshot rather than a journal record per phrase
+            if changed:
+                self.save_bound_sounds(bound_sounds)
+                log('info', f"SONGBIRD: Updated {changed} bound sounds to content IDs")
+
+    # Decoded sound cache: RAM budget, and the longest/largest sounds worth decoding up front
+    SOUND_CACHE_BUDGET_BYTES = 64 * 1024 * 1024
+    SOUND_CACHE_MAX_SECONDS = 20
+    SOUND_CACHE_MAX_FILE_BYTES = 2 * 1024 * 1024
+
+    def get_decoded_sound(self, filepath: str):
+        """Decoded pygame Sound for a short file (from the cache when possible), or None for long tracks.
+        Decodes run on the decoder thread (play_sound_file, prewarm_bound_sounds)"""
+        try:
+            file_stat = os.stat(filepath)
+        except OSError:
+            return None
+        
+        with self._sound_cache_lock:
+            cached = self._sound_cache.get(filepath)
+            if cached is not None:
+                if cached[2] == file_stat.st_mtime_ns:
+                    self._sound_cache.move_to_end(filepath)
+                    self._sound_cache_stats['hits'] += 1
+                    return cached[0]
+                # File changed on disk - decode again
+                self._drop_decoded_sound(filepath)
+            
+            if filepath in self._sound_cache_streamed or file_stat.st_size > self.SOUND_CACHE_MAX_FILE_BYTES:
+                return None
+            self._sound_cache_stats['misses'] += 1
+        
+        # Decode outside the cache lock so cache hits for other sounds aren't held up
+        self.ensure_mixer()
+        with self._decode_lock, self.time_phase('decode'):
+            sound = pygame.mixer.Sound(filepath)
+        length = sound.get_length()
+        if length > self.SOUND_CACHE_MAX_SECONDS:
+            with self._sound_cache_lock:
+                self._sound_cache_streamed.add(filepath)
+            return None
+        
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        decoded_bytes = int(length * frequency * channels * (abs(sample_format) // 8))
+        
+        with self._sound_cache_lock:
+            if filepath in self._sound_cache:
+                self._drop_decoded_sound(filepath)
+            self._sound_cache[filepath] = (sound, decoded_bytes, file_stat.st_mtime_ns)
+            self._sound_cache_bytes += decoded_bytes
+            
+            while self._sound_cache_bytes > self.SOUND_CACHE_BUDGET_BYTES and len(self._sound_cache) > 1:
+                oldest = next(iter(self._sound_cache))
+                self._drop_decoded_sound(oldest)
+                self._sound_cache_stats['evictions'] += 1
+        
+        return sound
+
+    def _drop_decoded_sound(self, filepath: str):
+        """Remove a sound from the decoded cache (caller holds the lock)"""
+        _, decoded_bytes, _ = self._sound_cache.pop(filepath)
+        self._sound_cache_bytes -= decoded_bytes
+
+    # Transcodes running or queued at once; the rest are picked up by later maintenance passes
+    INGEST_QUEUE_LIMIT = 32
+    INGEST_WORKERS = 2
+    # Longer tracks stream through music and aren't worth several MB of WAV each
+    TRANSCODE_MAX_SECONDS = 30
+    TRANSCODE_EXTENSIONS = ('.mp3', '.ogg')
+
+    def get_playback_folder(self) -> str:
+        """Folder for WAV copies of MP3/OGG sounds in the mixer's format, named by content ID"""
+        return os.path.join(self.get_plugin_folder_path(), 'playback')
+
+    def _playback_copy_name(self, content_id: str) -> str:
+        sample_rate, channels = self._mixer_output
+        return f"{content_id}-{sample_rate}-{channels}.wav"
+
+    def _ensure_playback_copies(self) -> set:
+        """Names in playback/, scanned on first use (caller holds the ingest lock)"""
+        if self._playback_copies is None:
+            folder = self.get_playback_folder()
+            self._playback_copies = {name for name in os.listdir(folder) if name.endswith('.wav')} if os.path.isdir(folder) else set()
+        return self._playback_copies
+
+    def get_playback_path(self, filepath: str) -> str:
+        """The file to play for a sound: its WAV copy in the mixer's current format once transcoded, else the file itself"""
+        if self._mixer_output is None:
+            return filepath
+        content_id = self.get_content_id(filepath)
+        if content_id is None:
+            return filepath
+        name = self._playback_copy_name(content_id)
+        with self._ingest_lock:
+            if name not in self._ensure_playback_copies():
+                return filepath
+        return os.path.join(self.get_playback_folder(), name)
+
+    def _drop_playback_copy(self, content_id: str):
+        """Delete the playback copy of content no longer in the sounds folder"""
+        if self._mixer_output is None:
+            return
+        name = self._playback_copy_name(content_id)
+        with self._ingest_lock:
+            if name not in self._ensure_playback_copies():
+                return
+            self._playback_copies.discard(name)
+        filepath = os.path.join(self.get_playback_folder(), name)
+        with self._sound_cache_lock:
+            if filepath in self._sound_cache:
+                self._drop_decoded_sound(filepath)
+        try:
+            os.remove(filepath)
+        except OSError as e:
+            log('warning', f"SONGBIRD: Could not remove playback copy {name}: {str(e)}")
+
+    def _get_ingest_executor(self):
+        """Worker processes for transcoding, so decoding doesn't hold the GIL the plugin needs (caller holds the ingest lock)"""
+        if self._ingest_executor is None:
+            if current_dir not in sys.path:
+                # Spawned workers import songbird_ingest by name
+                sys.path.append(current_dir)
+            _lazy_import('songbird_ingest')
+            if getattr(sys, 'frozen', False) or self._ingest_in_process:
+                # A frozen COVAS build can't spawn plain Python workers - transcode on a thread instead
+                self._ingest_in_process = True
+                self._ingest_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='songbird-ingest')
+            else:
+                # Spawned on every platform so workers never inherit the audio device or our threads
+                _lazy_import('multiprocessing')
+                self._ingest_executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.INGEST_WORKERS, mp_context=multiprocessing.get_context('spawn'))
+        return self._ingest_executor
+
+    def schedule_transcode(self, filepath: str, content_id: str, duration: float | None = None) -> bool:
+        """Queue an MP3/OGG sound for validation and transcoding to a WAV playback copy. Returns True if queued"""
+        if self._mixer_output is None:
+            # Output format unknown until the mixer starts; the next maintenance pass catches up
+            return False
+        if not filepath.lower().endswith(self.TRANSCODE_EXTENSIONS):
+            return False
+        if duration is not None and duration > self.TRANSCODE_MAX_SECONDS:
+            return False
+        
+        name = self._playback_copy_name(content_id)
+        sample_rate, channels = self._mixer_output
+        with self._ingest_lock:
+            if (content_id in self._ingest_failed or name in self._ingest_pending
+                    or name in self._ensure_playback_copies() or len(self._ingest_pending) >= self.INGEST_QUEUE_LIMIT):
+                return False
+            self._ingest_pending.add(name)
+            try:
+                executor = self._get_ingest_executor()
+                os.makedirs(self.get_playback_folder(), exist_ok=True)
+                future = executor.submit(self._transcode_in_process if self._ingest_in_process else songbird_ingest.transcode_sound_file,
+                                         filepath, os.path.join(self.get_playback_folder(), name), sample_rate, channels,
+                                         not self._ingest_in_process)
+            except Exception as e:
+                self._ingest_pending.discard(name)
+                log('error', f"SONGBIRD: Could not queue {os.path.basename(filepath)} for transcoding: {str(e)}")
+                return False
+        
+        submitted = time.perf_counter()
+        future.add_done_callback(lambda future: self._finish_transcode(future, filepath, content_id, name, submitted))
+        return True
+
+    def _transcode_in_process(self, source: str, target: str, sample_rate: int, channels: int, own_mixer: bool) -> dict:
+        """Thread fallback for transcoding: decodes with the plugin's mixer, so it takes turns with the decoder thread"""
+        with self._decode_lock:
+            return songbird_ingest.transcode_sound_file(source, target, sample_rate, channels, own_mixer)
+
+    def _finish_transcode(self, future, filepath: str, content_id: str, name: str, submitted: float):
+        """Record a finished transcode: register the copy, or deal with a file that isn't playable"""
+        with self._ingest_lock:
+            self._ingest_pending.discard(name)
+        filename = os.path.basename(filepath)
+        try:
+            result = future.result()
+        except concurrent.futures.CancelledError:
+            return
+        except ValueError as e:
+            self._reject_sound_file(filepath, content_id, str(e))
+            return
+        except concurrent.futures.BrokenExecutor as e:
+            log('warning', f"SONGBIRD: Transcoding workers stopped ({str(e)}), transcoding on a thread from now on")
+            with self._ingest_lock:
+                self._ingest_executor = None
+                self._ingest_in_process = True
+            self.schedule_cache_maintenance()
+            return
+        except Exception as e:
+            self.count_metric('ingest.failures')
+            log('error', f"SONGBIRD: Error transcoding {filename}: {str(e)}")
+            return
+        
+        self.record_timing('ingest.transcode', time.perf_counter() - submitted)
+        self.count_metric('ingest.transcoded')
+        with self._ingest_lock:
+            self._ensure_playback_copies().add(name)
+        if os.path.splitext(filename)[1].lower() != '.' + result['container']:
+            self.count_metric('ingest.mislabeled')
+            log('info', f"SONGBIRD: {filename} is really {result['container'].upper()} data; it now plays from its WAV copy")
+        
+        if not self.get_setting('cache', 'keep_original_downloads', True):
+            self._replace_with_playback_copy(filepath, name)
+        
+        with self._ingest_lock:
+            idle = not self._ingest_pending
+        if idle:
+            # More files may be waiting for a free slot in the queue
+            self.schedule_cache_maintenance()
+
+    def _reject_sound_file(self, filepath: str, content_id: str, reason: str):
+        """A file failed validation: drop it if Songbird downloaded it, otherwise just report it"""
+        self.count_metric('ingest.rejected')
+        with self._ingest_lock:
+            self._ingest_failed.add(content_id)
+        filename = os.path.basename(filepath)
+        metadata = self.get_sound_metadata(filepath)
+        if metadata is not None and metadata['downloaded'] is not None and os.path.exists(filepath):
+            try:
+                os.remove(filepath)
+            except OSError as e:
+                log('warning', f"SONGBIRD: Could not remove unplayable download {filename}: {str(e)}")
+                return
+            self._forget_sound_file(filepath)
+            log('warning', f"SONGBIRD: Removed {filename} - the downloaded file isn't playable ({reason})")
+        else:
+            log('warning', f"SONGBIRD: {filename} isn't playable ({reason})")
+
+    def _replace_with_playback_copy(self, filepath: str, name: str):
+        """Swap a downloaded MP3/OGG for its WAV copy in sounds/, keeping its name as an alias and its history"""
+        metadata = self.get_sound_metadata(filepath)
+        if metadata is None or metadata['downloaded'] is None:
+            # User files are never replaced
+            return
+        filename = os.path.basename(filepath)
+        target = os.path.join(os.path.dirname(filepath), os.path.splitext(filename)[0] + '.wav')
+        if os.path.exists(target) or not os.path.exists(filepath):
+            return
+        
+        with self._ingest_lock:
+            self._ensure_playback_copies().discard(name)
+        os.replace(os.path.join(self.get_playback_folder(), name), target)
+        carried = {column: metadata[column] for column in ('readable_name', 'source', 'freesound_id', 'username', 'tags',
+                                                           'description', 'license', 'added', 'downloaded')
+                   if metadata[column] is not None}
+        with self._content_lock, self.catalog_transaction():
+            stored = self.ingest_sound_file(target, self.hash_sound_file(target), carried)
+            os.remove(filepath)
+            self._fold_into(self._ensure_content_index(), filename, os.path.basename(stored))
+        self.invalidate_sound_catalog()
+        log('info', f"SONGBIRD: Replaced {filename} with its WAV copy {os.path.basename(stored)}")
+
+    def backfill_playback_copies(self, max_files: int):
+        """Queue transcodes for catalogued MP3/OGG sounds without a playback copy (older sounds, or after
+        the mixer format changed) and delete copies nothing uses any more"""
+        if self._mixer_output is None:
+            return
+        with self._catalog_lock:
+            rows = self._catalog_db().execute(
+                "SELECT filename, content_id, duration FROM sounds WHERE content_id IS NOT NULL"
+            ).fetchall()
+        wanted = {self._playback_copy_name(row['content_id']): row for row in rows}
+        
+        with self._ingest_lock:
+            copies = self._ensure_playback_copies()
+            orphans = [name for name in copies if name not in wanted and name not in self._ingest_pending]
+            copies.difference_update(orphans)
+            missing = [row for name, row in wanted.items() if name not in copies]
+        for name in orphans:
+            try:
+                os.remove(os.path.join(self.get_playback_folder(), name))
+            except OSError as e:
+                log('warning', f"SONGBIRD: Could not remove playback copy {name}: {str(e)}")
+        
+        sounds_folder = os.path.join(self.get_plugin_folder_path(), 'sounds')
+        queued = 0
+        for row in missing:
+            if queued >= max_files:
+                break
+            if self.schedule_transcode(os.path.join(sounds_folder, row['filename']), row['content_id'], row['duration']):
+                queued += 1
+        if orphans or queued:
+            log('info', f"SONGBIRD: Queued {queued} sounds for transcoding, removed {len(orphans)} unused playback copies")
+
+    def get_sound_cache_stats(self) -> dict:
+        """Decoded sound cache counters plus current size"""
+        with self._sound_cache_lock:
+            return dict(self._sound_cache_stats, sounds=len(self._sound_cache), bytes=self._sound_cache_bytes)
+
+    def prewarm_bound_sounds(self, sounds: list | None = None):
+        """Decode bound sounds (all phrase and event bindings, or just the given entries) into the cache in the background"""
+        def warm():
+            try:
+                if sounds is not None:
+                    filepaths = {self.resolve_bound_filepath(sound) for sound in sounds}
+                else:
+                    filepaths = {self.resolve_bound_filepath(sound) for bound in self.load_bound_sounds().values() for sound in bound}
+                    filepaths.update(self.resolve_bound_filepath(sound) for binding in self.load_event_bindings() for sound in binding['sounds'])
+                # One decoder task per file, so triggers queued meanwhile don't wait for the whole batch
+                decodes = [self._decode_executor.submit(lambda filepath=filepath: self.get_decoded_sound(self.get_playback_path(filepath)))
+                           for filepath in filepaths]
+                warmed = sum(1 for decode in decodes if decode.result() is not None)
+                log('info', f"SONGBIRD: Pre-warmed {warmed} of {len(filepaths)} bound sounds")
+            except Exception as e:
+                log('error', f"SONGBIRD: Error pre-warming bound sounds: {str(e)}")
+        threading.Thread(target=warm, name='songbird-prewarm', daemon=True).start()
+
+    # Most sound effects that may play at once; starting another steals the oldest
+    MAX_VOICES = 8
+    # How long an action waits for the audio thread to answer
+    AUDIO_COMMAND_TIMEOUT = 5
+    # Mixer defaults (COVAS settings -> SONGBIRD -> Audio Output); the buffer delays every sound by buffer / rate
+    MIXER_BUFFER_FRAMES = 512
+    MIXER_SAMPLE_RATE = 44100
+    MIXER_CHANNELS = 2
+    MIXER_SAMPLE_RATES = (22050, 32000, 44100, 48000)
+    # Plays timed by songbird_calibrate_audio
+    CALIBRATION_ROUNDS = 20
+
+    def _mixer_config_from(self, sample_rate, channels, buffer_size) -> tuple:
+        """(sample rate, channels, buffer frames) snapped to values SDL accepts"""
+        sample_rate = min(self.MIXER_SAMPLE_RATES, key=lambda rate: abs(rate - int(float(sample_rate))))
+        channels = 1 if int(float(channels)) <= 1 else 2
+        buffer_size = max(64, min(8192, int(float(buffer_size))))
+        # SDL wants a power of two
+        buffer_size = 1 << round(math.log2(buffer_size))
+        return sample_rate, channels, buffer_size
+
+    def get_mixer_settings(self) -> tuple:
+        """(sample rate, channels, buffer frames) from the plugin settings"""
+        return self._mixer_config_from(self.get_setting('audio', 'sample_rate', self.MIXER_SAMPLE_RATE),
+                                       self.get_setting('audio', 'channels', self.MIXER_CHANNELS),
+                                       self.get_setting('audio', 'buffer_size', self.MIXER_BUFFER_FRAMES))
+
+    def _start_mixer(self, config: tuple, trial: bool = False):
+        """pre_init and start the mixer with (sample rate, channels, buffer frames). A trial config
+        (calibration) leaves playback copies keyed to the format of the configured one"""
+        sample_rate, channels, buffer_size = config
+        pygame.mixer.pre_init(sample_rate, -16, channels, buffer_size)
+        pygame.mixer.init()
+        pygame.mixer.set_num_channels(self.MAX_VOICES)
+        self._mixer_config = config
+        if not trial:
+            frequency, _, output_channels = pygame.mixer.get_init()
+            self._mixer_output = (frequency, output_channels)
+        log('info', f"SONGBIRD: pygame mixer initialized ({sample_rate} Hz, {channels} channels, buffer {buffer_size} frames)")
+
+    def ensure_mixer(self):
+        """Import pygame and start the mixer once; callers racing the warm-up thread wait for it. Raises if it fails"""
+        if self._mixer_ready.is_set():
+            return
+        with self._mixer_lock:
+            if self._mixer_ready.is_set():
+                return
+            try:
+                with self.time_phase('startup.pygame_import'):
+                    _lazy_import('pygame')
+                with self.time_phase('startup.mixer_init'):
+                    self._start_mixer(self.get_mixer_settings())
+            except Exception as e:
+                log('error', f'SONGBIRD: Failed to initialize pygame mixer: {str(e)}')
+                raise
+            self._mixer_ready.set()
+
+    def apply_mixer_settings(self, config: tuple | None = None, trial: bool = False) -> bool:
+        """Restart the mixer if the settings (or the given config) differ from what it runs with.
+        A trial config is only used until the next call. Returns True if it restarted"""
+        self.ensure_mixer()
+        config = config or self.get_mixer_settings()
+        if config == self._mixer_config:
+            return False
+        output = self._mixer_output
+        self.stop_voices().result(self.AUDIO_COMMAND_TIMEOUT)
+        # No decode may run while the mixer it converts for is replaced
+        with self._decode_lock:
+            self._audio_call(self._engine_restart_mixer, config, trial).result(self.AUDIO_COMMAND_TIMEOUT)
+        if self._mixer_output != output:
+            # Playback copies for the new output format
+            self.schedule_cache_maintenance()
+        return True
+
+    def _engine_restart_mixer(self, config: tuple, trial: bool = False):
+        for voice in self._voices.values():
+            if voice['kind'] == 'music':
+                self._release_music_source(voice)
+        pygame.mixer.quit()
+        self._voices.clear()
+        self._start_mixer(config, trial)
+        # Decoded sounds were converted to the old output format
+        with self._sound_cache_lock:
+            self._sound_cache.clear()
+            self._sound_cache_bytes = 0
+
+    def warm_up(self):
+        """Background start-up: mixer, HTTP stack and matcher, then decode bound sounds, so the first
+        trigger doesn't pay for imports"""
+        try:
+            self.ensure_mixer()
+            # Settings changed since the mixer started in an earlier chat
+            self.apply_mixer_settings()
+            self._get_http_session()
+            _lazy_import('numpy', 'np', optional=True)
+            # Sounds added while the mixer's format was unknown get their playback copies now
+            self.schedule_cache_maintenance()
+        except Exception as e:
+            log('error', f"SONGBIRD: Warm-up error: {str(e)}")
+        finally:
+            self._warm_up_done.set()
+        # Decode bound sounds ahead of time so the first trigger is already instant
+        self.prewarm_bound_sounds()
+
+    def _audio_loop(self):
+        """Audio thread: run mixer commands one at a time, in the order they were queued"""
+        while True:
+            future, fn, args, queued_at = self._audio_commands.get()
+            self.record_timing('audio.queue_wait', time.perf_counter() - queued_at)
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                self.ensure_mixer()
+                future.set_result(fn(*args))
+            except Exception as e:
+                log('error', f"SONGBIRD: Audio command {fn.__name__} failed: {str(e)}")
+                future.set_exception(e)
+
+    def _audio_call(self, fn, *args) -> concurrent.futures.Future:
+        """Queue fn(*args) on the audio thread and return a future for its result"""
+        future = concurrent.futures.Future()
+        self._audio_commands.put((future, fn, args, time.perf_counter()))
+        return future
+
+    # Silent sound songbird_calibrate_audio plays
+    CALIBRATION_SOUND_SECONDS = 0.05
+
+    def measure_trigger_latency(self, rounds: int) -> list:
+        """Seconds from a play request until the mixer has started the voice, once per round, through
+        play_sound_file with a short silent file - the path bound phrases take. An untimed first play
+        decodes it, as prewarming does for bound sounds"""
+        self.ensure_mixer()
+        frequency, _, channels = pygame.mixer.get_init()
+        filepath = os.path.join(self.get_download_folder(), 'calibration.wav')
+        with wave.open(filepath, 'wb') as f:
+            f.setnchannels(channels)
+            f.setsampwidth(2)
+            f.setframerate(frequency)
+            f.writeframes(bytes(int(frequency * self.CALIBRATION_SOUND_SECONDS) * channels * 2))
+        
+        samples = []
+        try:
+            for round_number in range(rounds + 1):
+                started = time.perf_counter()
+                handle = self.play_sound_file(filepath, 'calibration', record_play=False).result(self.AUDIO_COMMAND_TIMEOUT)
+                dispatched = time.perf_counter() - started
+                if handle is None:
+                    continue
+                self.stop_voices(handle).result(self.AUDIO_COMMAND_TIMEOUT)
+                if round_number:
+                    samples.append(dispatched)
+                    self.record_timing('calibration.dispatch', dispatched)
+        finally:
+            with self._sound_cache_lock:
+                if filepath in self._sound_cache:
+                    self._drop_decoded_sound(filepath)
+            os.remove(filepath)
+        return samples
+
+    def _prune_voices(self):
+        """Forget voices that have finished playing (audio thread)"""
+        for handle, voice in list(self._voices.items()):
+            if voice['paused']:
+                continue
+            if voice['kind'] == 'music':
+                finished = not pygame.mixer.music.get_busy()
+            else:
+                finished = not voice['channel'].get_busy() or voice['channel'].get_sound() is not voice['sound']
+            if finished:
+                del self._voices[handle]
+
+    def _register_voice(self, kind: str, name: str, channel=None, sound=None) -> int:
+        """Record a new voice and return its handle (audio thread)"""
+        handle = self._next_voice_handle
+        self._next_voice_handle += 1
+        self._voices[handle] = {
+            'kind': kind,
+            'name': name,
+            'channel': channel,
+            'sound': sound,
+            'volume': 1.0,
+            'paused': False,
+            'started': time.time()
+        }
+        return handle
+
+    def play_sound_file(self, filepath: str, name: str | None = None, record_play: bool = True) -> concurrent.futures.Future:
+        """Play a file - short sounds layer on mixer channels from the decoded cache, long ones stream
+        through music. The decoder thread decodes or reads the file and hands it to the audio thread, so
+        the caller (a hook thread for triggers) never decodes; the future resolves to the voice handle,
+        or None if everything was stopped meanwhile. record_play=False keeps it out of play history (calibration)"""
+        epoch = self._audio_epoch
+        name = name or os.path.basename(filepath)
+        future = concurrent.futures.Future()
+        self._decode_executor.submit(self._decode_and_play, filepath, name, epoch, future, record_play)
+        return future
+
+    def _decode_and_play(self, filepath: str, name: str, epoch: int, future: concurrent.futures.Future, record_play: bool):
+        """Decoder thread: load a file for play_sound_file and queue it on the audio thread"""
+        try:
+            self.ensure_mixer()  # The playback copy to use depends on the mixer's format
+            source = self.get_playback_path(filepath)
+            sound = self.get_decoded_sound(source)
+            if sound is not None:
+                started = self.play_decoded_sound(sound, name, epoch)
+            else:
+                with open(source, 'rb') as f:
+                    data = io.BytesIO(f.read())
+                started = self.play_music(data, os.path.splitext(source)[1].lstrip('.'), name, epoch)
+            if record_play:
+                self.mark_sound_played(filepath)
+        except Exception as e:
+            future.set_exception(e)  # Callers log the failure with their own context
+            return
+        
+        def relay(started):
+            if started.exception() is not None:
+                future.set_exception(started.exception())
+            else:
+                future.set_result(started.result())
+        started.add_done_callback(relay)
+
+    def play_decoded_sound(self, sound, name: str, epoch: int | None = None) -> concurrent.futures.Future:
+        """Play a decoded sound on a free channel, stealing the oldest voice when all are busy"""
+        return self._audio_call(self._engine_play_sound, sound, name, self._audio_epoch if epoch is None else epoch)
+
+    def play_music(self, source, namehint: str | None = None, name: str = '',
+                   epoch: int | None = None) -> concurrent.futures.Future:
+        """Stream a file object through pygame.mixer.music, replacing any current music voice"""
+        return self._audio_call(self._engine_play_music, source, namehint, name, self._audio_epoch if epoch is None else epoch)
+
+    def _engine_play_sound(self, sound, name: str, epoch: int):
+        if epoch != self._audio_epoch:
+            return None
+        self._prune_voices()
+        channel_handles = [handle for handle, voice in self._voices.items() if voice['kind'] == 'channel']
+        
+        channel = None
+        if len(channel_handles) < self.MAX_VOICES:
+            channel = pygame.mixer.find_channel()
+        if channel is None:
+            if channel_handles:
+                stolen = self._voices.pop(channel_handles[0])
+                channel = stolen['channel']
+                channel.stop()
+                log('info', f"SONGBIRD: All {self.MAX_VOICES} voices busy, stopped '{stolen['name']}' to play '{name}'")
+            else:
+                channel = pygame.mixer.find_channel(True)
+        
+        with self.time_phase('mixer.start'):
+            channel.play(sound)
+            channel.set_volume(self._master_volume)
+        return self._register_voice('channel', name, channel=channel, sound=sound)
+
+    def _engine_play_music(self, source, namehint: str | None, name: str, epoch: int):
+        if epoch != self._audio_epoch:
+            return None
+        for handle, voice in list(self._voices.items()):
+            if voice['kind'] == 'music':
+                self._release_music_source(voice)
+                del self._voices[handle]
+        
+        with self.time_phase('mixer.music_start'):
+            if namehint:
+                pygame.mixer.music.load(source, namehint)
+            else:
+                pygame.mixer.music.load(source)
+            pygame.mixer.music.set_volume(self._master_volume)
+            pygame.mixer.music.play()
+        if isinstance(source, ProgressiveSoundBuffer):
+            source.start_streaming()
+        return self._register_voice('music', name, sound=source)
+
+    def _release_music_source(self, voice: dict):
+        """Abort a still-downloading music source before the mixer stops reading it (audio thread).
+        SDL reads music with the audio device locked, so a read left waiting on the network would
+        hold up music.stop() and every other mixer call until the download ended."""
+        if isinstance(voice['sound'], ProgressiveSoundBuffer):
+            voice['sound'].abort()
+
+    def _target_voices(self, handle: int | None) -> list:
+        """Voices a control command applies to: one handle, or all of them (audio thread)"""
+        self._prune_voices()
+        if handle is None:
+            return list(self._voices.values())
+        voice = self._voices.get(handle)
+        return [voice] if voice else []
+
+    def _apply_voice_volume(self, voice: dict):
+        volume = self._master_volume * voice['volume']
+        if voice['kind'] == 'music':
+            pygame.mixer.music.set_volume(volume)
+        else:
+            voice['channel'].set_volume(volume)
+
+    def stop_voices(self, handle: int | None = None) -> concurrent.futures.Future:
+        """Stop one voice or all of them. The future resolves to how many were playing"""
+        if handle is None:
+            # Takes effect immediately for plays that are still loading or queued
+            self._audio_epoch += 1
+            self._trigger_scheduler.clear_voices()
+        return self._audio_call(self._engine_stop, handle)
+
+    def _engine_stop(self, handle: int | None):
+        voices = self._target_voices(handle)
+        for voice in voices:
+            if voice['kind'] == 'music':
+                self._release_music_source(voice)
+                pygame.mixer.music.stop()
+            else:
+                voice['channel'].stop()
+        if handle is None:
+            pygame.mixer.stop()
+            pygame.mixer.music.stop()
+            self._voices.clear()
+        self._prune_voices()
+        return len(voices)
+
+    def pause_voices(self, paused: bool, handle: int | None = None) -> concurrent.futures.Future:
+        """Pause or resume one voice or all of them. The future resolves to how many were affected"""
+        return self._audio_call(self._engine_pause, paused, handle)
+
+    def _engine_pause(self, paused: bool, handle: int | None):
+        voices = self._target_voices(handle)
+        for voice in voices:
+            if voice['kind'] == 'music':
+                pygame.mixer.music.pause() if paused else pygame.mixer.music.unpause()
+            else:
+                voice['channel'].pause() if paused else voice['channel'].unpause()
+            voice['paused'] = paused
+        return len(voices)
+
+    def get_playback_volume(self, handle: int | None = None) -> concurrent.futures.Future:
+        """Volume of one voice, or the master volume. The future resolves to None if the handle isn't playing"""
+        return self._audio_call(self._engine_get_volume, handle)
+
+    def _engine_get_volume(self, handle: int | None):
+        if handle is None:
+            return self._master_volume
+        voices = self._target_voices(handle)
+        return voices[0]['volume'] if voices else None
+
+    def set_playback_volume(self, volume: float, handle: int | None = None) -> concurrent.futures.Future:
+        """Set one voice's volume, or the master volume applied on top of every voice.
+        The future resolves to how many voices were affected"""
+        return self._audio_call(self._engine_set_volume, volume, handle)
+
+    def _engine_set_volume(self, volume: float, handle: int | None):
+        voices = self._target_voices(handle)
+        if handle is None:
+            self._master_volume = volume
+            pygame.mixer.music.set_volume(volume)
+        else:
+            for voice in voices:
+                voice['volume'] = volume
+        for voice in voices:
+            self._apply_voice_volume(voice)
+        return len(voices)
+
     def play_local_sound(self, sound_info: dict) -> str:
         """Play a local sound file using pygame"""
         try:
@@ -685,11 +3742,12 @@ class SONGBIRD(PluginBase):
                 return f"Sound file not found: {readable_name}"
             
             # Play the sound using pygame
-            pygame.mixer.music.load(filepath)
-            pygame.mixer.music.play()
+            handle = self.play_sound_file(filepath, readable_name).result(self.AUDIO_COMMAND_TIMEOUT)
+            if handle is None:
+                return f"Stopped before '{readable_name}' started"
             
-            log('info', f"SONGBIRD: Playing local sound: {readable_name}")
-            return f"Playing cached sound: '{readable_name}'"
+            log('info', f"SONGBIRD: Playing local sound: {readable_name} (handle {handle})")
+            return f"Playing cached sound: '{readable_name}' (handle {handle})"
             
         except Exception as e:
             log('error', f"SONGBIRD: Error playing local sound: {str(e)}")
@@ -697,6 +3755,7 @@ class SONGBIRD(PluginBase):
 
     def songbird_play_sound(self, args, projected_states) -> str:
         """Play sound using hybrid approach: cache for replay, Freesound for new sounds"""
+        started = time.perf_counter()
         try:
             sound_description = args.get('sound_description', '')
             replay_mode = args.get('replay_mode', 'auto')
@@ -716,6 +3775,7 @@ class SONGBIRD(PluginBase):
                 
                 if local_match is not None:
                     # Found in cache, play it
+                    self.count_metric('local_lookup.hits')
                     log('info', f"SONGBIRD: Playing from cache: {local_match['readable_name']}")
                     play_result = self.play_local_sound(local_match)
                     
@@ -724,11 +3784,12 @@ class SONGBIRD(PluginBase):
                         'sound_name': local_match['readable_name'],
                         'filepath': local_match['filepath'],
                         'description_used': sound_description,
-                        'username': 'Local Cache'
+                        'username': local_match.get('username') or 'Local Cache'
                     }
                     
                     return f"SONGBIRD: {play_result}"
                 else:
+                    self.count_metric('local_lookup.misses')
                     log('info', f"SONGBIRD: No cached sound found, falling back to Freesound")
             else:
                 log('info', f"SONGBIRD: Using Freesound for new/different sound")
@@ -738,65 +3799,314 @@ class SONGBIRD(PluginBase):
             if not api_key:
                 return "SONGBIRD: Please create api_key.txt file in the Songbird plugin folder with your Freesound API key."
             
-            # Get varied results from multiple pages
-            all_results = self.get_varied_freesound_results(sound_description, api_key)
+            # A sound prefetched for this topic plays straight from disk
+            query = self.normalize_search_query(sound_description)
+            prefetched = self.take_prefetched_sound(query)
+            if prefetched is not None:
+                self.count_metric('prefetch.hits')
+                play_result = self.play_local_sound({'filepath': prefetched['filepath'], 'readable_name': prefetched['sound_name']})
+                
+                self.current_playing = {
+                    'sound_data': prefetched['sound_data'],
+                    'sound_name': prefetched['sound_name'],
+                    'username': prefetched['username'],
+                    'description_used': sound_description,
+                    'filepath': prefetched['filepath']
+                }
+                self.last_played_description = sound_description
+                
+                # Top the prefetch slots back up
+                self.schedule_prefetch(query, self.get_cached_search_results(query) or [])
+                
+                log('info', f"SONGBIRD: Played prefetched sound: {prefetched['sound_name']}")
+                return f"SONGBIRD: Found '{prefetched['sound_name']}' by {prefetched['username']}. {play_result}"
+            
+            # Searching and downloading can take a while - do it in the background
+            job_id = self.submit_play_job(sound_description, query, api_key)
+            return (f"SONGBIRD: Looking for '{sound_description}' on Freesound (request {job_id}). "
+                    f"It will start playing as soon as it's ready.")
+            
+        except Exception as e:
+            log('error', f"SONGBIRD error: {str(e)}")
+            return f"SONGBIRD: Error - {str(e)}"
+        finally:
+            # Time until the assistant gets its answer, whichever path was taken
+            self.record_timing('play_sound.ack', time.perf_counter() - started)
+
+    # Finished play jobs kept for songbird_job_status
+    PLAY_JOB_HISTORY = 20
+
+    def submit_play_job(self, sound_description: str, query: str, api_key: str) -> int:
+        """Queue a Freesound search/download/play job, superseding any older unfinished one. Returns the job id"""
+        with self._play_jobs_lock:
+            # Only the newest request matters - older ones stop at their next checkpoint
+            for job in self._play_jobs.values():
+                if job['status'] in ('pending', 'running'):
+                    job['cancel'].set()
+                    job['status'] = 'superseded'
+                    job['finished'] = time.time()
+            
+            job_id = self._next_play_job_id
+            self._next_play_job_id += 1
+            job = {
+                'id': job_id,
+                'description': sound_description,
+                'status': 'pending',
+                'result': None,
+                'created': time.time(),
+                'finished': None,
+                'cancel': threading.Event()
+            }
+            self._play_jobs[job_id] = job
+            
+            # Forget the oldest finished jobs
+            finished_ids = [jid for jid, old in self._play_jobs.items() if old['finished'] is not None]
+            for jid in finished_ids[:max(0, len(finished_ids) - self.PLAY_JOB_HISTORY)]:
+                del self._play_jobs[jid]
+        
+        self._play_jobs_executor.submit(self._run_play_job, job, query, api_key)
+        log('info', f"SONGBIRD: Queued play request {job_id} for '{sound_description}'")
+        return job_id
+
+    def cancel_play_jobs(self) -> int:
+        """Cancel every play job that hasn't started playing. Returns how many were cancelled"""
+        cancelled = 0
+        with self._play_jobs_lock:
+            for job in self._play_jobs.values():
+                if job['status'] in ('pending', 'running'):
+                    job['cancel'].set()
+                    job['status'] = 'cancelled'
+                    job['finished'] = time.time()
+                    cancelled += 1
+        if cancelled:
+            log('info', f"SONGBIRD: Cancelled {cancelled} play request(s)")
+        return cancelled
+
+    def _finish_play_job(self, job: dict, status: str, result: str):
+        with self._play_jobs_lock:
+            # A cancel/supersede that already happened wins
+            if job['finished'] is None:
+                job['status'] = status
+                job['finished'] = time.time()
+            job['result'] = result
+        if status == 'done':
+            self.record_timing('play_job.total', job['finished'] - job['created'])
+        self.count_metric(f"play_jobs.{job['status']}")
+        log('info', f"SONGBIRD: Play request {job['id']} {job['status']}: {result}")
+
+    def _run_play_job(self, job: dict, query: str, api_key: str):
+        """Search Freesound, pick a sound, download and play it - stopping early if the job is cancelled"""
+        cancel = job['cancel']
+        sound_description = job['description']
+        try:
+            with self._play_jobs_lock:
+                if cancel.is_set():
+                    return
+                job['status'] = 'running'
+            self.record_timing('play_job.queue_wait', time.time() - job['created'])
+            
+            # Get varied results from the search cache or multiple Freesound pages
+            all_results = self.get_freesound_pool(sound_description, api_key)
             
             if not all_results or (len(all_results) == 1 and "error" in all_results[0]):
                 if all_results and "error" in all_results[0]:
                     error = all_results[0]["error"]
                     if error == "Invalid API key":
-                        return "SONGBIRD: Invalid Freesound API key. Please check your api_key.txt file."
-                    return f"SONGBIRD: Search failed - {error}"
-                return f"SONGBIRD: No sounds found for '{sound_description}'. Try a different description."
+                        return self._finish_play_job(job, 'failed', "Invalid Freesound API key. Please check your api_key.txt file.")
+                    return self._finish_play_job(job, 'failed', f"Search failed - {error}")
+                return self._finish_play_job(job, 'failed', f"No sounds found for '{sound_description}'. Try a different description.")
+            
+            if cancel.is_set():
+                return self._finish_play_job(job, 'cancelled', "Cancelled before download")
             
-            # Always use random selection for variety
-            selected_sound = self.select_random_sound(all_results)
+            # Always use random selection for variety, skipping sounds already downloaded
+            selected_sound = self.select_random_sound(all_results, self.get_cached_freesound_ids())
             
             if "error" in selected_sound:
-                return f"SONGBIRD: Error selecting sound - {selected_sound['error']}"
+                return self._finish_play_job(job, 'failed', f"Error selecting sound - {selected_sound['error']}")
             
             sound_name = selected_sound.get('name', 'Unknown')
             username = selected_sound.get('username', 'Unknown')
             
             # Download and play the sound
-            play_result = self.download_and_play_sound(selected_sound)
-            
-            # Build filepath for tracking
-            plugin_folder = self.get_plugin_folder_path()
-            sounds_folder = os.path.join(plugin_folder, 'sounds')
-            sound_id = selected_sound.get('id', 'unknown')
-            safe_name = "".join(c for c in sound_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            
-            # Determine file extension
-            previews = selected_sound.get('previews', {})
-            file_extension = '.mp3'
-            if 'preview-hq-mp3' in previews or 'preview-lq-mp3' in previews:
-                file_extension = '.mp3'
-            elif 'preview-hq-ogg' in previews or 'preview-lq-ogg' in previews:
-                file_extension = '.ogg'
-            
-            filename = f"{safe_name}_{sound_id}{file_extension}"
-            filepath = os.path.join(sounds_folder, filename)
-            
-            # Track current playing sound for binding system
-            self.current_playing = {
+            saved = concurrent.futures.Future()
+            with self.time_phase('play_job.download_and_start'):
+                play_status, play_result = self.download_and_play_sound(selected_sound, should_cancel=cancel.is_set,
+                                                                        on_saved=saved.set_result)
+            
+            # Nothing played - don't offer it for binding or download more like it
+            if play_status != 'done':
+                return self._finish_play_job(job, play_status, f"'{sound_name}' by {username}: {play_result}")
+            
+            # Track current playing sound for binding system. Large previews are still downloading,
+            # so the file is only offered for binding once it is in place
+            playing = {
                 'sound_data': selected_sound,
                 'sound_name': sound_name,
                 'username': username,
                 'description_used': sound_description,
-                'filepath': filepath
+                'filepath': None,
+                'saving': saved
             }
+            self.current_playing = playing
             
             # Track last played for replay functionality
             self.last_played_description = sound_description
             
-            log('info', f"SONGBIRD: Set current playing sound: {sound_name}")
+            def publish_saved_path(saved):
+                saved_path = saved.result()
+                if saved_path:
+                    playing['filepath'] = saved_path
+                    log('info', f"SONGBIRD: Set current playing sound: {sound_name}")
+                else:
+                    log('warning', f"SONGBIRD: '{sound_name}' played but wasn't saved, so it can't be bound")
+            
+            saved.add_done_callback(publish_saved_path)
+            
+            # Get the next "another" ready in the background
+            self.schedule_prefetch(query, all_results)
             
-            return f"SONGBIRD: Found '{sound_name}' by {username}. {play_result}"
+            self._finish_play_job(job, 'done', f"Found '{sound_name}' by {username}. {play_result}")
             
         except Exception as e:
-            log('error', f"SONGBIRD error: {str(e)}")
-            return f"SONGBIRD: Error - {str(e)}"
+            log('error', f"SONGBIRD play request error: {str(e)}")
+            self._finish_play_job(job, 'failed', f"Error - {str(e)}")
+
+    def songbird_job_status(self, args, projected_states) -> str:
+        """Report pending and recently finished Freesound play requests"""
+        try:
+            job_id = args.get('job_id')
+            with self._play_jobs_lock:
+                if job_id is not None:
+                    jobs = [self._play_jobs[job_id]] if job_id in self._play_jobs else []
+                    if not jobs:
+                        return f"SONGBIRD: No sound request {job_id}"
+                else:
+                    jobs = list(self._play_jobs.values())
+                
+                if not jobs:
+                    return "SONGBIRD: No sound requests yet"
+                
+                lines = []
+                for job in reversed(jobs):
+                    line = f"- Request {job['id']} '{job['description']}': {job['status']}"
+                    if job['result']:
+                        line += f" - {job['result']}"
+                    lines.append(line)
+            
+            pending = sum(1 for job in jobs if job['status'] in ('pending', 'running'))
+            return f"SONGBIRD: {pending} sound request(s) in progress:\n" + "\n".join(lines)
+            
+        except Exception as e:
+            log('error', f"SONGBIRD job status error: {str(e)}")
+            return f"SONGBIRD: Error getting request status - {str(e)}"
+
+    def songbird_stats(self, args, projected_states) -> str:
+        """Report phase latency percentiles and counters since the last reset"""
+        try:
+            snapshot = self.get_metrics_snapshot()
+            if args.get('reset'):
+                self.reset_metrics()
+            
+            elapsed = int(time.time() - snapshot['since'])
+            lines = [f"SONGBIRD: Stats for the last {elapsed // 60} min {elapsed % 60} s"]
+            
+            if snapshot['timings']:
+                lines.append("Latency (ms) - count, p50, p95, p99, max:")
+                for phase, timing in sorted(snapshot['timings'].items()):
+                    lines.append(f"- {phase}: {timing['count']}, {timing['p50_ms']:.0f}, {timing['p95_ms']:.0f}, "
+                                 f"{timing['p99_ms']:.0f}, {timing['max_ms']:.0f}")
+            else:
+                lines.append("No timed activity yet.")
+            
+            counters = {name: value for name, value in snapshot['counters'].items() if value}
+            if counters:
+                lines.append("Counters:")
+                for name, value in sorted(counters.items()):
+                    lines.append(f"- {name}: {value}")
+            
+            if args.get('reset'):
+                lines.append("Statistics reset.")
+            return "\n".join(lines)
+            
+        except Exception as e:
+            log('error', f"SONGBIRD stats error: {str(e)}")
+            return f"SONGBIRD: Error getting stats - {str(e)}"
+
+    def generate_status(self, projected_states) -> list:
+        """Short status for the assistant's context: requests in flight and recent playback latency"""
+        try:
+            with self._play_jobs_lock:
+                pending = [job['description'] for job in self._play_jobs.values() if job['status'] in ('pending', 'running')]
+            
+            parts = []
+            if pending:
+                parts.append(f"Fetching from Freesound: {', '.join(pending)}")
+            
+            with self._metrics_lock:
+                summary = [(label, self._metrics_timings.get(phase))
+                           for label, phase in (('play request reply', 'play_sound.ack'), ('Freesound play', 'play_job.total'))]
+                latencies = [f"{label} p95 {self._histogram_percentile(histogram, 95):.0f} ms"
+                             for label, histogram in summary if histogram]
+            if latencies:
+                parts.append("Latency: " + ", ".join(latencies))
+            
+            triggered = self.get_recent_triggers()
+            if triggered:
+                parts.append("Already played for the user's words, don't replay: " + ", ".join(f"'{phrase}'" for phrase in triggered))
+            
+            if not parts:
+                return []
+            return [("Songbird sound effects", "; ".join(parts))]
+            
+        except Exception as e:
+            log('error', f"SONGBIRD status error: {str(e)}")
+            return []
+
+    def songbird_calibrate_audio(self, args, projected_states) -> str:
+        """Time play request -> voice started with the configured (or trial) mixer settings, and give a
+        dispatch time + nominal buffer estimate of when it's heard (not a measurement of audible output)"""
+        try:
+            configured = self.get_mixer_settings()
+            trial = self._mixer_config_from(args.get('sample_rate') or configured[0],
+                                            args.get('channels') or configured[1],
+                                            args.get('buffer_size') or configured[2])
+            rounds = max(1, min(100, int(args.get('rounds') or self.CALIBRATION_ROUNDS)))
+            log('info', f"SONGBIRD: Calibrating audio latency with {trial} over {rounds} plays")
+            
+            try:
+                self.apply_mixer_settings(trial, trial=trial != configured)
+                sample_rate, channels, buffer_size = self._mixer_config
+                samples = sorted(self.measure_trigger_latency(rounds))
+            finally:
+                # A trial only lasts for the measurement
+                if trial != configured:
+                    self.apply_mixer_settings(configured)
+                self.prewarm_bound_sounds()
+            
+            if not samples:
+                return "SONGBIRD: Calibration failed - the mixer never started the test sound"
+            
+            def percentile(p):
+                return samples[min(len(samples) - 1, int(len(samples) * p / 100))] * 1000
+            buffer_ms = buffer_size / sample_rate * 1000
+            lines = [
+                f"SONGBIRD: Audio calibration at {sample_rate} Hz, {channels} channel{'s' if channels > 1 else ''}, buffer {buffer_size} frames",
+                f"- Play request to voice started over {len(samples)} plays: p50 {percentile(50):.2f} ms, p95 {percentile(95):.2f} ms, max {samples[-1] * 1000:.2f} ms",
+                f"- Estimate from dispatch time + nominal buffer ({buffer_ms:.1f} ms): about {percentile(50) + buffer_ms:.1f} ms "
+                f"(p95 {percentile(95) + buffer_ms:.1f} ms) from request to sound. Not measured at the speakers - "
+                "the sound card and driver add their own delay"
+            ]
+            if trial != configured:
+                lines.append(f"- These were trial settings; the mixer is back on {configured[0]} Hz, {configured[1]} channels, buffer {configured[2]} frames. "
+                             "To keep them, change COVAS settings -> SONGBIRD -> Audio Output")
+            else:
+                lines.append("- If sounds crackle or stutter, raise the buffer; if they're clean, try a smaller one")
+            return "\n".join(lines)
+            
+        except Exception as e:
+            log('error', f"SONGBIRD calibration error: {str(e)}")
+            return f"SONGBIRD: Calibration error - {str(e)}"
 
     def songbird_test(self, args, projected_states) -> str:
         try:
@@ -814,6 +4124,15 @@ class SONGBIRD(PluginBase):
             else:
                 result = f"SONGBIRD Test: {name} v{version} - Active but no API key found. Create api_key.txt in: {plugin_folder}"
             
+            budget = self.get_sounds_budget_bytes()
+            if self._sounds_folder_bytes is not None:
+                result += (f" Sounds folder: {self._sounds_folder_bytes // (1024 * 1024)} MB of "
+                           f"{f'{budget // (1024 * 1024)} MB' if budget else 'unlimited'}, {self._evicted_count} evicted this session.")
+            
+            cache_stats = self.get_sound_cache_stats()
+            result += (f" Decoded sound cache: {cache_stats['sounds']} sounds, {cache_stats['bytes'] // (1024 * 1024)} MB,"
+                       f" {cache_stats['hits']} hits, {cache_stats['misses']} misses, {cache_stats['evictions']} evictions.")
+            
             log('info', 'SONGBIRD: Test completed')
             return result
             
@@ -821,34 +4140,455 @@ class SONGBIRD(PluginBase):
             log('error', f"SONGBIRD test error: {str(e)}")
             return f"SONGBIRD: Test failed - {str(e)}"
 
+    # Journal records to accumulate before folding them back into bound_sounds.json
+    BOUND_JOURNAL_COMPACT_EVERY = 50
+
     def get_bound_sounds_file(self) -> str:
         """Get path to bound sounds configuration file"""
         plugin_folder = self.get_plugin_folder_path()
         return os.path.join(plugin_folder, 'bound_sounds.json')
 
+    def get_bound_journal_file(self) -> str:
+        """Get path to the append-only journal of binding changes not yet compacted into bound_sounds.json"""
+        plugin_folder = self.get_plugin_folder_path()
+        return os.path.join(plugin_folder, 'bound_sounds.journal')
+
+    def _stat_bound_sounds_file(self):
+        """(mtime_ns, size) of bound_sounds.json, or None if it doesn't exist"""
+        try:
+            stat = os.stat(self.get_bound_sounds_file())
+            return (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return None
+
+    def _ensure_bound_sounds(self) -> dict:
+        """Return the in-memory bindings, (re)loading them if missing or bound_sounds.json was edited externally"""
+        with self._bound_lock:
+            file_stat = self._stat_bound_sounds_file()
+            if self._bound_sounds is not None and file_stat == self._bound_file_stat:
+                return self._bound_sounds
+            
+            bound_sounds = {}
+            try:
+                if file_stat is not None:
+                    with open(self.get_bound_sounds_file(), 'r', encoding='utf-8') as f:
+                        bound_sounds = json.load(f)
+            except Exception as e:
+                log('error', f"SONGBIRD: Error loading bound sounds: {str(e)}")
+                bound_sounds = {}
+            
+            # Upgrade old single-sound entries to the list format
+            for phrase, data in bound_sounds.items():
+                if not isinstance(data, list):
+                    bound_sounds[phrase] = [data]
+            
+            replayed = self._replay_bound_journal(bound_sounds)
+            
+            if self._bound_sounds is not None:
+                log('info', 'SONGBIRD: bound_sounds.json changed on disk, reloaded bindings')
+            log('info', f"SONGBIRD: Loaded {len(bound_sounds)} bound phrases ({replayed} journal records)")
+            
+            self._bound_sounds = bound_sounds
+            self._bound_file_stat = file_stat
+            self._bound_journal_records = replayed
+            self._phrase_automaton.sync(bound_sounds)
+            return self._bound_sounds
+
+    def _apply_bound_record(self, bound_sounds: dict, record: dict):
+        """Apply one journal record to a bindings dict"""
+        op = record.get('op')
+        if op == 'set':
+            bound_sounds[record['phrase']] = record['sounds']
+        elif op == 'delete':
+            bound_sounds.pop(record['phrase'], None)
+        elif op == 'clear':
+            bound_sounds.clear()
+
+    def _replay_bound_journal(self, bound_sounds: dict) -> int:
+        """Apply journal records on top of the loaded snapshot. Returns the number of records applied"""
+        journal_file = self.get_bound_journal_file()
+        if not os.path.exists(journal_file):
+            return 0
+        
+        replayed = 0
+        with open(journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn final write from a crash - everything before it is intact
+                    log('warning', 'SONGBIRD: Skipping unreadable record in bound sounds journal')
+                    continue
+                self._apply_bound_record(bound_sounds, record)
+                replayed += 1
+        return replayed
+
+    def _commit_bound_record(self, record: dict) -> bool:
+        """Durably append a change to the journal, apply it in memory, and compact when the journal grows"""
+        try:
+            with self._bound_lock:
+                bound_sounds = self._ensure_bound_sounds()
+                
+                with open(self.get_bound_journal_file(), 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                    f.flush()
+                    os.fsync(f.fileno())
+                
+                self._apply_bound_record(bound_sounds, record)
+                self._bound_journal_records += 1
+                
+                # Patch the phrase automaton for just this change
+                op = record.get('op')
+                if op == 'set':
+                    self._phrase_automaton.add(record['phrase'])
+                elif op == 'delete':
+                    self._phrase_automaton.remove(record['phrase'])
+                elif op == 'clear':
+                    self._phrase_automaton.sync(())
+                
+                if self._bound_journal_records >= self.BOUND_JOURNAL_COMPACT_EVERY:
+                    self.save_bound_sounds(bound_sounds)
+                return True
+        except Exception as e:
+            log('error', f"SONGBIRD: Error saving bound sounds: {str(e)}")
+            return False
+
     def load_bound_sounds(self) -> dict:
-        """Load bound sounds from configuration file"""
+        """Snapshot of all bindings (phrase -> list of sound entries)"""
         try:
-            bound_file = self.get_bound_sounds_file()
-            if os.path.exists(bound_file):
-                with open(bound_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return {}
+            with self._bound_lock:
+                return {phrase: list(sounds) for phrase, sounds in self._ensure_bound_sounds().items()}
         except Exception as e:
             log('error', f"SONGBIRD: Error loading bound sounds: {str(e)}")
             return {}
 
+    def get_bound_sound_list(self, normalized_phrase: str):
+        """Sound entries bound to a normalized phrase, or None. Treat the returned list as read-only"""
+        with self._bound_lock:
+            return self._ensure_bound_sounds().get(normalized_phrase)
+
+    def set_bound_phrase(self, normalized_phrase: str, sounds: list) -> bool:
+        """Replace the sounds bound to a phrase"""
+        if not self._commit_bound_record({'op': 'set', 'phrase': normalized_phrase, 'sounds': sounds}):
+            return False
+        self.prewarm_bound_sounds(sounds)
+        return True
+
+    def remove_bound_phrase(self, normalized_phrase: str) -> bool:
+        """Remove a phrase binding"""
+        return self._commit_bound_record({'op': 'delete', 'phrase': normalized_phrase})
+
+    def clear_bound_sounds(self) -> bool:
+        """Remove all phrase bindings"""
+        return self._commit_bound_record({'op': 'clear'})
+
     def save_bound_sounds(self, bound_sounds: dict) -> bool:
-        """Save bound sounds to configuration file"""
+        """Atomically write a full bindings snapshot to bound_sounds.json and reset the journal"""
         try:
-            bound_file = self.get_bound_sounds_file()
-            with open(bound_file, 'w', encoding='utf-8') as f:
-                json.dump(bound_sounds, f, indent=2, ensure_ascii=False)
-            return True
+            with self._bound_lock:
+                if not self._write_json_atomic(self.get_bound_sounds_file(), bound_sounds, indent=2):
+                    return False
+                
+                # Journal records are idempotent, so a crash before this truncate only replays them again
+                open(self.get_bound_journal_file(), 'w', encoding='utf-8').close()
+                
+                if bound_sounds is not self._bound_sounds:
+                    self._bound_sounds = {phrase: list(sounds) for phrase, sounds in bound_sounds.items()}
+                    self._phrase_automaton.sync(self._bound_sounds)
+                self._bound_file_stat = self._stat_bound_sounds_file()
+                self._bound_journal_records = 0
+                log('info', f"SONGBIRD: Compacted bound sounds ({len(bound_sounds)} phrases)")
+                return True
         except Exception as e:
             log('error', f"SONGBIRD: Error saving bound sounds: {str(e)}")
             return False
 
+    # Words that may surround a bound phrase without making the message more than a trigger
+    PHRASE_TRIGGER_FILLER_WORDS = {'a', 'an', 'the', 'and', 'then', 'now', 'please', 'again', 'ok', 'okay',
+                                   'hey', 'oh', 'uh', 'um', 'yeah', 'yes', 'go', 'covas', 'computer'}
+    # Words that make a message about a binding rather than a trigger ("unbind kaboom", "what is bound to kaboom")
+    PHRASE_TRIGGER_COMMAND_WORDS = {'bind', 'bound', 'binding', 'bindings', 'unbind', 'rebind', 'replay',
+                                    'list', 'stop', 'remove', 'delete'}
+    # Seconds during which songbird_replay_bound for a phrase that just fired is absorbed instead of playing twice
+    PHRASE_TRIGGER_REPLAY_GRACE_SECONDS = 10
+    # Bound phrases fired by a single message
+    PHRASE_TRIGGER_MAX_PER_MESSAGE = 3
+    # User messages remembered so the prompt and should-reply hooks fire each one only once
+    PHRASE_TRIGGER_EVENTS_KEPT = 32
+    # Trigger storm control: repeats of one trigger within the coalescing window count as the same play,
+    # within the debounce window they are dropped; overall rate (token bucket) and overlapping triggered sounds are capped
+    TRIGGER_COALESCE_SECONDS = 0.3
+    TRIGGER_DEBOUNCE_SECONDS = 1.5
+    TRIGGER_RATE_PER_SECOND = 3
+    TRIGGER_BURST = 6
+    TRIGGER_MAX_VOICES = 4
+    # Assumed length of a triggered sound neither decoded nor catalogued
+    TRIGGER_VOICE_SECONDS_DEFAULT = 2.0
+
+    def get_sound_length(self, filepath: str) -> float:
+        """Length of a sound in seconds, from the decoded cache or the catalog"""
+        with self._sound_cache_lock:
+            cached = self._sound_cache.get(self.get_playback_path(filepath))
+        if cached is not None:
+            return cached[0].get_length()
+        metadata = self.get_sound_metadata(filepath)
+        if metadata is not None and metadata['duration']:
+            return metadata['duration']
+        return self.TRIGGER_VOICE_SECONDS_DEFAULT
+
+    def admit_trigger(self, key: str, filepath: str, debounce: float | None = None) -> str:
+        """Run a trigger past the scheduler, counting what it held back"""
+        verdict = self._trigger_scheduler.admit(key, self.get_sound_length(filepath), debounce)
+        if verdict == TriggerScheduler.COALESCED:
+            self.count_metric('triggers.coalesced')
+        elif verdict != TriggerScheduler.PLAY:
+            self.count_metric('triggers.dropped')
+            self.count_metric(f'triggers.dropped.{verdict}')
+            log('debug', f"SONGBIRD: Trigger {key} dropped ({verdict})")
+        return verdict
+
+    def match_bound_phrases(self, text: str) -> tuple:
+        """Bound phrases said in a transcript, leftmost-longest and non-overlapping, and whether the
+        transcript was nothing but those phrases and filler words. None fire when the rest of the
+        transcript holds a command word - the phrase is then being talked about, not said"""
+        with self._bound_lock:
+            # Picks up external edits to bound_sounds.json
+            self._ensure_bound_sounds()
+        words = self.normalize_phrase(text).split()
+        matches = self._phrase_automaton.find(words)
+        if not matches:
+            return [], False
+        
+        matches.sort(key=lambda match: (match[0], match[0] - match[1]))
+        phrases = []
+        covered = [False] * len(words)
+        end = 0
+        for start, stop, phrase in matches:
+            if start < end:
+                continue
+            if phrase not in phrases:
+                phrases.append(phrase)
+            covered[start:stop] = [True] * (stop - start)
+            end = stop
+        
+        uncovered = [word for word, hit in zip(words, covered) if not hit]
+        if any(word in self.PHRASE_TRIGGER_COMMAND_WORDS for word in uncovered):
+            return [], False
+        leftover = sum(1 for word in uncovered if word not in self.PHRASE_TRIGGER_FILLER_WORDS)
+        return phrases[:self.PHRASE_TRIGGER_MAX_PER_MESSAGE], leftover == 0
+
+    def handle_user_utterance(self, event) -> tuple:
+        """Fire bound phrases in a final user transcript, once per event however many hooks see it.
+        Returns (phrases fired, message was only phrases)"""
+        if not isinstance(event, ConversationEvent) or event.kind != 'user':
+            return [], False
+        if not self.get_setting('triggers', 'instant_phrase_triggers', True):
+            return [], False
+        
+        with self._phrase_trigger_lock:
+            seen = self._phrase_trigger_events.get(id(event))
+            if seen is not None and seen[0] is event:
+                return seen[1]
+            match = self.match_bound_phrases(event.content or '')
+            self._phrase_trigger_events[id(event)] = (event, match)
+            while len(self._phrase_trigger_events) > self.PHRASE_TRIGGER_EVENTS_KEPT:
+                self._phrase_trigger_events.popitem(last=False)
+        
+        for phrase in match[0]:
+            self.trigger_bound_phrase(phrase)
+        return match
+
+    def start_bound_sound(self, key: str, sounds: list, timing_phase: str, started: float,
+                          debounce: float | None = None) -> dict | None:
+        """Start one of a binding's sounds at random without waiting for it to begin playing, timing
+        from started until the mixer has it. Returns the chosen entry, or None if its file is gone
+        or the trigger scheduler held it back"""
+        selected = random.choice(sounds)
+        filepath = self.resolve_bound_filepath(selected)
+        if not os.path.exists(filepath):
+            log('warning', f"SONGBIRD: Bound sound file not found: {selected['sound_name']}")
+            return None
+        if self.admit_trigger(key, filepath, debounce) != TriggerScheduler.PLAY:
+            return None
+        
+        def on_started(future):
+            if future.exception() is not None:
+                log('error', f"SONGBIRD: Could not play bound sound {selected['sound_name']}: {str(future.exception())}")
+            elif future.result() is not None:
+                self.record_timing(timing_phase, time.perf_counter() - started)
+        self.play_sound_file(filepath, selected['sound_name']).add_done_callback(on_started)
+        return selected
+
+    def trigger_bound_phrase(self, phrase: str) -> bool:
+        """Start a sound bound to a phrase without waiting for it to begin playing"""
+        started = time.perf_counter()
+        try:
+            sounds = self.get_bound_sound_list(phrase)
+            if not sounds:
+                return False
+            selected = self.start_bound_sound(f"phrase:{phrase}", sounds, 'phrase_trigger', started)
+            if selected is None:
+                return False
+            with self._phrase_trigger_lock:
+                self._recent_triggers[phrase] = started
+            
+            self.count_metric('phrase_triggers.fired')
+            log('info', f"SONGBIRD: Instant trigger '{phrase}' -> {selected['sound_name']}")
+            return True
+            
+        except Exception as e:
+            self.count_metric('phrase_triggers.failures')
+            log('error', f"SONGBIRD: Instant trigger error for '{phrase}': {str(e)}")
+            return False
+
+    def take_recent_trigger(self, phrase: str) -> bool:
+        """True once if an utterance fired this phrase within the grace period"""
+        with self._phrase_trigger_lock:
+            fired = self._recent_triggers.pop(phrase, None)
+        return fired is not None and time.perf_counter() - fired < self.PHRASE_TRIGGER_REPLAY_GRACE_SECONDS
+
+    def get_recent_triggers(self) -> list:
+        """Phrases fired by utterances within the grace period, oldest first"""
+        now = time.perf_counter()
+        with self._phrase_trigger_lock:
+            for phrase in [phrase for phrase, fired in self._recent_triggers.items()
+                           if now - fired >= self.PHRASE_TRIGGER_REPLAY_GRACE_SECONDS]:
+                del self._recent_triggers[phrase]
+            return sorted(self._recent_triggers, key=self._recent_triggers.get)
+
+    def phrase_trigger_prompt_handler(self, event) -> list:
+        """Prompt event hook: play bound phrases the moment the user's transcript arrives"""
+        try:
+            self.handle_user_utterance(event)
+        except Exception as e:
+            log('error', f"SONGBIRD: Phrase trigger error: {str(e)}")
+        return []
+
+    def phrase_trigger_should_reply(self, event, projected_states):
+        """Should-reply hook: fire bound phrases, and keep the assistant quiet for a bare trigger if configured"""
+        try:
+            phrases, phrase_only = self.handle_user_utterance(event)
+            if phrases and phrase_only and self.get_setting('triggers', 'suppress_reply_on_trigger', False):
+                return False
+        except Exception as e:
+            log('error', f"SONGBIRD: Phrase trigger error: {str(e)}")
+        return None
+
+    def get_event_bindings_file(self) -> str:
+        """Get path to the game event bindings file"""
+        plugin_folder = self.get_plugin_folder_path()
+        return os.path.join(plugin_folder, 'event_bindings.json')
+
+    def _ensure_event_bindings(self) -> list:
+        """Return the in-memory event bindings, loading them and compiling the dispatch table on first use"""
+        with self._event_bindings_lock:
+            if self._event_bindings is not None:
+                return self._event_bindings
+            
+            bindings = []
+            try:
+                if os.path.exists(self.get_event_bindings_file()):
+                    with open(self.get_event_bindings_file(), 'r', encoding='utf-8') as f:
+                        bindings = json.load(f)
+            except Exception as e:
+                log('error', f"SONGBIRD: Error loading event bindings: {str(e)}")
+                bindings = []
+            
+            self._event_dispatch = self._compile_event_dispatch(bindings)
+            self._event_bindings = bindings
+            log('info', f"SONGBIRD: Loaded {len(bindings)} game event bindings")
+            return self._event_bindings
+
+    def load_event_bindings(self) -> list:
+        """Snapshot of all game event bindings"""
+        with self._event_bindings_lock:
+            return [dict(binding, sounds=list(binding['sounds'])) for binding in self._ensure_event_bindings()]
+
+    def save_event_bindings(self, bindings: list) -> bool:
+        """Write the event bindings and swap in a freshly compiled dispatch table"""
+        with self._event_bindings_lock:
+            if not self._write_json_atomic(self.get_event_bindings_file(), bindings, indent=2):
+                return False
+            # Readers pick up the new table with a single reference swap, never a half-built one
+            self._event_dispatch = self._compile_event_dispatch(bindings)
+            self._event_bindings = bindings
+            return True
+
+    def _event_field_value(self, value) -> str:
+        """Journal field value in the form predicates compare against"""
+        return ' '.join(str(value).lower().split())
+
+    def _compile_event_dispatch(self, bindings: list) -> dict:
+        """Event name -> (unconditional binding, {first predicate field: {value: [bindings]}}), so an
+        event costs one hash lookup plus one per predicate field used on that event name"""
+        table = {}
+        for binding in bindings:
+            if not binding.get('sounds'):
+                continue
+            _, keyed = table.setdefault(binding['event'].lower(), (None, {}))
+            where = sorted(binding.get('where', {}).items())
+            if not where:
+                table[binding['event'].lower()] = (binding, keyed)
+                continue
+            field, value = where[0]
+            keyed.setdefault(field, {}).setdefault(value, []).append(binding)
+        return table
+
+    def match_event_binding(self, content: dict) -> dict | None:
+        """The binding for a journal entry, preferring the one with the most matching conditions"""
+        name = content.get('event')
+        entry = self._event_dispatch.get(name.lower()) if isinstance(name, str) else None
+        if entry is None:
+            return None
+        
+        unconditional, keyed = entry
+        best = None
+        for field, by_value in keyed.items():
+            if field not in content:
+                continue
+            for binding in by_value.get(self._event_field_value(content[field]), ()):
+                where = binding['where']
+                if (best is None or len(where) > len(best['where'])) and all(
+                        key in content and self._event_field_value(content[key]) == value for key, value in where.items()):
+                    best = binding
+        return best or unconditional
+
+    def dispatch_game_event(self, event, projected_states):
+        """Side effect: play the sound bound to a live game event straight from the decoded cache"""
+        if not isinstance(event, GameEvent) or event.historic:
+            return
+        started = time.perf_counter()
+        try:
+            if self._event_bindings is None:
+                self._ensure_event_bindings()
+            binding = self.match_event_binding(event.content)
+            if binding is None:
+                return
+            selected = self.start_bound_sound(f"event:{self._describe_event_binding(binding['event'], binding['where'])}",
+                                              binding['sounds'], 'event_trigger', started, binding.get('cooldown_seconds'))
+            if selected is not None:
+                self.count_metric('event_triggers.fired')
+                log('info', f"SONGBIRD: Game event {binding['event']} -> {selected['sound_name']}")
+        except Exception as e:
+            self.count_metric('event_triggers.failures')
+            log('error', f"SONGBIRD: Game event trigger error: {str(e)}")
+
+    def get_unsaved_playing_reason(self):
+        """Why the sound that just played can't be bound yet (its download hasn't landed in the sounds
+        folder, or never will), or None"""
+        saving = (self.current_playing or {}).get('saving')
+        if saving is None:
+            return None
+        sound_name = self.current_playing.get('sound_name', 'The sound')
+        if not saving.done():
+            return f"'{sound_name}' is still downloading - try binding it again in a moment."
+        if not saving.result():
+            return f"'{sound_name}' played but its download failed, so it can't be bound. Try playing it again."
+        return None
+
     def songbird_bind_sound(self, args, projected_states) -> str:
         """Bind the last played sound to a command phrase - supports multiple sounds per phrase"""
         try:
@@ -865,69 +4605,57 @@ class SONGBIRD(PluginBase):
             if not self.current_playing:
                 return "SONGBIRD: No sound has been played yet to bind. Play a sound first, then bind it."
             
+            unsaved = self.get_unsaved_playing_reason()
+            if unsaved:
+                return f"SONGBIRD: {unsaved}"
+            
             sound_name = self.current_playing.get('sound_name')
             filepath = self.current_playing.get('filepath')
             
             if not sound_name or not filepath:
                 return "SONGBIRD: Current sound information incomplete. Try playing a sound again."
+            filepath = self.resolve_sound_path(filepath)  # It may have been folded into a stored copy since
             
             if not os.path.exists(filepath):
                 return f"SONGBIRD: Sound file not found. Try playing the sound again."
             
-            # Load existing bound sounds
-            bound_sounds = self.load_bound_sounds()
+            # The catalog knows who made the sound even when it was played from the local cache
+            metadata = self.get_sound_metadata(filepath)
+            username = self.current_playing.get('username', 'Unknown')
+            if username == 'Local Cache' and metadata is not None and metadata['username']:
+                username = metadata['username']
             
-            # Check if phrase already exists
-            if normalized_phrase in bound_sounds:
-                # Phrase exists - check if it's a list or single sound
-                existing_binding = bound_sounds[normalized_phrase]
-                
-                # Convert old single-sound format to list format
-                if not isinstance(existing_binding, list):
-                    bound_sounds[normalized_phrase] = [existing_binding]
-                
-                # Add new sound to the list
-                new_sound_entry = {
-                    'sound_name': sound_name,
-                    'filepath': filepath,
-                    'description_used': self.current_playing.get('description_used', ''),
-                    'username': self.current_playing.get('username', 'Unknown')
-                }
-                
-                # Check if this exact sound is already in the list
-                already_exists = False
-                for sound_entry in bound_sounds[normalized_phrase]:
-                    if sound_entry['filepath'] == filepath:
-                        already_exists = True
-                        break
-                
-                if already_exists:
-                    return f"SONGBIRD: '{sound_name}' is already bound to phrase '{bind_phrase}'"
-                
-                bound_sounds[normalized_phrase].append(new_sound_entry)
-                
-                # Save bound sounds
-                if self.save_bound_sounds(bound_sounds):
-                    count = len(bound_sounds[normalized_phrase])
-                    log('info', f"SONGBIRD: Added '{sound_name}' to phrase '{normalized_phrase}' (now {count} sounds)")
-                    return f"SONGBIRD: Added '{sound_name}' to phrase '{bind_phrase}' (now {count} sounds total)"
-                else:
-                    return "SONGBIRD: Error saving bound sound"
-            else:
-                # New phrase - create as a list with one sound
-                bound_sounds[normalized_phrase] = [{
-                    'sound_name': sound_name,
-                    'filepath': filepath,
-                    'description_used': self.current_playing.get('description_used', ''),
-                    'username': self.current_playing.get('username', 'Unknown')
-                }]
+            new_sound_entry = {
+                'sound_name': sound_name,
+                'filepath': filepath,
+                'content_id': (metadata['content_id'] if metadata is not None else None) or self.get_content_id(filepath),
+                'description_used': self.current_playing.get('description_used', ''),
+                'username': username
+            }
+            
+            with self._bound_lock:
+                existing_sounds = self.get_bound_sound_list(normalized_phrase)
                 
-                # Save bound sounds
-                if self.save_bound_sounds(bound_sounds):
-                    log('info', f"SONGBIRD: Bound '{sound_name}' to phrase '{normalized_phrase}'")
-                    return f"SONGBIRD: Bound '{sound_name}' to phrase '{bind_phrase}'"
+                # Check if phrase already exists
+                if existing_sounds:
+                    # Check if this exact sound is already in the list
+                    if any(self.is_same_bound_sound(sound_entry, new_sound_entry) for sound_entry in existing_sounds):
+                        return f"SONGBIRD: '{sound_name}' is already bound to phrase '{bind_phrase}'"
+                    
+                    # Add new sound to the list
+                    if self.set_bound_phrase(normalized_phrase, existing_sounds + [new_sound_entry]):
+                        count = len(existing_sounds) + 1
+                        log('info', f"SONGBIRD: Added '{sound_name}' to phrase '{normalized_phrase}' (now {count} sounds)")
+                        return f"SONGBIRD: Added '{sound_name}' to phrase '{bind_phrase}' (now {count} sounds total)"
+                    else:
+                        return "SONGBIRD: Error saving bound sound"
                 else:
-                    return "SONGBIRD: Error saving bound sound"
+                    # New phrase - create as a list with one sound
+                    if self.set_bound_phrase(normalized_phrase, [new_sound_entry]):
+                        log('info', f"SONGBIRD: Bound '{sound_name}' to phrase '{normalized_phrase}'")
+                        return f"SONGBIRD: Bound '{sound_name}' to phrase '{bind_phrase}'"
+                    else:
+                        return "SONGBIRD: Error saving bound sound"
             
         except Exception as e:
             log('error', f"SONGBIRD bind error: {str(e)}")
@@ -960,24 +4688,17 @@ class SONGBIRD(PluginBase):
             found_sounds = []
             not_found = []
             
+            self.update_sound_index()
+            
             for sound_name in sound_names:
-                # Try to find this sound
-                found = False
-                search_normalized = sound_name.lower().replace('-', ' ').replace('_', ' ')
-                search_words = set(search_normalized.split())
+                # Match if: exact match OR all search words are present in sound name
+                search_normalized = self.normalize_sound_name(sound_name)
+                sound, _ = self.match_indexed_sound(search_normalized, ('exact', 'words'))
                 
-                for sound in all_sounds:
-                    sound_normalized = sound['readable_name'].lower().replace('-', ' ').replace('_', ' ')
-                    sound_words = set(sound_normalized.split())
-                    
-                    # Check for match using word-based matching (more accurate)
-                    # Match if: exact match OR all search words are present in sound name
-                    if (search_normalized == sound_normalized or 
-                        search_words.issubset(sound_words)):
-                        found_sounds.append(sound)
-                        found = True
-                        log('info', f"SONGBIRD: Found match for '{sound_name}': {sound['readable_name']}")
-                        break
+                found = sound is not None
+                if found:
+                    found_sounds.append(sound)
+                    log('info', f"SONGBIRD: Found match for '{sound_name}': {sound['readable_name']}")
                 
                 if not found:
                     not_found.append(sound_name)
@@ -986,55 +4707,43 @@ class SONGBIRD(PluginBase):
             if len(found_sounds) == 0:
                 return f"SONGBIRD: None of the specified sounds were found in cache. Not found: {', '.join(not_found)}"
             
-            # Load existing bound sounds
-            bound_sounds = self.load_bound_sounds()
-            
-            # Initialize or convert existing binding to list format
-            if normalized_phrase in bound_sounds:
-                existing = bound_sounds[normalized_phrase]
-                if not isinstance(existing, list):
-                    bound_sounds[normalized_phrase] = [existing]
-            else:
-                bound_sounds[normalized_phrase] = []
-            
-            # Add all found sounds
-            added_count = 0
-            skipped_count = 0
-            
-            for sound in found_sounds:
-                # Check if already in the list
-                already_exists = False
-                for existing_sound in bound_sounds[normalized_phrase]:
-                    if existing_sound['filepath'] == sound['filepath']:
-                        already_exists = True
-                        break
+            with self._bound_lock:
+                phrase_sounds = list(self.get_bound_sound_list(normalized_phrase) or [])
+                
+                # Add all found sounds
+                added_count = 0
+                skipped_count = 0
                 
-                if not already_exists:
-                    bound_sounds[normalized_phrase].append({
+                for sound in found_sounds:
+                    entry = {
                         'sound_name': sound['readable_name'],
                         'filepath': sound['filepath'],
+                        'content_id': self.get_content_id(sound['filepath']),
                         'description_used': '',
-                        'username': 'Local Cache'
-                    })
-                    added_count += 1
-                else:
-                    skipped_count += 1
-            
-            # Save bound sounds
-            if self.save_bound_sounds(bound_sounds):
-                total = len(bound_sounds[normalized_phrase])
-                result_parts = [f"SONGBIRD: Bound {added_count} sound(s) to phrase '{bind_phrase}' (total: {total})"]
-                
-                if skipped_count > 0:
-                    result_parts.append(f"Skipped {skipped_count} duplicate(s)")
-                
-                if len(not_found) > 0:
-                    result_parts.append(f"Not found: {', '.join(not_found)}")
+                        'username': sound.get('username') or 'Local Cache'
+                    }
+                    # Check if already in the list
+                    if not any(self.is_same_bound_sound(existing_sound, entry) for existing_sound in phrase_sounds):
+                        phrase_sounds.append(entry)
+                        added_count += 1
+                    else:
+                        skipped_count += 1
                 
-                log('info', f"SONGBIRD: Successfully bound {added_count} sounds to '{normalized_phrase}'")
-                return ". ".join(result_parts)
-            else:
-                return "SONGBIRD: Error saving bound sounds"
+                # Save bound sounds
+                if self.set_bound_phrase(normalized_phrase, phrase_sounds):
+                    total = len(phrase_sounds)
+                    result_parts = [f"SONGBIRD: Bound {added_count} sound(s) to phrase '{bind_phrase}' (total: {total})"]
+                    
+                    if skipped_count > 0:
+                        result_parts.append(f"Skipped {skipped_count} duplicate(s)")
+                    
+                    if len(not_found) > 0:
+                        result_parts.append(f"Not found: {', '.join(not_found)}")
+                    
+                    log('info', f"SONGBIRD: Successfully bound {added_count} sounds to '{normalized_phrase}'")
+                    return ". ".join(result_parts)
+                else:
+                    return "SONGBIRD: Error saving bound sounds"
             
         except Exception as e:
             log('error', f"SONGBIRD bind multiple error: {str(e)}")
@@ -1042,6 +4751,7 @@ class SONGBIRD(PluginBase):
 
     def songbird_replay_bound(self, args, projected_states) -> str:
         """Replay a sound bound to a specific phrase - randomly selects if multiple sounds"""
+        started = time.perf_counter()
         try:
             phrase = args.get('phrase', '').strip()
             
@@ -1051,40 +4761,48 @@ class SONGBIRD(PluginBase):
             if not normalized_phrase:
                 return "SONGBIRD: Please specify the bound phrase."
             
+            # The user's own words already played it
+            if self.take_recent_trigger(normalized_phrase):
+                self.count_metric('phrase_triggers.replays_absorbed')
+                return f"SONGBIRD: '{normalized_phrase}' already played the moment the user said it - no need to play it again"
+            
             log('info', f"SONGBIRD: Replay bound sound for phrase: '{phrase}' (normalized: '{normalized_phrase}')")
             
-            # Load bound sounds
-            bound_sounds = self.load_bound_sounds()
+            # Look up the phrase in the resident bindings
+            bound_data = self.get_bound_sound_list(normalized_phrase)
             
             # Check if phrase exists
-            if normalized_phrase not in bound_sounds:
+            if not bound_data:
                 return f"SONGBIRD: No sound bound to phrase '{phrase}'. Use 'list bound sounds' to see available phrases."
             
-            bound_data = bound_sounds[normalized_phrase]
-            
-            # Handle both old single-sound format and new list format
-            if isinstance(bound_data, list):
-                # Multiple sounds - randomly select one
-                selected = random.choice(bound_data)
-                filepath = selected['filepath']
-                sound_name = selected['sound_name']
+            # Randomly select one (old single-sound entries were upgraded to lists on load)
+            selected = random.choice(bound_data)
+            filepath = self.resolve_bound_filepath(selected)
+            sound_name = selected['sound_name']
+            if len(bound_data) > 1:
                 log('info', f"SONGBIRD: Randomly selected '{sound_name}' from {len(bound_data)} sounds for phrase '{normalized_phrase}'")
-            else:
-                # Old format - single sound (backwards compatibility)
-                filepath = bound_data['filepath']
-                sound_name = bound_data['sound_name']
             
             # Check if file still exists
             if not os.path.exists(filepath):
                 return f"SONGBIRD: Bound sound file not found: {sound_name}"
             
-            # Play the bound sound
+            verdict = self.admit_trigger(f"phrase:{normalized_phrase}", filepath)
+            if verdict == TriggerScheduler.COALESCED:
+                return f"SONGBIRD: '{normalized_phrase}' is already playing"
+            if verdict == TriggerScheduler.DEBOUNCED:
+                return f"SONGBIRD: '{normalized_phrase}' just played - skipped the repeat"
+            if verdict != TriggerScheduler.PLAY:
+                return f"SONGBIRD: Too many triggered sounds at once - skipped '{normalized_phrase}'"
+            
+            # Play the bound sound (from RAM once it has been decoded)
             try:
-                pygame.mixer.music.load(filepath)
-                pygame.mixer.music.play()
+                handle = self.play_sound_file(filepath, sound_name).result(self.AUDIO_COMMAND_TIMEOUT)
+                if handle is None:
+                    return f"SONGBIRD: Stopped before '{sound_name}' started"
                 
-                log('info', f"SONGBIRD: Playing bound sound: {sound_name}")
-                return f"SONGBIRD: Playing bound sound '{sound_name}'"
+                self.record_timing('replay_bound', time.perf_counter() - started)
+                log('info', f"SONGBIRD: Playing bound sound: {sound_name} (handle {handle})")
+                return f"SONGBIRD: Playing bound sound '{sound_name}' (handle {handle})"
                 
             except Exception as play_error:
                 log('error', f"SONGBIRD: Error playing bound sound: {str(play_error)}")
@@ -1100,27 +4818,28 @@ class SONGBIRD(PluginBase):
             log('info', 'SONGBIRD: Listing bound sounds')
             
             bound_sounds = self.load_bound_sounds()
+            event_bindings = self.load_event_bindings()
             
-            if not bound_sounds:
+            if not bound_sounds and not event_bindings:
                 return "SONGBIRD: No sounds bound to phrases yet. Use 'bind this to [phrase]' to create bindings."
             
             bound_list = []
             for phrase, data in bound_sounds.items():
-                # Handle both list format (new) and single sound format (old)
-                if isinstance(data, list):
-                    sound_count = len(data)
-                    if sound_count == 1:
-                        sound_name = data[0]['sound_name']
-                        bound_list.append(f"- '{phrase}' -> {sound_name}")
-                    else:
-                        sound_names = [s['sound_name'] for s in data]
-                        bound_list.append(f"- '{phrase}' -> {sound_count} sounds: {', '.join(sound_names)}")
-                else:
-                    # Old format - single sound
-                    sound_name = data['sound_name']
+                sound_count = len(data)
+                if sound_count == 1:
+                    sound_name = data[0]['sound_name']
                     bound_list.append(f"- '{phrase}' -> {sound_name}")
+                else:
+                    sound_names = [s['sound_name'] for s in data]
+                    bound_list.append(f"- '{phrase}' -> {sound_count} sounds: {', '.join(sound_names)}")
             
             result = f"SONGBIRD: Found {len(bound_sounds)} bound phrases:\n" + "\n".join(bound_list)
+            if event_bindings:
+                event_list = [f"- {self._describe_event_binding(binding['event'], binding.get('where', {}))} -> "
+                              f"{', '.join(sound['sound_name'] for sound in binding['sounds'])}"
+                              for binding in event_bindings]
+                result = (result + "\n" if bound_list else "SONGBIRD: ") + \
+                    f"Found {len(event_bindings)} game event bindings:\n" + "\n".join(event_list)
             
             log('info', f'SONGBIRD: Listed {len(bound_sounds)} bound phrases')
             return result
@@ -1142,33 +4861,22 @@ class SONGBIRD(PluginBase):
             
             log('info', f"SONGBIRD: Unbind request for phrase: '{phrase}' (normalized: '{normalized_phrase}')")
             
-            # Load bound sounds
-            bound_sounds = self.load_bound_sounds()
-            
-            # Check if phrase exists
-            if normalized_phrase not in bound_sounds:
-                return f"SONGBIRD: No sound bound to phrase '{phrase}'."
-            
-            bound_data = bound_sounds[normalized_phrase]
-            
-            # Handle both formats
-            if isinstance(bound_data, list):
+            with self._bound_lock:
+                bound_data = self.get_bound_sound_list(normalized_phrase)
+                
+                # Check if phrase exists
+                if not bound_data:
+                    return f"SONGBIRD: No sound bound to phrase '{phrase}'."
+                
                 sound_count = len(bound_data)
-                sound_names = [s['sound_name'] for s in bound_data]
-                sounds_text = ', '.join(sound_names)
-            else:
-                sound_count = 1
-                sounds_text = bound_data['sound_name']
-            
-            # Remove the entire phrase binding
-            del bound_sounds[normalized_phrase]
-            
-            # Save updated bindings
-            if self.save_bound_sounds(bound_sounds):
-                log('info', f"SONGBIRD: Unbound phrase '{normalized_phrase}' ({sound_count} sound(s))")
-                return f"SONGBIRD: Unbound phrase '{phrase}' ({sound_count} sound(s): {sounds_text})"
-            else:
-                return "SONGBIRD: Error saving updated bindings"
+                sounds_text = ', '.join(s['sound_name'] for s in bound_data)
+                
+                # Remove the entire phrase binding
+                if self.remove_bound_phrase(normalized_phrase):
+                    log('info', f"SONGBIRD: Unbound phrase '{normalized_phrase}' ({sound_count} sound(s))")
+                    return f"SONGBIRD: Unbound phrase '{phrase}' ({sound_count} sound(s): {sounds_text})"
+                else:
+                    return "SONGBIRD: Error saving updated bindings"
             
         except Exception as e:
             log('error', f"SONGBIRD unbind error: {str(e)}")
@@ -1179,15 +4887,17 @@ class SONGBIRD(PluginBase):
         try:
             log('info', 'SONGBIRD: Unbind all request')
             
-            # Load current bindings to count them
-            bound_sounds = self.load_bound_sounds()
-            count = len(bound_sounds)
-            
-            if count == 0:
-                return "SONGBIRD: No sound bindings to remove."
+            with self._bound_lock:
+                # Count current bindings
+                count = len(self._ensure_bound_sounds())
+                
+                if count == 0:
+                    return "SONGBIRD: No sound bindings to remove."
+                
+                # Clear all bindings
+                cleared = self.clear_bound_sounds()
             
-            # Clear all bindings
-            if self.save_bound_sounds({}):
+            if cleared:
                 log('info', f'SONGBIRD: Removed all {count} sound bindings')
                 return f"SONGBIRD: Removed all {count} sound bindings"
             else:
@@ -1197,25 +4907,155 @@ class SONGBIRD(PluginBase):
             log('error', f"SONGBIRD unbind all error: {str(e)}")
             return f"SONGBIRD: Unbind all error - {str(e)}"
 
+    def _describe_event_binding(self, event_name: str, where: dict) -> str:
+        """'Docked' or 'Docked where StationType = coriolis'"""
+        if not where:
+            return event_name
+        return f"{event_name} where " + ", ".join(f"{key} = {value}" for key, value in sorted(where.items()))
+
+    def songbird_bind_event(self, args, projected_states) -> str:
+        """Bind the last played (or a named cached) sound to a game event, optionally filtered by event fields"""
+        try:
+            event_name = ''.join(str(args.get('event', '')).split())
+            if not event_name:
+                return "SONGBIRD: Please specify the game event to bind the sound to."
+            where = {str(key).strip(): self._event_field_value(value)
+                     for key, value in (args.get('where') or {}).items() if str(key).strip()}
+            sound_name = (args.get('sound_name') or '').strip()
+            
+            if sound_name:
+                self.get_local_sounds()
+                self.update_sound_index()
+                sound, _ = self.match_indexed_sound(self.normalize_sound_name(sound_name), ('exact', 'words'))
+                if sound is None:
+                    return f"SONGBIRD: No cached sound matches '{sound_name}'. Use 'list cached sounds' to see what's available."
+                new_sound_entry = {
+                    'sound_name': sound['readable_name'],
+                    'filepath': sound['filepath'],
+                    'content_id': self.get_content_id(sound['filepath']),
+                    'description_used': '',
+                    'username': sound.get('username') or 'Local Cache'
+                }
+            else:
+                unsaved = self.get_unsaved_playing_reason()
+                if unsaved:
+                    return f"SONGBIRD: {unsaved}"
+                if not self.current_playing or not self.current_playing.get('filepath'):
+                    return "SONGBIRD: No sound has been played yet to bind. Play a sound first, or name a cached sound."
+                filepath = self.resolve_sound_path(self.current_playing['filepath'])
+                if not os.path.exists(filepath):
+                    return "SONGBIRD: Sound file not found. Try playing the sound again."
+                metadata = self.get_sound_metadata(filepath)
+                new_sound_entry = {
+                    'sound_name': self.current_playing.get('sound_name') or os.path.basename(filepath),
+                    'filepath': filepath,
+                    'content_id': (metadata['content_id'] if metadata is not None else None) or self.get_content_id(filepath),
+                    'description_used': self.current_playing.get('description_used', ''),
+                    'username': self.current_playing.get('username', 'Unknown')
+                }
+            
+            described = self._describe_event_binding(event_name, where)
+            with self._event_bindings_lock:
+                bindings = self.load_event_bindings()
+                binding = next((b for b in bindings if b['event'].lower() == event_name.lower() and b.get('where', {}) == where), None)
+                if binding is None:
+                    binding = {'event': event_name, 'where': where, 'sounds': []}
+                    bindings.append(binding)
+                if args.get('cooldown_seconds') is not None:
+                    binding['cooldown_seconds'] = max(0.0, float(args['cooldown_seconds']))
+                
+                if any(self.is_same_bound_sound(existing, new_sound_entry) for existing in binding['sounds']):
+                    return f"SONGBIRD: '{new_sound_entry['sound_name']}' is already bound to {described}"
+                binding['sounds'].append(new_sound_entry)
+                
+                if not self.save_event_bindings(bindings):
+                    return "SONGBIRD: Error saving event bindings"
+            
+            self.prewarm_bound_sounds([new_sound_entry])
+            count = len(binding['sounds'])
+            log('info', f"SONGBIRD: Bound '{new_sound_entry['sound_name']}' to game event {described}")
+            if count > 1:
+                return f"SONGBIRD: Added '{new_sound_entry['sound_name']}' to {described} (now {count} sounds, one plays at random)"
+            return f"SONGBIRD: '{new_sound_entry['sound_name']}' will play on {described}"
+            
+        except Exception as e:
+            log('error', f"SONGBIRD bind event error: {str(e)}")
+            return f"SONGBIRD: Bind event error - {str(e)}"
+
+    def songbird_unbind_event(self, args, projected_states) -> str:
+        """Remove the bindings for a game event, or just the one with the given conditions"""
+        try:
+            event_name = ''.join(str(args.get('event', '')).split())
+            if not event_name:
+                return "SONGBIRD: Please specify the game event to unbind."
+            where = args.get('where')
+            if where is not None:
+                where = {str(key).strip(): self._event_field_value(value) for key, value in where.items() if str(key).strip()}
+            
+            with self._event_bindings_lock:
+                bindings = self.load_event_bindings()
+                kept = [b for b in bindings if b['event'].lower() != event_name.lower()
+                        or (where is not None and b.get('where', {}) != where)]
+                removed = len(bindings) - len(kept)
+                if removed == 0:
+                    return f"SONGBIRD: No sound bound to {self._describe_event_binding(event_name, where or {})}"
+                if not self.save_event_bindings(kept):
+                    return "SONGBIRD: Error saving event bindings"
+            
+            log('info', f"SONGBIRD: Removed {removed} binding(s) for game event {event_name}")
+            return f"SONGBIRD: Removed {removed} sound binding(s) for {self._describe_event_binding(event_name, where or {})}"
+            
+        except Exception as e:
+            log('error', f"SONGBIRD unbind event error: {str(e)}")
+            return f"SONGBIRD: Unbind event error - {str(e)}"
+
     def songbird_list_cached(self, args, projected_states) -> str:
         """List all locally cached sound files - NEW METHOD"""
         try:
             log('info', 'SONGBIRD: Listing cached sounds')
             
-            sound_files = self.get_local_sounds()
-            
-            if not sound_files:
+            # Catalogues any files dropped in since the last look
+            present = {sound['filename'] for sound in self.get_local_sounds()}
+            # Prefetched sounds stay hidden until they've actually been played
+            prefetched = self.get_prefetched_filenames()
+            
+            with self._catalog_lock:
+                cursor = self._catalog_db().cursor()
+                # Plain tuples - this can be every row in the catalog
+                cursor.row_factory = None
+                rows = cursor.execute(
+                    "SELECT filename, readable_name, username, tags, duration, plays FROM sounds "
+                    "ORDER BY plays DESC, readable_name COLLATE NOCASE"
+                ).fetchall()
+            rows = [row for row in rows if row[0] in present and row[0] not in prefetched]
+            
+            if not rows:
                 plugin_folder = self.get_plugin_folder_path()
                 sounds_folder = os.path.join(plugin_folder, 'sounds')
                 return f"SONGBIRD: No sounds cached yet. Sounds folder: {sounds_folder}"
             
-            cached_list = []
-            for sound in sound_files:
-                cached_list.append(f"- '{sound['readable_name']}' ({sound['filename']})")
-            
-            result = f"SONGBIRD: Found {len(sound_files)} cached sounds:\n" + "\n".join(cached_list)
+            other_names = {}
+            for alias, target in self.get_sound_aliases().items():
+                other_names.setdefault(target, []).append(alias)
             
-            log('info', f'SONGBIRD: Listed {len(sound_files)} cached sounds')
+            cached_list = []
+            for filename, readable_name, username, tags, duration, plays in rows:
+                details = [filename]
+                if duration:
+                    details.append(f"{duration:.1f} s")
+                if username:
+                    details.append(f"by {username}")
+                if plays:
+                    details.append(f"played {plays}x")
+                if tags:
+                    details.append(f"tags: {', '.join(tags.split()[:5])}")
+                if filename in other_names:
+                    details.append(f"also named {', '.join(other_names[filename])}")
+                cached_list.append(f"- '{readable_name}' ({'; '.join(details)})")
+            
+            result = f"SONGBIRD: Found {len(rows)} cached sounds:\n" + "\n".join(cached_list)
+            
+            log('info', f'SONGBIRD: Listed {len(rows)} cached sounds')
             return result
             
         except Exception as e:
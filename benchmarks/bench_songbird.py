@@ -0,0 +1,569 @@
+"""Offline benchmarks for the Songbird plugin.
+
+Runs the plugin outside COVAS NEXT against synthetic sound libraries and a local
+stand-in for the Freesound API, then prints latency percentiles as JSON so runs
+can be compared:
+
+    python benchmarks/bench_songbird.py
+    python benchmarks/bench_songbird.py --sizes 100,10000 --iterations 500 --latency-ms 80 --output bench_output.txt
+
+Time to first sound for a new Freesound request is measured twice: with the result
+pages fetched concurrently, as the plugin does, and one after another with all pages
+awaited before a sound is picked, as the plugin did before.
+
+Local name matching is also scored for accuracy: how often exact names and one-typo
+names find the right sound, and how often made-up names are rejected, at the plugin's
+MATCH_CONFIDENCE and at neighbouring thresholds, so the threshold can be re-checked.
+
+Plugin start-up (module import and construction) is timed in fresh interpreters run
+with -X importtime, which also shows which heavy dependencies loading the plugin pulls in.
+
+Needs pygame and requests (numpy is optional, as for the plugin). Audio goes to
+SDL's dummy driver, so nothing is heard.
+"""
+import argparse
+import concurrent.futures
+import hashlib
+import http.server
+import importlib.util
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+import typing
+import urllib.parse
+import wave
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dependencies whose import time is reported for plugin start-up
+STARTUP_MODULES = ('pygame', 'requests', 'numpy')
+
+WORDS = (
+    "explosion laser blaster engine thruster alarm warning beep chime door hatch airlock scream laugh "
+    "applause crowd rain thunder wind ocean wave bird dog cat horse siren horn whistle bell gong drum "
+    "guitar piano synth bass kick snare cymbal click pop crash smash glass metal wood impact punch slap "
+    "footstep jump landing shield shot gun rifle pistol cannon missile rocket torpedo hyperspace warp "
+    "boost power down up startup shutdown computer robot voice radio static glitch error success fail "
+    "coin pickup level victory defeat heartbeat breath whisper growl roar hiss buzz hum drone ambience "
+    "cave forest city traffic market station docking undocking gear cargo scoop fuel"
+).split()
+
+
+def install_lib_stubs(verbose: bool):
+    """Register minimal stand-ins for the COVAS NEXT modules Songbird imports"""
+    if not hasattr(typing, 'override'):
+        typing.override = lambda method: method
+
+    class Stub:
+        """Accepts any constructor arguments (settings definitions, events)"""
+        def __init__(self, *args, **kwargs):
+            self.args = args
+            self.__dict__.update(kwargs)
+
+    def stub_module(name, **attributes):
+        module = types.ModuleType(name)
+        module.__dict__.update(attributes)
+        # Anything else the plugin imports from it is a generic stub class
+        module.__getattr__ = lambda attribute: type(attribute, (Stub,), {})
+        sys.modules[name] = module
+        return module
+
+    class PluginManifest(Stub):
+        pass
+
+    class PluginHelper:
+        def __init__(self):
+            self.actions = {}
+
+        def register_action(self, name, description, parameters, method, action_type='global', *args, **kwargs):
+            self.actions[name] = method
+
+        def get_plugin_setting(self, *key_path):
+            return None
+
+        def __getattr__(self, name):
+            # register_status_generator, register_sideeffect, ... are accepted and ignored
+            if name.startswith('register_'):
+                return lambda *args, **kwargs: None
+            raise AttributeError(name)
+
+    class PluginBase:
+        def __init__(self, plugin_manifest, *args, **kwargs):
+            self.plugin_manifest = plugin_manifest
+
+    def log(level, message, *args, **kwargs):
+        if verbose or level == 'error':
+            print(f"[{level}] {message}", file=sys.stderr)
+
+    stub_module('lib')
+    stub_module('lib.PluginHelper', PluginHelper=PluginHelper, PluginManifest=PluginManifest)
+    stub_module('lib.PluginSettingDefinitions')
+    stub_module('lib.Logger', log=log)
+    stub_module('lib.EventManager')
+    stub_module('lib.PluginBase', PluginBase=PluginBase)
+    stub_module('lib.Event')
+    return PluginHelper, PluginManifest
+
+
+def make_wav(seed: int) -> bytes:
+    """A 10 ms 16-bit mono WAV whose samples depend on seed, so no two files have the same content"""
+    path = tempfile.mktemp(suffix='.wav')
+    rng = random.Random(seed)
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(22050)
+        wav.writeframes(bytes(rng.getrandbits(8) for _ in range(441)))
+    with open(path, 'rb') as f:
+        data = f.read()
+    os.remove(path)
+    return data
+
+
+def make_names(count: int, rng: random.Random) -> list:
+    """Unique readable sound names of 1-4 words, some with a number"""
+    names = []
+    seen = set()
+    while len(names) < count:
+        name = ' '.join(rng.choice(WORDS) for _ in range(rng.choice((1, 2, 2, 3, 3, 4))))
+        if rng.random() < 0.3 or name in seen:
+            name += f" {rng.randint(1, 99999)}"
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+
+def build_library(plugin_dir: str, size: int, rng: random.Random) -> tuple:
+    """Write size sound files and a bound_sounds.json with size phrases. Returns (names, phrases)"""
+    sounds_dir = os.path.join(plugin_dir, 'sounds')
+    os.makedirs(sounds_dir)
+    names = make_names(size, rng)
+    filepaths = []
+    for i, name in enumerate(names):
+        # Mostly Freesound-style downloads, plus some user-named files
+        filename = f"{name.replace(' ', '_')}_{100000 + i}.wav" if i % 4 else f"{name}.wav"
+        filepath = os.path.join(sounds_dir, filename)
+        with open(filepath, 'wb') as f:
+            f.write(make_wav(i))
+        filepaths.append((name, filepath))
+
+    bound_sounds = {}
+    for i in range(size):
+        phrase = f"trigger {i}"
+        bound_sounds[phrase] = [
+            {'sound_name': name, 'filepath': filepath, 'description_used': '', 'username': 'Local Cache'}
+            for name, filepath in rng.sample(filepaths, rng.randint(1, 3))
+        ]
+    with open(os.path.join(plugin_dir, 'bound_sounds.json'), 'w', encoding='utf-8') as f:
+        json.dump(bound_sounds, f)
+
+    with open(os.path.join(plugin_dir, 'api_key.txt'), 'w', encoding='utf-8') as f:
+        f.write(FreesoundStandIn.API_KEY)
+    return names, list(bound_sounds)
+
+
+class FreesoundStandIn(http.server.ThreadingHTTPServer):
+    """Local imitation of the Freesound text search and preview endpoints"""
+    API_KEY = 'bench-api-key'
+    RESULTS_PER_PAGE = 15
+    PAGES = 5
+    daemon_threads = True
+
+    def __init__(self, latency: float):
+        super().__init__(('127.0.0.1', 0), FreesoundStandInHandler)
+        self.latency = latency
+        self.base_url = f"http://127.0.0.1:{self.server_port}"
+        threading.Thread(target=self.serve_forever, name='freesound-stand-in', daemon=True).start()
+
+
+class FreesoundStandInHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        url = urllib.parse.urlsplit(self.path)
+
+        if url.path == '/apiv2/search/text/':
+            if self.headers.get('Authorization') != f"Token {FreesoundStandIn.API_KEY}":
+                return self.respond(401, b'{"detail": "Invalid token"}', 'application/json')
+            params = urllib.parse.parse_qs(url.query)
+            query = params.get('query', [''])[0]
+            page = int(params.get('page', ['1'])[0])
+            if page > FreesoundStandIn.PAGES:
+                return self.respond(404, b'{"detail": "Invalid page."}', 'application/json')
+            results = []
+            for i in range(FreesoundStandIn.RESULTS_PER_PAGE):
+                sound_id = int(hashlib.sha1(f"{query}/{page}/{i}".encode()).hexdigest()[:8], 16)
+                results.append({
+                    'id': sound_id,
+                    'name': f"{query} {page}-{i}",
+                    'username': 'bench',
+                    # WAV data under the mp3 key: pygame detects the format from the content
+                    'previews': {'preview-hq-mp3': f"{self.server.base_url}/previews/{sound_id}.mp3"}
+                })
+            body = json.dumps({'count': FreesoundStandIn.RESULTS_PER_PAGE * FreesoundStandIn.PAGES, 'results': results})
+            return self.respond(200, body.encode(), 'application/json')
+
+        if url.path.startswith('/previews/'):
+            sound_id = int(os.path.splitext(os.path.basename(url.path))[0])
+            return self.respond(200, make_wav(sound_id), 'audio/mpeg')
+
+        self.respond(404, b'', 'text/plain')
+
+    def respond(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def import_plugin_module(plugin_dir: str):
+    """Import a copy of Songbird.py from plugin_dir (it keeps its files next to itself), with the
+    ingest worker module it runs transcodes from"""
+    shutil.copy(os.path.join(REPO_DIR, 'Songbird.py'), plugin_dir)
+    shutil.copy(os.path.join(REPO_DIR, 'songbird_ingest.py'), plugin_dir)
+    module_name = f"Songbird_bench_{os.path.basename(plugin_dir)}"
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(plugin_dir, 'Songbird.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_manifest(manifest_class):
+    with open(os.path.join(REPO_DIR, 'manifest.json'), encoding='utf-8') as f:
+        manifest = json.load(f)
+    return manifest_class(name=manifest['name'], version=manifest['version'])
+
+
+def load_plugin(plugin_dir: str, helper_class, manifest_class):
+    module = import_plugin_module(plugin_dir)
+    plugin = module.SONGBIRD(make_manifest(manifest_class))
+    helper = helper_class()
+    plugin.register_actions(helper)
+    return plugin, helper
+
+
+def percentiles(op: str, size: int, samples: list) -> dict:
+    """Nearest-rank p50/p95/p99 of samples (seconds) in milliseconds"""
+    ordered = sorted(samples)
+
+    def rank(p):
+        return round(ordered[min(len(ordered) - 1, max(0, int(len(ordered) * p / 100 + 0.5) - 1))] * 1000, 3)
+
+    return {
+        'op': op,
+        'size': size,
+        'count': len(ordered),
+        'p50_ms': rank(50),
+        'p95_ms': rank(95),
+        'p99_ms': rank(99),
+        'max_ms': round(ordered[-1] * 1000, 3)
+    }
+
+
+def timed(fn, *args) -> tuple:
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def typo(name: str, rng: random.Random) -> str:
+    """Swap two adjacent letters in one word"""
+    words = name.split()
+    i = rng.randrange(len(words))
+    word = words[i]
+    if len(word) > 3:
+        j = rng.randrange(len(word) - 1)
+        words[i] = word[:j] + word[j + 1] + word[j] + word[j + 2:]
+    return ' '.join(words)
+
+
+def wait_for_job(plugin, job_id: int, timeout: float = 60):
+    """Wait until a background play job has finished, returning its final status"""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        with plugin._play_jobs_lock:
+            job = plugin._play_jobs.get(job_id)
+            if job is None or job['finished'] is not None:
+                return job and job['status']
+        time.sleep(0.001)
+    return 'timeout'
+
+
+def startup_probe(verbose: bool):
+    """Child process: time importing Songbird.py and constructing the plugin, as JSON on stdout"""
+    _, manifest_class = install_lib_stubs(verbose)
+    plugin_dir = tempfile.mkdtemp(prefix='songbird-startup-')
+    try:
+        import_seconds, module = timed(import_plugin_module, plugin_dir)
+        construct_seconds, _ = timed(module.SONGBIRD, make_manifest(manifest_class))
+        print(json.dumps({'import': import_seconds, 'construct': construct_seconds}))
+    finally:
+        shutil.rmtree(plugin_dir, ignore_errors=True)
+
+
+def bench_startup(runs: int, verbose: bool) -> tuple:
+    """Plugin import and construction times from fresh interpreters, plus the median -X importtime
+    cumulative time (ms) of each heavy dependency, or None if loading the plugin didn't import it"""
+    samples = {'import': [], 'construct': []}
+    module_us = {name: [] for name in STARTUP_MODULES}
+    for _ in range(runs):
+        command = [sys.executable, '-X', 'importtime', os.path.abspath(__file__), '--startup-probe']
+        if verbose:
+            command.append('--verbose')
+        completed = subprocess.run(command, capture_output=True, text=True, check=True)
+        probe = json.loads(completed.stdout.strip().splitlines()[-1])
+        for phase in samples:
+            samples[phase].append(probe[phase])
+        # "import time: self [us] | cumulative | imported package"
+        for line in completed.stderr.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            fields = [field.strip() for field in line[len('import time:'):].split('|')]
+            if len(fields) == 3 and fields[2] in module_us and fields[1].isdigit():
+                module_us[fields[2]].append(int(fields[1]))
+
+    results = [percentiles(f'plugin_{phase}', 0, phase_samples) for phase, phase_samples in samples.items()]
+    imports_ms = {name: round(sorted(times)[len(times) // 2] / 1000, 1) if times else None
+                  for name, times in module_us.items()}
+    return results, imports_ms
+
+
+def bench_first_sound(plugin, size: int, iterations: int) -> list:
+    """Seconds from a Freesound play request until its voice starts on the mixer, with the result pages
+    fetched concurrently (the plugin as it is) and serially with every page awaited (the plugin before)"""
+    voice_starts = []
+    register_voice = plugin._register_voice
+
+    def recording_register_voice(*args, **kwargs):
+        voice_starts.append(time.perf_counter())
+        return register_voice(*args, **kwargs)
+
+    plugin._register_voice = recording_register_voice
+    get_varied_freesound_results = plugin.get_varied_freesound_results
+    concurrent_executor = plugin._search_executor
+    serial_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='songbird-search')
+    results = []
+    try:
+        for label in ('concurrent', 'serial'):
+            if label == 'serial':
+                plugin._search_executor = serial_executor
+                plugin.get_varied_freesound_results = lambda query, api_key, on_complete=None: get_varied_freesound_results(query, api_key)
+            samples = []
+            for i in range(iterations):
+                voice_starts.clear()
+                start = time.perf_counter()
+                reply = plugin.songbird_play_sound({'sound_description': f"first sound {label} {size} {i}", 'replay_mode': 'new'}, {})
+                job_id = int(reply.split('(request ')[1].split(')')[0])
+                status = wait_for_job(plugin, job_id)
+                if status != 'done' or not voice_starts:
+                    print(f"{label} play request {job_id} ended as {status} without starting a sound", file=sys.stderr)
+                    continue
+                samples.append(voice_starts[0] - start)
+            plugin.songbird_control({'voice_command': 'stop'}, {})
+            if samples:
+                results.append(percentiles(f'first_sound_{label}', size, samples))
+    finally:
+        plugin._register_voice = register_voice
+        plugin.get_varied_freesound_results = get_varied_freesound_results
+        plugin._search_executor = concurrent_executor
+        serial_executor.shutdown()
+    return results
+
+
+def bench_match_accuracy(plugin, names: list, size: int, iterations: int, rng: random.Random) -> dict:
+    """Exact, typo and reject rates of the local name matcher at MATCH_CONFIDENCE and nearby thresholds"""
+    def best(query):
+        ranked = plugin.rank_local_sounds(plugin.normalize_sound_name(plugin.convert_word_numbers_to_digits(query.lower())), 1)
+        return ranked[0] if ranked else (None, 0.0)
+
+    def is_right(sound, name):
+        return sound is not None and plugin.normalize_sound_name(sound['readable_name']) == plugin.normalize_sound_name(name)
+
+    exact = [(is_right(sound, name), score) for name in rng.sample(names, min(iterations, len(names))) for sound, score in [best(name)]]
+    typos = []
+    for name in rng.sample(names, min(iterations, len(names))):
+        sound, score = best(typo(name, rng))
+        typos.append((is_right(sound, name), score))
+    # Sounds that aren't in the library: made-up names, and half of them sharing a real word with it
+    nonsense = [best(f"{rng.choice(WORDS) if i % 2 else rng.choice(('zorblat', 'quix', 'vemmering', 'flibber'))} "
+                     f"{rng.choice(('honk', 'ploop', 'wub', 'sprock'))}")[1]
+                for i in range(iterations)]
+
+    def rates(threshold):
+        return {
+            'threshold': threshold,
+            'exact_hit_rate': round(sum(right and score >= threshold for right, score in exact) / len(exact), 4),
+            'typo_hit_rate': round(sum(right and score >= threshold for right, score in typos) / len(typos), 4),
+            'reject_rate': round(sum(score < threshold for score in nonsense) / len(nonsense), 4)
+        }
+
+    threshold = plugin.MATCH_CONFIDENCE
+    return {
+        'op': 'match_accuracy',
+        'size': size,
+        'count': len(exact) + len(typos) + len(nonsense),
+        **rates(threshold),
+        'sweep': [rates(round(threshold + step, 2)) for step in (-0.15, -0.1, -0.05, 0.05, 0.1)]
+    }
+
+
+def bench_size(size: int, args, helper_class, manifest_class, server) -> list:
+    rng = random.Random(args.seed + size)
+    plugin_dir = tempfile.mkdtemp(prefix=f'songbird-bench-{size}-')
+    results = []
+    try:
+        setup_seconds, (names, phrases) = timed(build_library, plugin_dir, size, rng)
+        results.append(percentiles('build_library', size, [setup_seconds]))
+
+        plugin, helper = load_plugin(plugin_dir, helper_class, manifest_class)
+        plugin.FREESOUND_SEARCH_URL = f"{server.base_url}/apiv2/search/text/"
+        plugin.FREESOUND_API_HOSTS = ('127.0.0.1',)
+        # Measure the request path only, without downloads ahead of time competing with it
+        plugin.PREFETCH_COUNT = 0
+        plugin.on_plugin_helper_ready(helper)
+        # Imports and mixer start-up run on a warm-up thread; don't time them as part of the first calls
+        plugin._warm_up_done.wait(30)
+
+        # Steady state: catalog listed, contents indexed, bindings migrated
+        results.append(percentiles('get_local_sounds_cold', size, [timed(plugin.get_local_sounds)[0]]))
+        results.append(percentiles('index_sound_folder_cold', size, [timed(plugin.index_sound_folder, size + 1)[0]]))
+        plugin.update_sound_index()
+
+        iterations = args.iterations
+
+        queries = []
+        for i in range(iterations):
+            name = rng.choice(names)
+            kind = i % 4
+            if kind < 2:
+                queries.append(name)
+            elif kind == 2:
+                queries.append(typo(name, rng))
+            else:
+                queries.append(f"{rng.choice(('zorblat', 'quix', 'vemmering'))} {rng.choice(('honk', 'ploop', 'wub'))}")
+        results.append(percentiles('find_local_sound', size, [timed(plugin.find_local_sound, query)[0] for query in queries]))
+        results.append(bench_match_accuracy(plugin, names, size, iterations, rng))
+
+        samples = []
+        for i in range(iterations):
+            sound_names = rng.sample(names, 3)
+            samples.append(timed(plugin.songbird_bind_multiple, {'sound_names': sound_names, 'bind_phrase': f"bench phrase {i}"}, {})[0])
+        results.append(percentiles('songbird_bind_multiple', size, samples))
+
+        # Time replays themselves: the trigger scheduler would otherwise turn all but the first few
+        # back-to-back calls into "skipped" answers
+        scheduler = plugin._trigger_scheduler
+        plugin._trigger_scheduler = type(scheduler)(0, 0, float('inf'), float('inf'), iterations + 1)
+        dropped = plugin._metrics_counters.get('triggers.dropped', 0)
+        samples = [timed(plugin.songbird_replay_bound, {'phrase': rng.choice(phrases)}, {})[0] for _ in range(iterations)]
+        plugin.songbird_control({'voice_command': 'stop'}, {})
+        plugin._trigger_scheduler = scheduler
+        if plugin._metrics_counters.get('triggers.dropped', 0) != dropped:
+            print("songbird_replay_bound: some replays were still dropped by the trigger scheduler", file=sys.stderr)
+        results.append(percentiles('songbird_replay_bound', size, samples))
+
+        list_iterations = max(5, iterations // 20)
+        samples = [timed(plugin.songbird_list_cached, {}, {})[0] for _ in range(list_iterations)]
+        results.append(percentiles('songbird_list_cached', size, samples))
+
+        acknowledged = []
+        completed = []
+        for i in range(args.play_iterations):
+            # A new description each time, so every request searches and downloads
+            start = time.perf_counter()
+            reply = plugin.songbird_play_sound({'sound_description': f"bench {size} {i}", 'replay_mode': 'new'}, {})
+            acknowledged.append(time.perf_counter() - start)
+            job_id = int(reply.split('(request ')[1].split(')')[0])
+            status = wait_for_job(plugin, job_id)
+            completed.append(time.perf_counter() - start)
+            if status != 'done':
+                print(f"play request {job_id} ended as {status}", file=sys.stderr)
+        plugin.songbird_control({'voice_command': 'stop'}, {})
+        results.append(percentiles('songbird_play_sound_ack', size, acknowledged))
+        results.append(percentiles('songbird_play_sound_e2e', size, completed))
+
+        results.extend(bench_first_sound(plugin, size, args.play_iterations))
+
+        # Let transcodes and background maintenance finish before their folder goes away
+        plugin.schedule_cache_maintenance = lambda: None
+        if plugin._ingest_executor is not None:
+            plugin._ingest_executor.shutdown(wait=True)
+        while True:
+            plugin._maintenance_executor.submit(lambda: None).result()
+            if not plugin._maintenance_pending:
+                break
+        return results
+    finally:
+        shutil.rmtree(plugin_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', default='100,10000,100000', help="Comma-separated library sizes")
+    parser.add_argument('--iterations', type=int, default=200, help="Timed calls per operation")
+    parser.add_argument('--play-iterations', type=int, default=20, help="Timed Freesound play requests per size")
+    parser.add_argument('--latency-ms', type=float, default=50, help="Delay the Freesound stand-in adds to every response")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help="Also write the JSON report to this file")
+    parser.add_argument('--startup-runs', type=int, default=5, help="Fresh interpreters used to time plugin start-up (0 to skip)")
+    parser.add_argument('--verbose', action='store_true', help="Show the plugin's log output")
+    parser.add_argument('--startup-probe', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    if args.startup_probe:
+        startup_probe(args.verbose)
+        return
+    helper_class, manifest_class = install_lib_stubs(args.verbose)
+    server = FreesoundStandIn(args.latency_ms / 1000)
+
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': numpy_version,
+            'latency_ms': args.latency_ms,
+            'iterations': args.iterations,
+            'play_iterations': args.play_iterations,
+            'seed': args.seed
+        },
+        'results': []
+    }
+    if args.startup_runs > 0:
+        print("Benchmarking start-up...", file=sys.stderr)
+        startup_results, report['meta']['startup_imports_ms'] = bench_startup(args.startup_runs, args.verbose)
+        report['results'].extend(startup_results)
+    for size in (int(size) for size in args.sizes.split(',')):
+        print(f"Benchmarking {size} sounds...", file=sys.stderr)
+        report['results'].extend(bench_size(size, args, helper_class, manifest_class, server))
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Ingest worker for the Songbird plugin: validates a downloaded or dropped-in sound and writes
+a 16-bit PCM WAV copy of it in the mixer's output format, which plays without any decoding.
+
+Songbird runs this in worker processes (see SONGBIRD.schedule_transcode), so it only imports
+what it needs and never touches COVAS NEXT modules. There it opens its own mixer on SDL's dummy
+driver; in-process it reuses the plugin's mixer, which is already in the target format.
+"""
+import os
+import wave
+
+# (sample rate, channels) this worker process's own mixer was opened with
+_worker_mixer_format = None
+
+
+def sniff_container(filepath: str):
+    """'mp3', 'ogg' or 'wav' from a file's first bytes, whatever its extension says, or None"""
+    with open(filepath, 'rb') as f:
+        head = f.read(12)
+    if head[:4] == b'OggS':
+        return 'ogg'
+    if head[:4] == b'RIFF' and head[8:12] == b'WAVE':
+        return 'wav'
+    if head[:3] == b'ID3' or (len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0):
+        return 'mp3'
+    return None
+
+
+def transcode_sound_file(source: str, target: str, sample_rate: int, channels: int, own_mixer: bool = True) -> dict:
+    """Decode source and atomically write it to target as PCM WAV at sample_rate and channels.
+    Returns {'duration', 'container'}; raises ValueError for a file that isn't audio or doesn't decode"""
+    global _worker_mixer_format
+    container = sniff_container(source)
+    if container is None:
+        raise ValueError("not an MP3, OGG or WAV file")
+
+    if own_mixer:
+        # Never plays anything, so no audio device is needed
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    import pygame
+    if own_mixer and _worker_mixer_format != (sample_rate, channels):
+        pygame.mixer.quit()
+        pygame.mixer.init(sample_rate, -16, channels)
+        _worker_mixer_format = (sample_rate, channels)
+
+    try:
+        sound = pygame.mixer.Sound(source)
+    except pygame.error as e:
+        raise ValueError(f"{container} data does not decode: {e}")
+    pcm = sound.get_raw()
+    if not pcm:
+        raise ValueError("no audio in file")
+
+    temp_path = target + '.tmp'
+    with wave.open(temp_path, 'wb') as out:
+        out.setnchannels(channels)
+        out.setsampwidth(2)
+        out.setframerate(sample_rate)
+        out.writeframes(pcm)
+    os.replace(temp_path, target)
+    return {'duration': len(pcm) / (2 * channels * sample_rate), 'container': container}